@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ヘッドレスベンチマーク
+
+画面を表示せずに各画面のフレーム時間とアセット読み込みの時間を計測する。
+
+使い方:
+    python -m benchmarks                              # 計測して benchmark_results.json に書き出す
+    python -m benchmarks --baseline baseline.json     # 基準の結果と比較して劣化を報告する
+"""
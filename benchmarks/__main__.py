@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ヘッドレスベンチマークの実行
+"""
+
+import os
+import sys
+import argparse
+
+# 画面と音声を出力せずに実行する（pygame を読み込む前に設定する）
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from utils.config import Config
+from utils.render_target import RenderTarget
+from utils.resource_loader import ResourceLoader
+from benchmarks.screen_bench import run_screen_benchmarks
+from benchmarks.asset_bench import run_asset_benchmarks
+from benchmarks.blit_bench import run_blit_benchmarks
+from benchmarks.report import save_results, load_results, compare_results, print_results, print_regressions
+
+def parse_args():
+    """
+    コマンドライン引数を解析する
+    
+    Returns:
+        argparse.Namespace: 引数
+    """
+    parser = argparse.ArgumentParser(description="画面とアセット読み込みのベンチマークを実行する")
+    parser.add_argument("--frames", type=int, default=120, help="画面ごとに計測するフレーム数")
+    parser.add_argument("--repeat", type=int, default=5, help="アセット読み込みと描画の計測の繰り返し回数")
+    parser.add_argument("--output", default="benchmark_results.json", help="結果を書き出すファイル")
+    parser.add_argument("--baseline", help="比較する基準の結果ファイル")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="劣化とみなす変化率（0.1 なら 10%%）")
+    parser.add_argument("--only", choices=("screens", "assets", "blits"), help="一部のベンチマークだけを実行する")
+    parser.add_argument("--render-scale", type=float, default=1.0, help="描画の倍率（内部解像度で描画した場合を計測する）")
+    return parser.parse_args()
+
+
+def main():
+    """
+    ベンチマークを実行する
+    
+    Returns:
+        int: 終了コード（基準から劣化していれば 1）
+    """
+    args = parse_args()
+    
+    pygame.init()
+    config = Config()
+    screen = RenderTarget.get_instance().create_display(
+        (config.get("screen_width", 800), config.get("screen_height", 600)),
+        args.render_scale
+    )
+    
+    results = {}
+    try:
+        if args.only in (None, "screens"):
+            results.update(run_screen_benchmarks(screen, args.frames))
+        if args.only in (None, "assets"):
+            results.update(run_asset_benchmarks(args.repeat))
+        if args.only in (None, "blits"):
+            results.update(run_blit_benchmarks(screen, args.repeat))
+    finally:
+        ResourceLoader.get_instance().shutdown()
+        pygame.quit()
+    
+    print_results(results)
+    save_results(results, args.output)
+    print(f"結果を書き出しました: {args.output}")
+    
+    if args.baseline:
+        regressions = compare_results(load_results(args.baseline), results, args.tolerance)
+        print_regressions(regressions)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
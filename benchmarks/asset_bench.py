@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+アセット読み込みのベンチマーク
+
+ResourceLoader の初回（キャッシュなし）と2回目以降（キャッシュあり）の読み込み時間と、
+ConfigLoader が設定ファイルを解析する時間を計測する。
+"""
+
+import os
+import json
+import time
+import pygame
+from utils.config_loader import ConfigLoader, CONFIG_CACHE_SUFFIX
+from utils.resource_loader import ResourceLoader
+
+def get_median(values):
+    """
+    中央値を取得する
+    
+    Args:
+        values (list): 値のリスト
+    
+    Returns:
+        float: 中央値
+    """
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def load_stage_images(resource_loader, config_loader, screen_size):
+    """
+    すべての環境と難易度について、ゲーム画面が使う画像を読み込む
+    
+    Args:
+        resource_loader (ResourceLoader): 計測するリソースローダー
+        config_loader (ConfigLoader): 設定ローダー
+        screen_size (tuple): 画面サイズ (width, height)
+    """
+    from game.card import CardGrid
+    from game.character import Character
+    
+    difficulties = config_loader.get_game_config().get("difficulty_levels", {})
+    for environment in config_loader.get_environments():
+        resource_loader.load_background_image(environment, screen_size)
+        for difficulty, difficulty_config in difficulties.items():
+            card_size = CardGrid.from_difficulty(difficulty_config, screen_size).card_size
+            characters = Character.get_stage_characters(environment, difficulty)
+            resource_loader.load_card_atlas(environment, characters, card_size)
+
+
+def measure_resource_loader(screen_size, repeat, use_baked=True):
+    """
+    画像の読み込み時間を計測する
+    
+    Args:
+        screen_size (tuple): 画面サイズ (width, height)
+        repeat (int): 計測の繰り返し回数
+        use_baked (bool): 事前ベイク済みの画像を使うかどうか
+    
+    Returns:
+        dict: 計測結果
+    """
+    config_loader = ConfigLoader.get_instance()
+    cold_times = []
+    warm_times = []
+    
+    for _ in range(repeat):
+        # キャッシュが空の新しいリソースローダーで読み込む
+        resource_loader = ResourceLoader()
+        if not use_baked:
+            resource_loader.baked_manifest = {}
+        
+        started_at = time.perf_counter()
+        load_stage_images(resource_loader, config_loader, screen_size)
+        cold_times.append((time.perf_counter() - started_at) * 1000)
+        
+        started_at = time.perf_counter()
+        load_stage_images(resource_loader, config_loader, screen_size)
+        warm_times.append((time.perf_counter() - started_at) * 1000)
+        
+        resource_loader.shutdown()
+    
+    return {
+        "cold_ms": round(get_median(cold_times), 3),
+        "warm_ms": round(get_median(warm_times), 3)
+    }
+
+
+def measure_config_loader(repeat):
+    """
+    設定ファイルの解析時間を計測する
+    
+    cold はキャッシュファイルがない状態（JSON の解析とキャッシュファイルの作成）、
+    warm はキャッシュファイルがある状態、json は比較用に JSON を解析するだけの時間。
+    
+    Args:
+        repeat (int): 計測の繰り返し回数
+    
+    Returns:
+        dict: 計測結果
+    """
+    data_path = ConfigLoader.get_instance().data_path
+    config_names = sorted(
+        os.path.splitext(name)[0] for name in os.listdir(data_path) if name.endswith(".json")
+    )
+    config_paths = [os.path.join(data_path, f"{config_name}.json") for config_name in config_names]
+    
+    def load_all():
+        # メモリ上のキャッシュが空の新しい設定ローダーで読み込む
+        config_loader = ConfigLoader()
+        started_at = time.perf_counter()
+        for config_name in config_names:
+            config_loader.load_config(config_name)
+        return (time.perf_counter() - started_at) * 1000
+    
+    cold_times = []
+    warm_times = []
+    json_times = []
+    for _ in range(repeat):
+        for config_path in config_paths:
+            if os.path.exists(config_path + CONFIG_CACHE_SUFFIX):
+                os.remove(config_path + CONFIG_CACHE_SUFFIX)
+        cold_times.append(load_all())
+        warm_times.append(load_all())
+        
+        started_at = time.perf_counter()
+        for config_path in config_paths:
+            with open(config_path, "r", encoding="utf-8") as f:
+                json.load(f)
+        json_times.append((time.perf_counter() - started_at) * 1000)
+    
+    return {
+        "parse_cold_ms": round(get_median(cold_times), 3),
+        "parse_warm_ms": round(get_median(warm_times), 3),
+        "parse_json_ms": round(get_median(json_times), 3)
+    }
+
+
+def run_asset_benchmarks(repeat):
+    """
+    アセット読み込みのベンチマークを実行する
+    
+    Args:
+        repeat (int): 計測の繰り返し回数
+    
+    Returns:
+        dict: ベンチマーク名をキーとする計測結果
+    """
+    screen_size = pygame.display.get_surface().get_size()
+    results = {}
+    
+    results["assets.resource_loader"] = measure_resource_loader(screen_size, repeat)
+    results["assets.resource_loader.unbaked"] = measure_resource_loader(screen_size, repeat, use_baked=False)
+    results["assets.config_loader"] = measure_config_loader(repeat)
+    
+    return results
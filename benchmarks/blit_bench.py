@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+描画（blit）のマイクロベンチマーク
+
+同じ画像を表示フォーマットの違い（アルファ値の有無・RLE・透明な余白の有無）で描画し、
+1回あたりの描画時間を比較する。
+"""
+
+import time
+from utils.render_target import scaled
+from utils.resource_loader import ResourceLoader
+from benchmarks.asset_bench import get_median
+
+# 1回の計測で描画する回数
+BLITS_PER_MEASURE = 200
+
+def measure_blits(screen, blits, repeat):
+    """
+    blit のリストを繰り返し描画し、1回あたりの描画時間を計測する
+    
+    Args:
+        screen (pygame.Surface): 描画先の画面
+        blits (list): (画像, 描画先の位置, 画像内の領域) のリスト
+        repeat (int): 計測の繰り返し回数
+    
+    Returns:
+        float: 1回の blit あたりの時間の中央値（マイクロ秒）
+    """
+    times = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(BLITS_PER_MEASURE):
+            screen.blits(blits, doreturn=False)
+        times.append((time.perf_counter() - started_at) * 1e6 / (BLITS_PER_MEASURE * len(blits)))
+    return round(get_median(times), 3)
+
+
+def run_blit_benchmarks(screen, repeat):
+    """
+    描画のマイクロベンチマークを実行する
+    
+    Args:
+        screen (pygame.Surface): 描画先の画面
+        repeat (int): 計測の繰り返し回数
+    
+    Returns:
+        dict: ベンチマーク名をキーとする計測結果
+    """
+    from game.card import CardGrid
+    from game.character import Character
+    from utils.config_loader import ConfigLoader
+    
+    resource_loader = ResourceLoader.get_instance()
+    screen_size = screen.get_size()
+    results = {}
+    
+    # 全画面の背景: 不透明な形式（convert）とアルファ値付きの形式（convert_alpha）
+    background = resource_loader.load_background_image("jungle", screen_size)
+    results["blit.background"] = {
+        "opaque_us": measure_blits(screen, [(background, (0, 0), None)], repeat),
+        "alpha_us": measure_blits(screen, [(background.convert_alpha(), (0, 0), None)], repeat)
+    }
+    
+    # メニューのキャラクター: RLE あり（読み込んだまま）と RLE なし（RLEACCEL を付けずに set_alpha したコピー）
+    character = resource_loader.load_character_image("lion", "jungle", scaled((80, 80)))
+    plain_character = character.copy()
+    plain_character.set_alpha(255)
+    results["blit.character"] = {
+        "rle_us": measure_blits(screen, [(character, (100, 100), None)], repeat),
+        "alpha_us": measure_blits(screen, [(plain_character, (100, 100), None)], repeat)
+    }
+    
+    # カードの表面: 透明な余白を除いた領域とカード全体の領域
+    difficulty_config = ConfigLoader.get_instance().get_difficulty_config("hard")
+    card_grid = CardGrid.from_difficulty(difficulty_config, screen_size)
+    characters = Character.get_stage_characters("jungle", "hard")
+    atlas = resource_loader.load_card_atlas("jungle", characters, card_grid.card_size)
+    cells = card_grid.get_cells()
+    trimmed_blits = []
+    cell_blits = []
+    for (row, col), character_id in zip(cells, sorted(set(characters))):
+        rect = card_grid.get_cell_rect(row, col)
+        area, offset = atlas.get_trimmed_area(("front", character_id))
+        trimmed_blits.append((atlas.surface, (rect.x + offset[0], rect.y + offset[1]), area))
+        cell_blits.append((atlas.surface, rect.topleft, atlas.get_area(("front", character_id))))
+    results["blit.card_atlas"] = {
+        "trimmed_us": measure_blits(screen, trimmed_blits, repeat),
+        "cell_us": measure_blits(screen, cell_blits, repeat)
+    }
+    
+    return results
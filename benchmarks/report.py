@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ベンチマーク結果の保存と比較
+"""
+
+import json
+import platform
+import pygame
+
+# 値が大きいほど良い指標
+HIGHER_IS_BETTER = {"fps"}
+
+# 計測のばらつきとみなす差の下限（指標名の接尾辞 → 絶対値）
+MIN_DELTAS = {
+    "fps": 1.0,
+    "_ms": 0.1,
+    "_us": 1.0,
+    "_blocks_per_frame": 1.0,
+    "_bytes_per_frame": 1024
+}
+
+def get_min_delta(metric):
+    """
+    指標の差をばらつきとみなす下限を取得する
+    
+    Args:
+        metric (str): 指標名
+    
+    Returns:
+        float: 差の下限
+    """
+    for suffix, min_delta in MIN_DELTAS.items():
+        if metric.endswith(suffix):
+            return min_delta
+    return 0.0
+
+
+def save_results(results, output_file):
+    """
+    ベンチマーク結果を JSON ファイルに書き出す
+    
+    Args:
+        results (dict): ベンチマーク名をキーとする計測結果
+        output_file (str): 書き出すファイルのパス
+    """
+    data = {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform()
+        },
+        "results": results
+    }
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(input_file):
+    """
+    JSON ファイルからベンチマーク結果を読み込む
+    
+    Args:
+        input_file (str): 読み込むファイルのパス
+    
+    Returns:
+        dict: ベンチマーク名をキーとする計測結果
+    """
+    with open(input_file, "r", encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def compare_results(baseline, results, tolerance):
+    """
+    基準の結果と比較して劣化した指標を探す
+    
+    Args:
+        baseline (dict): 基準のベンチマーク結果
+        results (dict): 今回のベンチマーク結果
+        tolerance (float): 劣化とみなす変化率（0.1 なら 10%）
+    
+    Returns:
+        list: (ベンチマーク名, 指標名, 基準値, 今回の値, 変化率) のリスト
+    """
+    regressions = []
+    for name, metrics in sorted(results.items()):
+        baseline_metrics = baseline.get(name)
+        if not baseline_metrics:
+            continue
+        
+        for metric, value in sorted(metrics.items()):
+            baseline_value = baseline_metrics.get(metric)
+            if not isinstance(baseline_value, (int, float)) or not isinstance(value, (int, float)):
+                continue
+            
+            # 悪くなった方向の差を正の値にそろえる
+            delta = baseline_value - value if metric in HIGHER_IS_BETTER else value - baseline_value
+            if delta <= get_min_delta(metric):
+                continue
+            
+            change = delta / abs(baseline_value) if baseline_value else float("inf")
+            if change > tolerance:
+                regressions.append((name, metric, baseline_value, value, change))
+    
+    return regressions
+
+
+def print_results(results):
+    """
+    ベンチマーク結果を表示する
+    
+    Args:
+        results (dict): ベンチマーク名をキーとする計測結果
+    """
+    for name, metrics in sorted(results.items()):
+        values = "  ".join(f"{metric}={value}" for metric, value in metrics.items())
+        print(f"{name:<40} {values}")
+
+
+def print_regressions(regressions):
+    """
+    劣化した指標を表示する
+    
+    Args:
+        regressions (list): compare_results の戻り値
+    """
+    if not regressions:
+        print("基準の結果から劣化した指標はありません")
+        return
+    
+    print(f"{len(regressions)} 個の指標が劣化しています:")
+    for name, metric, baseline_value, value, change in regressions:
+        print(f"  {name} {metric}: {baseline_value} -> {value} ({change:+.1%})")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+画面のベンチマーク
+
+各画面を実際のゲームループと同じ手順（update → 描画 → 画面反映）で
+指定したフレーム数だけ動かし、フレーム時間とフレームごとのメモリ確保を計測する。
+"""
+
+import sys
+import time
+import random
+import tracemalloc
+import pygame
+from game.game_manager import GameManager
+from utils.config_loader import ConfigLoader
+from utils.game_clock import GameClock
+from utils.resource_loader import ResourceLoader
+
+# 計測前に先読みの完了を待つ最大時間（秒）
+PRELOAD_WAIT_SECONDS = 10.0
+
+# 計測前に空回しするフレーム数
+WARMUP_FRAMES = 10
+
+def wait_for_preloads(resource_loader):
+    """
+    先読み中の画像がすべてキャッシュに入るまで待つ
+    
+    Args:
+        resource_loader (ResourceLoader): リソースローダー
+    """
+    deadline = time.monotonic() + PRELOAD_WAIT_SECONDS
+    while resource_loader.preload_futures or resource_loader.preload_jobs:
+        if time.monotonic() > deadline:
+            break
+        resource_loader.process_preloaded()
+        time.sleep(0.001)
+
+
+def run_frame(screen, current_screen, resource_loader):
+    """
+    ゲームループの1フレーム分の処理を行う
+    
+    Args:
+        screen (pygame.Surface): 描画先の画面
+        current_screen: 計測する画面
+        resource_loader (ResourceLoader): リソースローダー
+    """
+    pygame.event.pump()
+    resource_loader.process_preloaded()
+    GameClock.get_instance().tick()
+    current_screen.update()
+    screen.fill((240, 248, 255))
+    current_screen.draw()
+    pygame.display.flip()
+
+
+def measure_screen(screen, create_screen, frames):
+    """
+    画面を指定したフレーム数だけ動かして計測する
+    
+    Args:
+        screen (pygame.Surface): 描画先の画面
+        create_screen (callable): 計測する画面を作成する関数
+        frames (int): 計測するフレーム数
+    
+    Returns:
+        dict: 計測結果
+    """
+    resource_loader = ResourceLoader.get_instance()
+    
+    # 画面を作成する（画像の読み込みを含む）
+    started_at = time.perf_counter()
+    current_screen = create_screen()
+    wait_for_preloads(resource_loader)
+    setup_ms = (time.perf_counter() - started_at) * 1000
+    
+    for _ in range(WARMUP_FRAMES):
+        run_frame(screen, current_screen, resource_loader)
+    
+    # フレーム時間
+    frame_times = []
+    for _ in range(frames):
+        started_at = time.perf_counter()
+        run_frame(screen, current_screen, resource_loader)
+        frame_times.append((time.perf_counter() - started_at) * 1000)
+    frame_times.sort()
+    total_ms = sum(frame_times)
+    
+    # フレームごとに確保されたままになるメモリブロック数（増え続けるならリーク）
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(frames):
+        run_frame(screen, current_screen, resource_loader)
+    blocks_per_frame = (sys.getallocatedblocks() - blocks_before) / frames
+    
+    # フレーム中に一時的に確保される Python オブジェクトのバイト数
+    # （計測のオーバーヘッドが大きいため、フレーム時間とは別に計測する）
+    tracemalloc.start()
+    peak_bytes = 0
+    for _ in range(frames):
+        tracemalloc.reset_peak()
+        current_bytes, _ = tracemalloc.get_traced_memory()
+        run_frame(screen, current_screen, resource_loader)
+        peak_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+    tracemalloc.stop()
+    
+    resource_loader.release_images(current_screen)
+    
+    return {
+        "fps": round(frames * 1000 / total_ms, 1) if total_ms else 0.0,
+        "frame_p50_ms": round(frame_times[len(frame_times) // 2], 3),
+        "frame_p95_ms": round(frame_times[min(len(frame_times) - 1, len(frame_times) * 95 // 100)], 3),
+        "setup_ms": round(setup_ms, 3),
+        "alloc_blocks_per_frame": round(blocks_per_frame, 2),
+        "alloc_peak_bytes_per_frame": round(peak_bytes / frames)
+    }
+
+
+def run_screen_benchmarks(screen, frames):
+    """
+    すべての画面のベンチマークを実行する
+    
+    Args:
+        screen (pygame.Surface): 描画先の画面
+        frames (int): 画面ごとに計測するフレーム数
+    
+    Returns:
+        dict: ベンチマーク名をキーとする計測結果
+    """
+    from ui.menu import MainMenu
+    from ui.environment_select import EnvironmentSelectScreen
+    from ui.difficulty_select import DifficultySelectScreen
+    from ui.game_screen import GameScreen
+    
+    results = {}
+    game_manager = GameManager()
+    
+    results["screen.main_menu"] = measure_screen(
+        screen, lambda: MainMenu(screen, game_manager), frames
+    )
+    results["screen.environment_select"] = measure_screen(
+        screen, lambda: EnvironmentSelectScreen(screen, game_manager), frames
+    )
+    results["screen.difficulty_select"] = measure_screen(
+        screen, lambda: DifficultySelectScreen(screen, game_manager), frames
+    )
+    
+    # ゲーム画面は環境と難易度のすべての組み合わせを計測する
+    config_loader = ConfigLoader.get_instance()
+    difficulties = config_loader.get_game_config().get("difficulty_levels", {})
+    for environment in config_loader.get_environments():
+        for difficulty in difficulties:
+            game_manager.select_environment(environment)
+            game_manager.set_difficulty(difficulty)
+            
+            # カードの並びを毎回同じにする
+            random.seed(0)
+            results[f"screen.game.{environment}.{difficulty}"] = measure_screen(
+                screen, lambda: GameScreen(screen, game_manager), frames
+            )
+    
+    return results
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+カードモジュール
+"""
+
+import pygame
+
+class Card:
+    """神経衰弱のカード1枚を表すクラス"""
+    
+    __slots__ = (
+        "type",
+        "rect",
+        "row",
+        "col",
+        "back_area",
+        "front_area",
+        "back_pos",
+        "front_pos",
+        "back_image",
+        "front_image",
+        "flipped",
+        "matched",
+    )
+    
+    def __init__(self, card_type, rect, row, col):
+        """
+        カードを初期化する
+        
+        Args:
+            card_type (str): カードのキャラクターID
+            rect (pygame.Rect): 画面上の領域
+            row (int): 配置された行
+            col (int): 配置された列
+        """
+        self.type = card_type
+        self.rect = rect
+        self.row = row
+        self.col = col
+        
+        # テクスチャアトラス内の領域（透明な余白を除く）と、その描画先の位置、
+        # アトラス内のカード全体を参照するサブサーフェス
+        self.back_area = None
+        self.front_area = None
+        self.back_pos = None
+        self.front_pos = None
+        self.back_image = None
+        self.front_image = None
+        
+        # カードの状態
+        self.flipped = False
+        self.matched = False
+    
+    def is_selectable(self):
+        """
+        カードをめくれるかどうかを確認する
+        
+        Returns:
+            bool: 裏向きでまだマッチしていなければ True
+        """
+        return not self.flipped and not self.matched
+
+
+class CardGrid:
+    """カードの配置を管理し、座標から直接カードを求めるクラス"""
+    
+    # カードのサイズを自動で決めるときのカードの縦横比（幅 / 高さ）
+    DEFAULT_CARD_ASPECT_RATIO = 0.7
+    
+    # カードのサイズを自動で決めるときに空けておく画面の上（タイトル）・下（戻るボタン）・左右の幅
+    AUTO_SIZE_MARGIN_TOP = 80
+    AUTO_SIZE_MARGIN_BOTTOM = 110
+    AUTO_SIZE_MARGIN_SIDE = 20
+    
+    def __init__(self, card_size, margin, start_y, rows):
+        """
+        カードの配置を初期化する
+        
+        Args:
+            card_size (tuple): カードのサイズ (width, height)
+            margin (int): カードの間隔
+            start_y (int): 1行目の上端のY座標
+            rows (list): 行ごとの (左端のX座標, 列数) のリスト
+        """
+        self.card_width, self.card_height = card_size
+        self.margin = margin
+        self.start_y = start_y
+        self.rows = rows
+        
+        # カードの間隔を含めた1枚あたりの幅と高さ
+        self.pitch_x = self.card_width + margin
+        self.pitch_y = self.card_height + margin
+        
+        # 行・列 → カード
+        self.cells = [[None] * cols for _, cols in rows]
+    
+    @classmethod
+    def from_difficulty(cls, difficulty_config, screen_size, scale=None):
+        """
+        難易度設定からカードの配置を作成する
+        
+        card_width と card_height がなければ、カードが画面に収まるサイズを自動で決める。
+        難易度設定と画面の余白のピクセル数は基準解像度での値のため、scale 倍して使う。
+        
+        Args:
+            difficulty_config (dict): 難易度設定
+            screen_size (tuple): 画面サイズ (width, height)（内部解像度）
+            scale (float, optional): 基準解像度に対する内部解像度の倍率。省略時は現在の描画の倍率
+        
+        Returns:
+            CardGrid: カードの配置
+        """
+        if scale is None:
+            from utils.render_target import RenderTarget
+            scale = RenderTarget.get_instance().scale
+        
+        def to_pixels(value):
+            return max(1, round(value * scale)) if value > 0 else 0
+        
+        rows = difficulty_config.get("rows", 2)
+        cols = difficulty_config.get("cols", 3)
+        margin = to_pixels(difficulty_config.get("margin", 30))
+        
+        # 最後の行だけ列数が異なる場合がある
+        row_counts = [cols] * rows
+        row_counts[-1] = difficulty_config.get("last_row_cols", cols)
+        
+        if "card_width" in difficulty_config and "card_height" in difficulty_config:
+            card_size = (to_pixels(difficulty_config["card_width"]), to_pixels(difficulty_config["card_height"]))
+            return cls.create_centered(pygame.Rect((0, 0), screen_size), card_size, margin, row_counts)
+        
+        width, height = screen_size
+        margin_side = to_pixels(cls.AUTO_SIZE_MARGIN_SIDE)
+        margin_top = to_pixels(cls.AUTO_SIZE_MARGIN_TOP)
+        margin_bottom = to_pixels(cls.AUTO_SIZE_MARGIN_BOTTOM)
+        area = pygame.Rect(
+            margin_side,
+            margin_top,
+            width - margin_side * 2,
+            height - margin_top - margin_bottom
+        )
+        card_size = cls.fit_card_size(
+            area.size,
+            margin,
+            rows,
+            max(row_counts),
+            difficulty_config.get("card_aspect_ratio", cls.DEFAULT_CARD_ASPECT_RATIO)
+        )
+        return cls.create_centered(area, card_size, margin, row_counts)
+    
+    @classmethod
+    def fit_card_size(cls, area_size, margin, rows, cols, aspect_ratio):
+        """
+        縦横比を保ったまま領域に収まる最大のカードのサイズを求める
+        
+        Args:
+            area_size (tuple): カードを並べる領域のサイズ (width, height)
+            margin (int): カードの間隔
+            rows (int): 行数
+            cols (int): 最大の列数
+            aspect_ratio (float): カードの縦横比（幅 / 高さ）
+        
+        Returns:
+            tuple: カードのサイズ (width, height)
+        """
+        area_width, area_height = area_size
+        card_width = (area_width - (cols - 1) * margin) // cols
+        card_height = (area_height - (rows - 1) * margin) // rows
+        
+        card_width = min(card_width, int(card_height * aspect_ratio))
+        card_height = min(card_height, int(card_width / aspect_ratio))
+        return (max(1, card_width), max(1, card_height))
+    
+    @classmethod
+    def create_centered(cls, area, card_size, margin, row_counts):
+        """
+        領域の中央にカードを並べる配置を作成する
+        
+        Args:
+            area (pygame.Rect): カードを並べる領域
+            card_size (tuple): カードのサイズ (width, height)
+            margin (int): カードの間隔
+            row_counts (list): 行ごとの列数
+        
+        Returns:
+            CardGrid: カードの配置
+        """
+        card_width, card_height = card_size
+        start_y = area.y + (area.height - (len(row_counts) * card_height + (len(row_counts) - 1) * margin)) // 2
+        rows = [
+            (area.x + (area.width - (cols * card_width + (cols - 1) * margin)) // 2, cols)
+            for cols in row_counts
+        ]
+        return cls(card_size, margin, start_y, rows)
+    
+    @property
+    def card_size(self):
+        """カードのサイズ (width, height)"""
+        return (self.card_width, self.card_height)
+    
+    def get_cells(self):
+        """
+        すべてのセルを取得する
+        
+        Returns:
+            list: (行, 列) のリスト
+        """
+        return [(row, col) for row, (_, cols) in enumerate(self.rows) for col in range(cols)]
+    
+    def get_cell_rect(self, row, col):
+        """
+        セルの画面上の領域を取得する
+        
+        Args:
+            row (int): 行
+            col (int): 列
+        
+        Returns:
+            pygame.Rect: セルの領域
+        """
+        start_x, _ = self.rows[row]
+        return pygame.Rect(
+            start_x + col * self.pitch_x,
+            self.start_y + row * self.pitch_y,
+            self.card_width,
+            self.card_height
+        )
+    
+    def clear(self):
+        """すべてのセルを空にする（カードを配り直す前に呼び出す）"""
+        for row_cells in self.cells:
+            row_cells[:] = [None] * len(row_cells)
+    
+    def place(self, card):
+        """
+        カードをセルに配置する
+        
+        Args:
+            card (Card): 配置するカード（row と col を設定済み）
+        """
+        self.cells[card.row][card.col] = card
+    
+    def get_card_at(self, pos):
+        """
+        座標にあるカードを取得する
+        
+        行と列を割り算で求めるため、カードの枚数に関係なく一定時間で求まる。
+        
+        Args:
+            pos (tuple): 座標 (x, y)
+        
+        Returns:
+            Card: 座標にあるカード、またはカードの間隔や配置の外の場合は None
+        """
+        x, y = pos
+        
+        row, offset_y = divmod(y - self.start_y, self.pitch_y)
+        if row < 0 or row >= len(self.rows) or offset_y >= self.card_height:
+            return None
+        
+        start_x, cols = self.rows[row]
+        col, offset_x = divmod(x - start_x, self.pitch_x)
+        if col < 0 or col >= cols or offset_x >= self.card_width:
+            return None
+        
+        return self.cells[row][col]
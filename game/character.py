@@ -29,26 +29,10 @@ class Character:
             character_id (str): キャラクターID
             
         Returns:
-            dict: キャラクター情報
+            dict: キャラクター情報（読み取り専用）
         """
-        config_loader = ConfigLoader.get_instance()
-        characters = config_loader.get_characters()
-        
-        # 動物から検索
-        for animal in characters.get("animals", []):
-            if animal["id"] == character_id:
-                animal_info = animal.copy()
-                animal_info["type"] = cls.TYPE_ANIMAL
-                return animal_info
-        
-        # 恐竜から検索
-        for dinosaur in characters.get("dinosaurs", []):
-            if dinosaur["id"] == character_id:
-                dino_info = dinosaur.copy()
-                dino_info["type"] = cls.TYPE_DINOSAUR
-                return dino_info
-        
-        return {}
+        character = ConfigLoader.get_instance().get_catalog().get_character(character_id)
+        return character if character is not None else {}
     
     @classmethod
     def get_name(cls, character_id):
@@ -65,13 +49,14 @@ class Character:
         return character.get("name", character_id)
     
     @classmethod
-    def get_characters_by_environment(cls, environment_type, difficulty="easy"):
+    def get_characters_by_environment(cls, environment_type, difficulty="easy", minimum=3):
         """
         環境と難易度に対応するキャラクターのリストを取得する
         
         Args:
             environment_type (str): 環境の種類
             difficulty (str): 難易度 ("easy", "normal", "hard")
+            minimum (int): 最低限必要なキャラクターの数
             
         Returns:
             list: キャラクターIDのリスト
@@ -82,23 +67,48 @@ class Character:
         characters = animals + dinosaurs
         
         # キャラクターが足りない場合は、他の環境から追加
-        if len(characters) < 3:  # 最低3種類は必要
-            # 他の環境から動物を追加
+        if len(characters) < minimum:
             for env_type in [cls.ENV_JUNGLE, cls.ENV_OCEAN, cls.ENV_DESERT, cls.ENV_FOREST]:
                 if env_type != environment_type:
-                    extra_animals = cls.get_animals_by_environment(env_type, "easy")
-                    if extra_animals:
-                        characters.extend(extra_animals[:2])  # 最大2種類追加
-                    if len(characters) >= 3:
+                    extra_characters = [
+                        character
+                        for character in cls.get_animals_by_environment(env_type, difficulty)
+                        + cls.get_dinosaurs_by_environment(env_type, difficulty)
+                        if character not in characters
+                    ]
+                    characters.extend(extra_characters)
+                    if len(characters) >= minimum:
                         break
         
-        # それでも足りない場合は、既存のキャラクターを複製
-        while len(characters) < 3:
-            if len(characters) > 0:
-                characters.append(characters[0])  # 最初のキャラクターを再利用
+        # それでも足りない場合は、既存のキャラクターを順に繰り返し使う
+        unique_count = len(characters)
+        while 0 < unique_count and len(characters) < minimum:
+            characters.append(characters[len(characters) % unique_count])
         
         return characters
     
+    @classmethod
+    def get_stage_characters(cls, environment_type, difficulty="easy"):
+        """
+        ステージ（環境と難易度）のカードに使うキャラクターのリストを取得する
+        
+        難易度設定の character_difficulty でキャラクターの難易度を、
+        pairs_count で最低限必要なキャラクターの数を決める。
+        
+        Args:
+            environment_type (str): 環境の種類
+            difficulty (str): 難易度 ("easy", "normal", "hard" など)
+            
+        Returns:
+            list: キャラクターIDのリスト
+        """
+        difficulty_config = ConfigLoader.get_instance().get_difficulty_config(difficulty)
+        return cls.get_characters_by_environment(
+            environment_type,
+            difficulty_config.get("character_difficulty", difficulty),
+            max(3, difficulty_config.get("pairs_count", 3))
+        )
+    
     @classmethod
     def get_animals_by_environment(cls, environment_type, difficulty="easy"):
         """
@@ -111,32 +121,8 @@ class Character:
         Returns:
             list: 動物IDのリスト
         """
-        config_loader = ConfigLoader.get_instance()
-        characters = config_loader.get_characters()
-        
-        # 難易度に応じた数値に変換
-        difficulty_level = 1  # デフォルトは「やさしい」
-        if difficulty == "normal":
-            difficulty_level = 2
-        elif difficulty == "hard":
-            difficulty_level = 3
-        
-        animals = []
-        
-        # 動物を環境と難易度でフィルタリング
-        for animal in characters.get("animals", []):
-            # 環境が一致するか確認
-            if environment_type in animal.get("environments", []):
-                # 難易度チェック
-                animal_difficulty = animal.get("difficulty", 1)
-                
-                # 難易度条件に合致するか確認
-                if (difficulty_level == 1 and animal_difficulty == 1) or \
-                   (difficulty_level == 2 and animal_difficulty <= 2) or \
-                   (difficulty_level == 3):
-                    animals.append(animal["id"])
-        
-        return animals
+        catalog = ConfigLoader.get_instance().get_catalog()
+        return list(catalog.get_animals(environment_type, difficulty))
     
     @classmethod
     def get_dinosaurs_by_environment(cls, environment_type, difficulty="easy"):
@@ -150,28 +136,5 @@ class Character:
         Returns:
             list: 恐竜IDのリスト
         """
-        config_loader = ConfigLoader.get_instance()
-        characters = config_loader.get_characters()
-        
-        # 難易度に応じた数値に変換
-        difficulty_level = 1  # デフォルトは「やさしい」
-        if difficulty == "normal":
-            difficulty_level = 2
-        elif difficulty == "hard":
-            difficulty_level = 3
-        
-        dinosaurs = []
-        
-        # 恐竜を環境と難易度でフィルタリング
-        for dinosaur in characters.get("dinosaurs", []):
-            # 環境が一致するか確認
-            if environment_type in dinosaur.get("environments", []):
-                # 難易度チェック
-                dino_difficulty = dinosaur.get("difficulty", 2)  # 恐竜はデフォルトで難易度2
-                
-                # 難易度条件に合致するか確認
-                if (difficulty_level >= 2 and dino_difficulty == 2) or \
-                   (difficulty_level == 3 and dino_difficulty == 3):
-                    dinosaurs.append(dinosaur["id"])
-        
-        return dinosaurs
\ No newline at end of file
+        catalog = ConfigLoader.get_instance().get_catalog()
+        return list(catalog.get_dinosaurs(environment_type, difficulty))
\ No newline at end of file
@@ -6,6 +6,7 @@
 """
 
 from utils.config_loader import ConfigLoader
+from utils.catalog import DEFAULT_ENVIRONMENT_NAME, DEFAULT_BACKGROUND_COLOR, DEFAULT_CARD_BACKS
 
 class Environment:
     """環境（ステージ）を表すクラス"""
@@ -70,14 +71,12 @@ class Environment:
             environment_type (str): 環境の種類
             
         Returns:
-            list: カード裏面のリスト
+            tuple: カード裏面のタプル
         """
-        config_loader = ConfigLoader.get_instance()
-        environments = config_loader.get_environments()
-        
-        if environment_type in environments:
-            return environments[environment_type].get("card_backs", ["flower"])
-        return ["flower"]
+        environment = ConfigLoader.get_instance().get_catalog().get_environment(environment_type)
+        if environment is not None:
+            return environment["card_backs"]
+        return DEFAULT_CARD_BACKS
     
     @classmethod
     def get_name(cls, environment_type):
@@ -90,12 +89,10 @@ class Environment:
         Returns:
             str: 環境の日本語名
         """
-        config_loader = ConfigLoader.get_instance()
-        environments = config_loader.get_environments()
-        
-        if environment_type in environments:
-            return environments[environment_type].get("name", "不明")
-        return "不明"
+        environment = ConfigLoader.get_instance().get_catalog().get_environment(environment_type)
+        if environment is not None:
+            return environment["name"]
+        return DEFAULT_ENVIRONMENT_NAME
     
     @classmethod
     def get_background_color(cls, environment_type):
@@ -108,9 +105,7 @@ class Environment:
         Returns:
             tuple: 背景色 (R, G, B)
         """
-        config_loader = ConfigLoader.get_instance()
-        environments = config_loader.get_environments()
-        
-        if environment_type in environments:
-            return tuple(environments[environment_type].get("background_color", (240, 248, 255)))
-        return (240, 248, 255)  # デフォルトは薄い水色
\ No newline at end of file
+        environment = ConfigLoader.get_instance().get_catalog().get_environment(environment_type)
+        if environment is not None:
+            return environment["background_color"]
+        return DEFAULT_BACKGROUND_COLOR  # デフォルトは薄い水色
\ No newline at end of file
@@ -3,8 +3,14 @@
 
 """
 ゲーム状態管理モジュール
+
+発見したキャラクターと遊んだ回数（進み具合）は進行状況ファイルに保存し、次回の起動時に読み込む。
 """
 
+import json
+import os
+from utils.save_manager import SaveManager
+
 class GameManager:
     """ゲーム全体の状態を管理するクラス"""
     
@@ -15,8 +21,13 @@ class GameManager:
     STATE_STICKER_BOOK = "sticker_book"
     STATE_ENVIRONMENT_SELECT = "environment_select"
     
-    def __init__(self):
-        """ゲームマネージャーの初期化"""
+    def __init__(self, progress_file=None):
+        """
+        ゲームマネージャーの初期化
+        
+        Args:
+            progress_file (str): 進行状況を保存するファイルのパス（省略時は保存しない）
+        """
         # 現在の状態
         self.current_state = self.STATE_MENU
         
@@ -26,8 +37,56 @@ class GameManager:
         # 発見されたキャラクター
         self.discovered_characters = []
         
+        # 環境ごと・難易度ごとの遊んだ回数（すべてのペアを見つけた回数）
+        self.play_counts = {}
+        
         # 難易度
         self.difficulty = "easy"
+        
+        # 進行状況の保存
+        self.progress_file = progress_file
+        self.save_manager = SaveManager.get_instance()
+        if progress_file is not None:
+            self._load_progress()
+    
+    def _load_progress(self):
+        """進行状況ファイルを読み込む（ファイルがない場合は最初から始める）"""
+        if not os.path.exists(self.progress_file):
+            return
+        try:
+            with open(self.progress_file, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            print(f"進行状況ファイルの読み込みに失敗しました: {self.progress_file}")
+            return
+        
+        # 形式が違うファイルは読まずに最初から始める
+        if not isinstance(progress, dict):
+            print(f"進行状況ファイルの形式が正しくありません: {self.progress_file}")
+            return
+        
+        discovered_characters = progress.get("discovered_characters", [])
+        play_counts = progress.get("play_counts", {})
+        if isinstance(discovered_characters, list):
+            self.discovered_characters = discovered_characters
+        if isinstance(play_counts, dict):
+            self.play_counts = play_counts
+    
+    def save_progress(self, immediately=False):
+        """
+        進行状況の保存を予約する
+        
+        Args:
+            immediately (bool): 待ち時間なしで保存するかどうか（ゲームクリアなど失いたくない記録の場合）
+        """
+        if self.progress_file is None:
+            return
+        self.save_manager.schedule(self.progress_file, {
+            "discovered_characters": self.discovered_characters,
+            "play_counts": self.play_counts
+        })
+        if immediately:
+            self.save_manager.flush()
     
     def change_state(self, new_state):
         """
@@ -56,6 +115,20 @@ class GameManager:
         """
         if character not in self.discovered_characters:
             self.discovered_characters.append(character)
+            # 見つけたキャラクターは失わないよう待ち時間なしで保存する（発見は多くないため）
+            self.save_progress(immediately=True)
+    
+    def record_play(self, environment, difficulty):
+        """
+        ゲームを最後まで遊んだことを記録する
+        
+        Args:
+            environment (str): 遊んだ環境
+            difficulty (str): 遊んだ難易度
+        """
+        counts = self.play_counts.setdefault(environment, {})
+        counts[difficulty] = counts.get(difficulty, 0) + 1
+        self.save_progress(immediately=True)
     
     def reset_game(self):
         """ゲームをリセットする"""
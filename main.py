@@ -7,42 +7,123 @@
 """
 
 import sys
-import pygame
 import asyncio
 import platform
-from ui.menu import MainMenu
-from game.game_manager import GameManager
+from utils.startup_report import StartupReport
+
+# 起動時間の計測（以降に読み込むモジュールの読み込み時間も記録する）
+StartupReport.get_instance().start_import_tracking()
+
+import pygame
 from utils.config import Config
+from utils.font_manager import FontManager
+from utils.frame_profiler import FrameProfiler
+from utils.game_clock import GameClock
+from utils.render_target import RenderTarget
+from utils.resource_loader import ResourceLoader
+from utils.save_manager import SaveManager
+from utils.surface_tracker import SurfaceTracker
+from ui.input_dispatcher import InputDispatcher
+
+def merge_overlapping_rects(rects):
+    """
+    重なっている矩形どうしをまとめる（重なっていない矩形は別々のまま残す）
+    
+    Args:
+        rects (list): 矩形のリスト
+    
+    Returns:
+        list: 互いに重ならない矩形のリスト
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        
+        # まとめて大きくなった矩形が別の矩形と重なることがあるため、重ならなくなるまで繰り返す
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
 
 class Game:
     """メインゲームクラス"""
     
+    # Web環境でアイドル中にイベントの到着を確認する間隔（秒）
+    IDLE_POLL_SECONDS = 0.05
+    
     def __init__(self):
-        """ゲームの初期化"""
-        pygame.init()
-        pygame.mixer.init()
+        """
+        ゲームの初期化
+        
+        最初のフレームをできるだけ早く表示するため、ここでは画面の作成までを行い、
+        音声・フォント・画面モジュールの初期化は run の最初のフレームで行う。
+        """
+        self.startup_report = StartupReport.get_instance()
+        self.startup_report.mark("imports")
+        
+        pygame.display.init()
         
         # タッチイベントをマウスイベントに変換する設定
         pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION])
         
-        # 設定の読み込み
+        # 設定の読み込み（設定と進行状況の保存はまとめてバックグラウンドで行う）
         self.config = Config()
+        self.save_manager = SaveManager.get_instance()
+        
+        # サーフェスのメモリ計測（画面の切り替え後に残ったサーフェスを報告する）
+        self.surface_tracker = SurfaceTracker.get_instance()
+        if self.config.get("surface_tracking", False):
+            self.surface_tracker.start(trace_python=self.config.get("surface_tracking_python", False))
         
-        # 画面の設定
-        self.screen_width = self.config.get("screen_width", 800)
-        self.screen_height = self.config.get("screen_height", 600)
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # 画面の設定（render_scale 倍の内部解像度で描画し、ウィンドウには拡大して表示する）
+        self.screen = RenderTarget.get_instance().create_display(
+            (self.config.get("screen_width", 800), self.config.get("screen_height", 600)),
+            self.config.get("render_scale", 1.0)
+        )
+        self.screen_width, self.screen_height = self.screen.get_size()
         pygame.display.set_caption("どうぶつ・きょうりゅうかくれんぼ")
         
-        # ゲームの状態管理
-        self.game_manager = GameManager()
+        # 最初のフレーム（背景色のみ）をすぐに表示する
+        self.screen.fill((240, 248, 255))
+        pygame.display.flip()
+        self.startup_report.mark("display")
+        
+        # 画像キャッシュのメモリ予算
+        ResourceLoader.get_instance().set_cache_budget(
+            self.config.get("image_cache_budget_mb", 64) * 1024 * 1024
+        )
         
-        # メインメニューの初期化
-        self.current_screen = MainMenu(self.screen, self.game_manager)
+        # 入力の振り分け（イベントキューは1フレームに1回だけここで読み出す）
+        self.input_dispatcher = InputDispatcher((self.screen_width, self.screen_height))
         
-        # クロックの初期化
+        # ゲームの状態管理とメインメニュー（_initialize_deferred で作成する）
+        self.game_manager = None
+        self.current_screen = None
+        
+        # 画面のスタック（画面の切り替えはフレームの最後に行う）
+        self.screen_manager = None
+        
+        # クロックの初期化（描画のフレームレートとゲーム時間の刻みは別々に管理する）
         self.clock = pygame.time.Clock()
         self.fps = self.config.get("fps", 30)
+        self.game_clock = GameClock.get_instance()
+        
+        # アイドル時の間引き（画面が動いていないときは入力が来るまで休む）
+        self.idle_throttling = self.config.get("idle_throttling", True)
+        self.idle_timeout_ms = self.config.get("idle_timeout_ms", 250)
+        
+        # 差分描画モード（変化した領域だけを画面に反映する）
+        self.dirty_rect_rendering = self.config.get("dirty_rect_rendering", False)
+        self.full_redraw_pending = True
+        
+        # フレーム時間の計測（F3 キーで HUD を切り替える）
+        self.profiler = FrameProfiler(
+            enabled=self.config.get("frame_profiler", False),
+            output_file=self.config.get("frame_profile_output", "frame_profile.json")
+        )
         
         # ゲームの実行状態
         self.running = True
@@ -51,14 +132,129 @@ class Game:
         self.is_web = platform.system() == "Emscripten"
         self.web_started = not self.is_web  # デスクトップ環境では最初から開始
     
+    def _initialize_deferred(self):
+        """最初のフレームを表示した後に、残りのモジュールとメインメニューを初期化する"""
+        pygame.font.init()
+        pygame.mixer.init()
+        self.startup_report.mark("mixer_font")
+        
+        # 画面モジュールはここで初めて読み込む
+        from game.game_manager import GameManager
+        from ui.menu import MainMenu
+        from ui.screen_manager import ScreenManager
+        self.startup_report.mark("import_screens")
+        
+        self.game_manager = GameManager(self.config.get("progress_file", "save_data.json"))
+        self.game_manager.set_difficulty(self.config.get("difficulty", "easy"))
+        self.screen_manager = ScreenManager.get_instance()
+        self.screen_manager.setup(self.screen, self.game_manager)
+        self.screen_manager.push(MainMenu)
+        self.screen_manager.apply_pending()
+        self._set_current_screen(self.screen_manager.current_screen)
+        self.startup_report.mark("main_menu")
+    
+    def _set_current_screen(self, screen):
+        """
+        現在の画面を切り替える
+        
+        Args:
+            screen: 新しく表示する画面
+        """
+        self.current_screen = screen
+        self.input_dispatcher.set_screen(screen)
+        
+        # 変化した領域は差分描画モードのときだけ画面に記録させる（記録した領域は get_dirty_rects で受け取る）
+        if hasattr(screen, "get_dirty_rects"):
+            screen.dirty_rect_tracking = self.dirty_rect_rendering
+    
+    def _finish_startup_report(self):
+        """メインメニューの最初のフレームを表示したら起動時間の計測を終了する"""
+        self.startup_report.finish("first_menu_frame")
+        if self.config.get("startup_report", False):
+            self.startup_report.print_report()
+            self.startup_report.save_report(self.config.get("startup_report_output", "startup_report.json"))
+    
+    def _get_dirty_rects(self, screen_name):
+        """
+        現在の画面で再描画が必要な領域を取得する
+        
+        Args:
+            screen_name (str): 表示中の画面のクラス名
+        
+        Returns:
+            list: 再描画が必要な矩形のリスト、または画面全体を描画する場合は None
+        """
+        if not self.dirty_rect_rendering or not hasattr(self.current_screen, "get_dirty_rects"):
+            return None
+        
+        # 画面の差分は毎フレーム受け取っておく（画面遷移の直後は全体を描画する）
+        dirty_rects = self.current_screen.get_dirty_rects()
+        if self.full_redraw_pending or dirty_rects is None:
+            self.full_redraw_pending = False
+            return None
+        
+        # HUD は表示内容が随時変わるため毎フレーム描き直す（前回の表示の領域も含める）
+        hud_rect = self.profiler.get_hud_rect(screen_name)
+        if hud_rect:
+            dirty_rects = dirty_rects + [hud_rect]
+        return dirty_rects
+    
+    def _is_idle(self):
+        """
+        次のフレームを急いで描く必要がないかどうかを確認する
+        
+        Returns:
+            bool: 画面がアニメーション中でなく、先読み中の画像もない場合は True
+        """
+        if not self.idle_throttling:
+            return False
+        if ResourceLoader.get_instance().has_pending_preloads():
+            return False
+        if not self.web_started:
+            return True
+        
+        # is_animating を持たない画面は常に動いているものとして扱う
+        is_animating = getattr(self.current_screen, "is_animating", None)
+        return is_animating is not None and not is_animating()
+    
+    async def _wait_for_input(self):
+        """
+        入力が来るか idle_timeout_ms が経過するまで休む
+        
+        Web環境ではブラウザを止めないよう、低いフレームレートでイベントの到着を確認する。
+        """
+        if not self.is_web:
+            event = pygame.event.wait(self.idle_timeout_ms)
+            if event.type != pygame.NOEVENT:
+                # 受け取ったイベントは次のフレームで、一緒に届いたイベントより先に処理する
+                self.input_dispatcher.hold_event(event)
+            return
+        
+        deadline = pygame.time.get_ticks() + self.idle_timeout_ms
+        while pygame.time.get_ticks() < deadline and not pygame.event.peek():
+            await asyncio.sleep(self.IDLE_POLL_SECONDS)
+    
     async def run(self):
         """メインゲームループ（非同期版）"""
+        # 最初のフレームをブラウザに表示させてから残りを初期化する
+        if self.is_web:
+            await asyncio.sleep(0)
+        if self.current_screen is None:
+            self._initialize_deferred()
+        
         while self.running:
+            self.profiler.begin_frame()
+            screen_name = type(self.current_screen).__name__
+            
             # イベント処理
-            for event in pygame.event.get():
+            for event in self.input_dispatcher.poll():
                 if event.type == pygame.QUIT:
                     self.running = False
                 
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler.toggle_hud()
+                    self.full_redraw_pending = True
+                
                 # Web環境でのスタート処理
                 if self.is_web and not self.web_started:
                     if event.type in (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, pygame.KEYDOWN):
@@ -67,31 +263,73 @@ class Game:
                 # ゲームが開始されている場合のみイベント処理
                 if self.web_started:
                     # 現在の画面にイベントを渡す
-                    self.current_screen.handle_event(event)
+                    self.input_dispatcher.dispatch(event)
+            
+            # 先読みが完了した画像を受け取る
+            ResourceLoader.get_instance().process_preloaded()
+            
+            # スレッドを使えない環境では、書き込みが落ち着いた保存をここで行う
+            self.save_manager.poll()
+            self.profiler.lap("events")
+            
+            # 前のフレームからの経過時間に応じて、このフレームで進めるゲーム時間の刻みを求める
+            self.game_clock.tick()
             
             # Web環境で開始前の場合はスタート画面を表示
             if self.is_web and not self.web_started:
                 self.screen.fill((240, 248, 255))  # 背景色
-                font = pygame.font.SysFont(None, 48)
-                text = font.render("タップしてスタート", True, (0, 0, 0))
+                text = FontManager.get_instance().render_cached("タップしてスタート", 48, (0, 0, 0))
                 text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(text, text_rect)
+                pygame.display.flip()
             else:
                 # 通常のゲーム処理
                 # 画面の更新
                 self.current_screen.update()
+                self.profiler.lap("update")
                 
                 # 画面の描画
-                self.screen.fill((240, 248, 255))  # 背景色（薄い水色）
-                self.current_screen.draw()
+                dirty_rects = self._get_dirty_rects(screen_name)
+                if dirty_rects is None:
+                    self.screen.fill((240, 248, 255))  # 背景色（薄い水色）
+                    self.current_screen.draw()
+                    self.profiler.draw_hud(self.screen, screen_name)
+                    self.profiler.lap("draw")
+                    pygame.display.flip()
+                elif dirty_rects:
+                    # 変化した領域だけを描画して画面に反映する
+                    # （離れた領域を1つの矩形で囲むと画面のほとんどを描き直すことになるため、領域ごとに描画する）
+                    dirty_rects = merge_overlapping_rects(dirty_rects)
+                    for dirty_rect in dirty_rects:
+                        self.screen.set_clip(dirty_rect)
+                        self.screen.fill((240, 248, 255))
+                        self.current_screen.draw()
+                        self.profiler.draw_hud(self.screen, screen_name)
+                    self.screen.set_clip(None)
+                    self.profiler.lap("draw")
+                    pygame.display.update(dirty_rects)
+                self.profiler.lap("flip")
+                
+                if not self.startup_report.finished:
+                    self._finish_startup_report()
+            
+            # このフレームで要求された画面の切り替えを行う
+            screen_switched = False
+            if self.web_started and self.screen_manager.apply_pending():
+                self._set_current_screen(self.screen_manager.current_screen)
+                self.screen_manager.check_surfaces()
+                self.full_redraw_pending = True
+                
+                # 予約されている保存は画面の切り替えに合わせて書き込む
+                self.save_manager.flush()
+                screen_switched = True
             
-            pygame.display.flip()
+            self.profiler.end_frame(screen_name)
             
-            # 次の画面に切り替える必要があるか確認
-            if self.web_started:
-                next_screen = self.current_screen.get_next_screen()
-                if next_screen:
-                    self.current_screen = next_screen
+            # 何も動いていなければ入力が来るまで休む（切り替えた画面は休まずに描く）
+            if not screen_switched and self._is_idle():
+                await self._wait_for_input()
+                self.game_clock.reset()
             
             # フレームレートの制御
             self.clock.tick(self.fps)
@@ -100,7 +338,13 @@ class Game:
             if self.is_web:
                 await asyncio.sleep(0)
         
-        # ゲーム終了時の処理
+        # ゲーム終了時の処理（予約されている保存は書き込み終わるまで待つ）
+        self.save_manager.shutdown()
+        ResourceLoader.get_instance().shutdown()
+        self.profiler.dump()
+        if self.surface_tracker.enabled:
+            self.surface_tracker.print_report()
+            self.surface_tracker.save_report(self.config.get("surface_report_output", "surface_report.json"))
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+カードの配置（CardGrid）と配り直しのテスト
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+from game.game_manager import GameManager
+from utils.config_loader import ConfigLoader
+from utils.resource_loader import ResourceLoader
+
+@pytest.fixture
+def screen():
+    """ヘッドレスの画面を作成する"""
+    pygame.init()
+    yield pygame.display.set_mode((800, 600))
+    ResourceLoader.get_instance().shutdown()
+    pygame.quit()
+
+
+def test_redeal_leaves_empty_cells_empty(screen, monkeypatch):
+    """セルよりカードが少ない難易度で配り直しても、カードのないセルは None を返す"""
+    from ui.game_screen import GameScreen
+    
+    # 2×3 のセルに 2 ペア（4 枚）だけ配る難易度にする
+    config_loader = ConfigLoader.get_instance()
+    easy_config = dict(config_loader.get_difficulty_config("easy"), pairs_count=2)
+    monkeypatch.setattr(config_loader, "get_difficulty_config", lambda difficulty: easy_config)
+    
+    game_manager = GameManager()
+    game_manager.select_environment("jungle")
+    game_manager.set_difficulty("easy")
+    game_screen = GameScreen(screen, game_manager)
+    
+    for _ in range(20):
+        game_screen.redeal()
+        
+        card_grid = game_screen.card_grid
+        occupied = {(card.row, card.col) for card in game_screen.cards}
+        assert len(occupied) == 4
+        for row, col in card_grid.get_cells():
+            card = card_grid.get_card_at(card_grid.get_cell_rect(row, col).center)
+            if (row, col) in occupied:
+                assert card is not None and (card.row, card.col) == (row, col)
+            else:
+                assert card is None
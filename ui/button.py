@@ -7,40 +7,55 @@
 
 import pygame
 from utils.font_manager import FontManager
+from utils.game_clock import GameClock
+from utils.render_target import scaled
+from utils.surface_tracker import track_surface, CATEGORY_BUTTONS
+from ui.input_dispatcher import get_event_pos
 
 class Button:
     """ボタンクラス"""
     
+    # 描画済みの見た目をキャッシュする拡大率の刻み幅
+    SCALE_STEP = 0.005
+    
     def __init__(self, x, y, width, height, text, font_size=32, 
                  color=(70, 130, 180), hover_color=(30, 144, 255), 
                  text_color=(255, 255, 255), border_radius=10):
         """
         ボタンを初期化する
         
+        位置とサイズは描画する画面（内部解像度）の座標で、フォントサイズと角の丸みは基準解像度で指定する。
+        
         Args:
             x (int): X座標
             y (int): Y座標
             width (int): 幅
             height (int): 高さ
             text (str): ボタンのテキスト
-            font_size (int): フォントサイズ
+            font_size (int): フォントサイズ（基準解像度）
             color (tuple): ボタンの色 (R, G, B)
             hover_color (tuple): ホバー時の色 (R, G, B)
             text_color (tuple): テキストの色 (R, G, B)
-            border_radius (int): 角の丸みの半径
+            border_radius (int): 角の丸みの半径（基準解像度）
         """
+        # 状態ごとに描画済みの見た目（(状態, 拡大率の段階) → サーフェス）
+        self.visual_cache = {}
+        
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
+        self._text = text
         self.font_size = font_size
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
+        self._color = color
+        self._hover_color = hover_color
+        self._text_color = text_color
         self.border_radius = border_radius
         self.is_hovered = False
         self.is_clicked = False
         
+        # ホバー状態を InputDispatcher が更新するかどうか
+        self.hover_managed = False
+        
         # フォントの初期化
-        self.font = FontManager.get_instance().get_font(font_size)
+        self.font_manager = FontManager.get_instance()
         
         # クリック効果音
         self.click_sound = None
@@ -48,7 +63,59 @@ class Button:
         # アニメーション用の変数
         self.scale = 1.0
         self.target_scale = 1.0
-        self.animation_speed = 0.2
+        self.animation_speed = 0.2  # 1刻みで目標値に近づく割合
+        
+        # 1つ前の刻みの拡大率と、前後の刻みの間で補間した描画時の拡大率
+        self.previous_scale = 1.0
+        self.draw_scale = 1.0
+        self.game_clock = GameClock.get_instance()
+        
+        # 前回描画したときの見た目の状態（差分描画で変化を検出するために使う）
+        self.drawn_state = None
+    
+    @property
+    def text(self):
+        """ボタンのテキスト"""
+        return self._text
+    
+    @text.setter
+    def text(self, value):
+        if value != self._text:
+            self._text = value
+            self.visual_cache.clear()
+    
+    @property
+    def color(self):
+        """ボタンの色 (R, G, B)"""
+        return self._color
+    
+    @color.setter
+    def color(self, value):
+        if value != self._color:
+            self._color = value
+            self.visual_cache.clear()
+    
+    @property
+    def hover_color(self):
+        """ホバー時の色 (R, G, B)"""
+        return self._hover_color
+    
+    @hover_color.setter
+    def hover_color(self, value):
+        if value != self._hover_color:
+            self._hover_color = value
+            self.visual_cache.clear()
+    
+    @property
+    def text_color(self):
+        """テキストの色 (R, G, B)"""
+        return self._text_color
+    
+    @text_color.setter
+    def text_color(self, value):
+        if value != self._text_color:
+            self._text_color = value
+            self.visual_cache.clear()
     
     def set_click_sound(self, sound_file):
         """
@@ -61,23 +128,9 @@ class Button:
     
     def update(self):
         """ボタンの状態を更新する"""
-        # マウスの位置を取得
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # ホバー状態を更新
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-        
-        # タッチイベントの処理（ホバー状態の更新）
-        for event in pygame.event.get([pygame.FINGERMOTION, pygame.FINGERDOWN]):
-            if event.type in (pygame.FINGERMOTION, pygame.FINGERDOWN):
-                # タッチ位置をスクリーン座標に変換
-                display_size = pygame.display.get_surface().get_size()
-                touch_x = event.x * display_size[0]
-                touch_y = event.y * display_size[1]
-                
-                # ボタンの領域内かチェック
-                if self.rect.collidepoint(touch_x, touch_y):
-                    self.is_hovered = True
+        # ホバー状態を更新（InputDispatcher が管理している場合はそちらで更新済み）
+        if not self.hover_managed:
+            self.is_hovered = self.rect.collidepoint(pygame.mouse.get_pos())
         
         # アニメーション更新
         if self.is_hovered:
@@ -85,8 +138,22 @@ class Button:
         else:
             self.target_scale = 1.0
         
-        # スケールを目標値に近づける
-        self.scale += (self.target_scale - self.scale) * self.animation_speed
+        # スケールを刻みごとに目標値に近づける
+        for _ in range(self.game_clock.steps):
+            self.previous_scale = self.scale
+            self.scale += (self.target_scale - self.scale) * self.animation_speed
+        
+        # 描画時の拡大率は前後の刻みの間で補間する
+        self.draw_scale = self.previous_scale + (self.scale - self.previous_scale) * self.game_clock.alpha
+    
+    def is_animating(self):
+        """
+        拡大アニメーションの途中かどうかを確認する
+        
+        Returns:
+            bool: 見た目の拡大率がまだ目標値に達していない場合は True
+        """
+        return abs(self.target_scale - self.scale) >= self.SCALE_STEP / 2
     
     def handle_event(self, event):
         """
@@ -100,10 +167,8 @@ class Button:
         """
         # タッチイベントの処理を追加
         if event.type == pygame.FINGERDOWN:
-            # タッチ位置をスクリーン座標に変換
-            display_size = pygame.display.get_surface().get_size()
-            touch_x = event.x * display_size[0]
-            touch_y = event.y * display_size[1]
+            # タッチ位置のスクリーン座標（InputDispatcher を通ったイベントは変換済み）
+            touch_x, touch_y = get_event_pos(event)
             
             # ボタンの領域内かチェック
             if self.rect.collidepoint(touch_x, touch_y):
@@ -122,6 +187,35 @@ class Button:
         
         return False
     
+    def _get_visual_state(self):
+        """
+        見た目に影響する状態を取得する
+        
+        Returns:
+            tuple: 見た目の状態
+        """
+        return (self.is_hovered, self._get_scale_step(), self.text, self.color, self.hover_color, self.text_color)
+    
+    def _get_scale_step(self):
+        """
+        拡大率を刻み幅で量子化した段階を取得する
+        
+        Returns:
+            int: 拡大率の段階（1.0 のとき 0）
+        """
+        return round((self.draw_scale - 1.0) / self.SCALE_STEP)
+    
+    def get_dirty_rect(self):
+        """
+        前回の描画から見た目が変化した場合に再描画が必要な領域を取得する
+        
+        Returns:
+            pygame.Rect: 再描画が必要な領域（拡大アニメーション分を含む）、または変化がない場合は None
+        """
+        if self.drawn_state == self._get_visual_state():
+            return None
+        return self.rect.inflate(self.rect.width // 10 + 2, self.rect.height // 10 + 2)
+    
     def draw(self, screen):
         """
         ボタンを描画する
@@ -129,19 +223,42 @@ class Button:
         Args:
             screen: 描画対象の画面
         """
+        self.drawn_state = self._get_visual_state()
+        
+        # 状態と拡大率の段階ごとに一度だけ描画する
+        visual_key = (self.is_hovered, self._get_scale_step())
+        visual = self.visual_cache.get(visual_key)
+        if visual is None:
+            visual = self._render_visual(visual_key[0], 1.0 + visual_key[1] * self.SCALE_STEP)
+            self.visual_cache[visual_key] = visual
+        
+        screen.blit(visual, visual.get_rect(center=self.rect.center))
+    
+    def _render_visual(self, is_hovered, scale):
+        """
+        ボタンの見た目をサーフェスに描画する
+        
+        Args:
+            is_hovered (bool): ホバー状態かどうか
+            scale (float): 拡大率
+            
+        Returns:
+            pygame.Surface: ボタンの見た目
+        """
         # ボタンの拡大縮小を適用
-        scaled_rect = pygame.Rect(
-            self.rect.x - (self.rect.width * (self.scale - 1)) / 2,
-            self.rect.y - (self.rect.height * (self.scale - 1)) / 2,
-            self.rect.width * self.scale,
-            self.rect.height * self.scale
+        visual = pygame.Surface(
+            (round(self.rect.width * scale), round(self.rect.height * scale)),
+            pygame.SRCALPHA
         )
+        visual_rect = visual.get_rect()
         
         # ボタンの背景を描画
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, scaled_rect, border_radius=self.border_radius)
+        color = self.hover_color if is_hovered else self.color
+        pygame.draw.rect(visual, color, visual_rect, border_radius=scaled(self.border_radius))
         
         # テキストを描画
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=scaled_rect.center)
-        screen.blit(text_surface, text_rect)
+        text_surface = self.font_manager.render_cached(self.text, self.font_size, self.text_color)
+        text_rect = text_surface.get_rect(center=visual_rect.center)
+        visual.blit(text_surface, text_rect)
+        track_surface(visual, CATEGORY_BUTTONS)
+        return visual
@@ -7,36 +7,37 @@
 
 import pygame
 from ui.button import Button
+from ui.screen_manager import ScreenManager
 from utils.font_manager import FontManager
+from utils.render_target import scaled
 
 class DifficultySelectScreen:
     """難易度選択画面クラス"""
     
-    def __init__(self, screen, game_manager, previous_screen):
+    def __init__(self, screen, game_manager):
         """
         難易度選択画面を初期化する
         
         Args:
             screen: 描画対象の画面
             game_manager: ゲームマネージャー
-            previous_screen: 前の画面
         """
         self.screen = screen
         self.game_manager = game_manager
-        self.previous_screen = previous_screen
-        self.next_screen = None
+        self.screen_manager = ScreenManager.get_instance()
         
         # 画面サイズを取得
         self.width, self.height = self.screen.get_size()
         
         # フォント
-        self.title_font = FontManager.get_instance().get_font(48)
-        self.description_font = FontManager.get_instance().get_font(24)
-        
-        # 難易度ボタンの作成
-        button_width = 300
-        button_height = 80
-        button_margin = 30
+        self.font_manager = FontManager.get_instance()
+        self.title_font_size = 48
+        self.description_font_size = 24
+        
+        # 難易度ボタンの作成（レイアウトの数値は基準解像度でのピクセル数）
+        button_width = scaled(300)
+        button_height = scaled(80)
+        button_margin = scaled(30)
         start_y = self.height // 2 - (button_height * 3 + button_margin * 2) // 2
         
         # かんたんボタン
@@ -77,10 +78,10 @@ class DifficultySelectScreen:
         
         # 戻るボタン
         self.back_button = Button(
-            50,
-            self.height - 80,
-            120,
-            50,
+            scaled(50),
+            self.height - scaled(80),
+            scaled(120),
+            scaled(50),
             "もどる",
             font_size=32,
             color=(100, 100, 100),
@@ -89,9 +90,18 @@ class DifficultySelectScreen:
         
         # 現在の難易度を強調表示
         self._highlight_current_difficulty()
+
+        # 差分描画用の状態（最初は画面全体を描画する）
+        # 変化した領域は差分描画モードのときだけ記録する（Game が dirty_rect_tracking を設定する）
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.dirty_rect_tracking = False
     
     def _highlight_current_difficulty(self):
         """現在の難易度ボタンを強調表示する"""
+        # 強調表示と説明文が変わるため画面全体を再描画する
+        self.full_redraw = True
+        
         # すべてのボタンを通常の色に戻す
         self.easy_button.color = (46, 139, 87)
         self.normal_button.color = (70, 130, 180)
@@ -105,6 +115,10 @@ class DifficultySelectScreen:
         elif self.game_manager.difficulty == "hard":
             self.hard_button.color = (220, 20, 60)
     
+    def on_enter(self):
+        """画面に入ったときに、再利用した画面の強調表示を現在の難易度に合わせる"""
+        self._highlight_current_difficulty()
+    
     def handle_event(self, event):
         """
         イベントを処理する
@@ -129,7 +143,7 @@ class DifficultySelectScreen:
         
         # 戻るボタンのイベント処理
         elif self.back_button.handle_event(event):
-            self.next_screen = self.previous_screen
+            self.screen_manager.pop()
     
     def update(self):
         """画面の状態を更新する"""
@@ -146,8 +160,8 @@ class DifficultySelectScreen:
         
         # タイトルを描画
         title_text = "むずかしさを えらぶ"
-        title_surface = self.title_font.render(title_text, True, (0, 0, 0))
-        title_rect = title_surface.get_rect(center=(self.width // 2, 70))
+        title_surface = self.font_manager.render_cached(title_text, self.title_font_size, (0, 0, 0))
+        title_rect = title_surface.get_rect(center=(self.width // 2, scaled(70)))
         self.screen.blit(title_surface, title_rect)
         
         # 難易度の説明
@@ -159,8 +173,8 @@ class DifficultySelectScreen:
         
         # 現在選択されている難易度の説明を表示
         desc_text = descriptions.get(self.game_manager.difficulty, "")
-        desc_surface = self.description_font.render(desc_text, True, (0, 0, 0))
-        desc_rect = desc_surface.get_rect(center=(self.width // 2, 120))
+        desc_surface = self.font_manager.render_cached(desc_text, self.description_font_size, (0, 0, 0))
+        desc_rect = desc_surface.get_rect(center=(self.width // 2, scaled(120)))
         self.screen.blit(desc_surface, desc_rect)
         
         # ボタンを描画
@@ -170,9 +184,9 @@ class DifficultySelectScreen:
         self.back_button.draw(self.screen)
         
         # 選択中の難易度に黄色い枠を描画（角を丸く）
-        border_width = 5
-        padding = 15  # ボタンと枠の間の余白
-        border_radius = 15  # 角の丸みの半径
+        border_width = scaled(5)
+        padding = scaled(15)  # ボタンと枠の間の余白
+        border_radius = scaled(15)  # 角の丸みの半径
         if self.game_manager.difficulty == "easy":
             pygame.draw.rect(self.screen, (255, 255, 0), self.easy_button.rect.inflate(padding*2, padding*2), border_width, border_radius=border_radius)
         elif self.game_manager.difficulty == "normal":
@@ -180,13 +194,40 @@ class DifficultySelectScreen:
         elif self.game_manager.difficulty == "hard":
             pygame.draw.rect(self.screen, (255, 255, 0), self.hard_button.rect.inflate(padding*2, padding*2), border_width, border_radius=border_radius)
     
-    def get_next_screen(self):
+    def get_widgets(self):
+        """
+        操作できる部品を取得する（InputDispatcher がホバー状態の判定に使用）
+        
+        Returns:
+            list: ボタンのリスト
+        """
+        return [self.easy_button, self.normal_button, self.hard_button, self.back_button]
+    
+    def is_animating(self):
+        """
+        アニメーション中かどうかを確認する（メインループがアイドル時の間引きに使用）
+        
+        Returns:
+            bool: ボタンがアニメーション中の場合は True
+        """
+        return any(button.is_animating() for button in self.get_widgets())
+    
+    def get_dirty_rects(self):
         """
-        次の画面を取得する
+        前回の描画から変化した領域を取得する（差分描画モードで使用）
         
         Returns:
-            次の画面、または None
+            list: 再描画が必要な矩形のリスト、または画面全体の再描画が必要な場合は None
         """
-        next_screen = self.next_screen
-        self.next_screen = None
-        return next_screen
\ No newline at end of file
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects = []
+            return None
+        
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        for button in self.get_widgets():
+            button_rect = button.get_dirty_rect()
+            if button_rect:
+                dirty_rects.append(button_rect)
+        return dirty_rects
\ No newline at end of file
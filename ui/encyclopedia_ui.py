@@ -7,7 +7,9 @@
 
 import pygame
 from ui.button import Button
+from ui.screen_manager import ScreenManager
 from utils.font_manager import FontManager
+from utils.render_target import scaled
 
 class EncyclopediaScreen:
     """図鑑画面クラス"""
@@ -22,21 +24,22 @@ class EncyclopediaScreen:
         """
         self.screen = screen
         self.game_manager = game_manager
-        self.next_screen = None
+        self.screen_manager = ScreenManager.get_instance()
         
         # 画面サイズを取得
         self.width, self.height = self.screen.get_size()
         
         # フォント
-        self.title_font = FontManager.get_instance().get_font(48)
+        self.font_manager = FontManager.get_instance()
+        self.title_font_size = 48
         self.info_font = FontManager.get_instance().get_font(24)
         
-        # 戻るボタン
+        # 戻るボタン（レイアウトの数値は基準解像度でのピクセル数）
         self.back_button = Button(
-            50,
-            self.height - 80,
-            120,
-            50,
+            scaled(50),
+            self.height - scaled(80),
+            scaled(120),
+            scaled(50),
             "もどる",
             font_size=32,
             color=(100, 100, 100),
@@ -55,8 +58,7 @@ class EncyclopediaScreen:
         """
         # 戻るボタンのイベント処理
         if self.back_button.handle_event(event):
-            from ui.menu import MainMenu
-            self.next_screen = MainMenu(self.screen, self.game_manager)
+            self.screen_manager.pop()
     
     def update(self):
         """画面の状態を更新する"""
@@ -70,32 +72,21 @@ class EncyclopediaScreen:
         
         # タイトルを描画
         title_text = "ずかん"
-        title_surface = self.title_font.render(title_text, True, (0, 0, 0))
-        title_rect = title_surface.get_rect(center=(self.width // 2, 50))
+        title_surface = self.font_manager.render_cached(title_text, self.title_font_size, (0, 0, 0))
+        title_rect = title_surface.get_rect(center=(self.width // 2, scaled(50)))
         self.screen.blit(title_surface, title_rect)
         
         # 開発中メッセージ
         if self.under_development:
             dev_text = "この機能は現在開発中です"
-            dev_surface = self.title_font.render(dev_text, True, (200, 0, 0))
+            dev_surface = self.font_manager.render_cached(dev_text, self.title_font_size, (200, 0, 0))
             dev_rect = dev_surface.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(dev_surface, dev_rect)
             
             coming_text = "Coming Soon!"
-            coming_surface = self.title_font.render(coming_text, True, (0, 0, 200))
-            coming_rect = coming_surface.get_rect(center=(self.width // 2, self.height // 2 + 60))
+            coming_surface = self.font_manager.render_cached(coming_text, self.title_font_size, (0, 0, 200))
+            coming_rect = coming_surface.get_rect(center=(self.width // 2, self.height // 2 + scaled(60)))
             self.screen.blit(coming_surface, coming_rect)
         
         # 戻るボタンを描画
         self.back_button.draw(self.screen)
-    
-    def get_next_screen(self):
-        """
-        次の画面を取得する
-        
-        Returns:
-            次の画面、または None
-        """
-        next_screen = self.next_screen
-        self.next_screen = None
-        return next_screen
@@ -7,13 +7,37 @@
 
 import pygame
 from ui.button import Button
-from ui.game_screen import GameScreen
+from ui.screen_manager import ScreenManager
 from utils.font_manager import FontManager
+from utils.render_target import scaled
 from utils.resource_loader import ResourceLoader
+from utils.surface_tracker import track_surface, CATEGORY_OVERLAYS
 
 class EnvironmentSelectScreen:
     """環境選択画面クラス"""
     
+    # 環境の一覧
+    ENVIRONMENTS = ["jungle", "ocean", "desert", "forest"]
+    
+    # 環境ボタン（サムネイル画像）のサイズ（基準解像度）
+    THUMBNAIL_SIZE = (200, 150)
+    
+    @classmethod
+    def preload_thumbnails(cls, resource_loader):
+        """
+        環境のサムネイル画像を先読みする
+        
+        Args:
+            resource_loader: リソースローダー
+            
+        Returns:
+            PreloadTask: 先読みの進捗
+        """
+        return resource_loader.preload_images([
+            (resource_loader.get_background_image_path(environment), scaled(cls.THUMBNAIL_SIZE), False)
+            for environment in cls.ENVIRONMENTS
+        ])
+    
     def __init__(self, screen, game_manager):
         """
         環境選択画面を初期化する
@@ -24,13 +48,14 @@ class EnvironmentSelectScreen:
         """
         self.screen = screen
         self.game_manager = game_manager
-        self.next_screen = None
+        self.screen_manager = ScreenManager.get_instance()
         
         # 画面サイズを取得
         self.width, self.height = self.screen.get_size()
         
         # フォント
-        self.title_font = FontManager.get_instance().get_font(48)
+        self.font_manager = FontManager.get_instance()
+        self.title_font_size = 48
         self.description_font = FontManager.get_instance().get_font(24)
         
         # リソースローダー
@@ -39,24 +64,29 @@ class EnvironmentSelectScreen:
         # 背景画像はダミーで代用
         self.background_image = None
         
-        # 環境ボタンの作成
-        button_width = 200
-        button_height = 150
-        button_margin = 30
+        # 環境ボタンの作成（レイアウトの数値は基準解像度でのピクセル数）
+        button_width, button_height = scaled(self.THUMBNAIL_SIZE)
+        button_margin = scaled(30)
         start_x = self.width // 2 - (button_width * 2 + button_margin) // 2
         start_y = self.height // 2 - (button_height * 2 + button_margin) // 2
         
         # 環境のサムネイル画像
         self.environment_thumbnails = {
-            "jungle": self.resource_loader.load_background_image("jungle", (button_width, button_height)),
-            "ocean": self.resource_loader.load_background_image("ocean", (button_width, button_height)),
-            "desert": self.resource_loader.load_background_image("desert", (button_width, button_height)),
-            "forest": self.resource_loader.load_background_image("forest", (button_width, button_height))
+            "jungle": self.resource_loader.load_background_image("jungle", (button_width, button_height), owner=self),
+            "ocean": self.resource_loader.load_background_image("ocean", (button_width, button_height), owner=self),
+            "desert": self.resource_loader.load_background_image("desert", (button_width, button_height), owner=self),
+            "forest": self.resource_loader.load_background_image("forest", (button_width, button_height), owner=self)
         }
         
         # ロックアイコンはダミーで代用
         self.lock_icon = None
         
+        # ボタンのテキストの半透明の背景（サイズ → サーフェス）
+        self.text_backgrounds = {}
+        
+        # ロックされた環境のボタンに重ねる半透明のオーバーレイ（サイズ → サーフェス）
+        self.lock_overlays = {}
+        
         # ジャングルボタン
         self.jungle_button = Button(
             start_x,
@@ -107,10 +137,10 @@ class EnvironmentSelectScreen:
         
         # 戻るボタン
         self.back_button = Button(
-            50,
-            self.height - 80,
-            120,
-            50,
+            scaled(50),
+            self.height - scaled(80),
+            scaled(120),
+            scaled(50),
             "もどる",
             font_size=32,
             color=(100, 100, 100),
@@ -130,10 +160,10 @@ class EnvironmentSelectScreen:
         }
         
         self.difficulty_button = Button(
-            self.width - 170,
-            self.height - 80,
-            150,
-            50,
+            self.width - scaled(170),
+            self.height - scaled(80),
+            scaled(150),
+            scaled(50),
             self._get_difficulty_text(),
             font_size=28,
             color=difficulty_colors.get(self.game_manager.difficulty, (70, 130, 180)),
@@ -147,6 +177,26 @@ class EnvironmentSelectScreen:
             "desert": False,
             "forest": False
         }
+        
+        # 差分描画用の状態（最初は画面全体を描画する）
+        # 変化した領域は差分描画モードのときだけ記録する（Game が dirty_rect_tracking を設定する）
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.dirty_rect_tracking = False
+        
+        # ステージで使う画像の先読み（難易度が変わったら読み直す）
+        self.preload_tasks = {}
+        self.preloaded_difficulty = None
+        self._preload_stages()
+    
+    def _preload_stages(self):
+        """現在の難易度で各ステージの画像を先読みする"""
+        self.preloaded_difficulty = self.game_manager.difficulty
+        self.preload_tasks = {
+            environment: self.resource_loader.preload(environment, self.preloaded_difficulty)
+            for environment in self.ENVIRONMENTS
+            if not self.environment_locked[environment]
+        }
     
     def handle_event(self, event):
         """
@@ -157,33 +207,40 @@ class EnvironmentSelectScreen:
         """
         # ジャングルボタンのイベント処理
         if not self.environment_locked["jungle"] and self.jungle_button.handle_event(event):
-            self.game_manager.select_environment("jungle")
-            self.next_screen = GameScreen(self.screen, self.game_manager)
+            self._start_game("jungle")
         
         # 海ボタンのイベント処理
         elif not self.environment_locked["ocean"] and self.ocean_button.handle_event(event):
-            self.game_manager.select_environment("ocean")
-            self.next_screen = GameScreen(self.screen, self.game_manager)
+            self._start_game("ocean")
         
         # 砂漠ボタンのイベント処理
         elif not self.environment_locked["desert"] and self.desert_button.handle_event(event):
-            self.game_manager.select_environment("desert")
-            self.next_screen = GameScreen(self.screen, self.game_manager)
+            self._start_game("desert")
         
         # 森ボタンのイベント処理
         elif not self.environment_locked["forest"] and self.forest_button.handle_event(event):
-            self.game_manager.select_environment("forest")
-            self.next_screen = GameScreen(self.screen, self.game_manager)
+            self._start_game("forest")
         
         # 難易度ボタンのイベント処理
         elif self.difficulty_button.handle_event(event):
             from ui.difficulty_select import DifficultySelectScreen
-            self.next_screen = DifficultySelectScreen(self.screen, self.game_manager, self)
+            self.screen_manager.push(DifficultySelectScreen)
         
         # 戻るボタンのイベント処理
         elif self.back_button.handle_event(event):
-            from ui.menu import MainMenu
-            self.next_screen = MainMenu(self.screen, self.game_manager)
+            self.screen_manager.pop()
+    
+    def _start_game(self, environment):
+        """
+        環境を選択してゲーム画面に切り替える
+        
+        Args:
+            environment (str): 環境（"jungle", "ocean"など）
+        """
+        from ui.game_screen import GameScreen
+        self.game_manager.select_environment(environment)
+        # ゲーム画面は毎回カードを配り直すため再利用しない
+        self.screen_manager.push(GameScreen, cache=False)
     
     def update(self):
         """画面の状態を更新する"""
@@ -195,6 +252,10 @@ class EnvironmentSelectScreen:
         self.back_button.update()
         self.difficulty_button.update()
         
+        # 難易度が変わった場合は先読みし直す
+        if self.preloaded_difficulty != self.game_manager.difficulty:
+            self._preload_stages()
+        
         # 難易度ボタンのテキストと色を更新
         self.difficulty_button.text = self._get_difficulty_text()
         
@@ -224,8 +285,8 @@ class EnvironmentSelectScreen:
         
         # タイトルを描画
         title_text = "どこであそぶ？"
-        title_surface = self.title_font.render(title_text, True, (0, 0, 0))
-        title_rect = title_surface.get_rect(center=(self.width // 2, 70))
+        title_surface = self.font_manager.render_cached(title_text, self.title_font_size, (0, 0, 0))
+        title_rect = title_surface.get_rect(center=(self.width // 2, scaled(70)))
         self.screen.blit(title_surface, title_rect)
         
         # ボタンを描画
@@ -275,14 +336,17 @@ class EnvironmentSelectScreen:
             button: ボタンオブジェクト
             text: 表示するテキスト
         """
-        font = FontManager.get_instance().get_font(36)
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = self.font_manager.render_cached(text, 36, (255, 255, 255))
         text_rect = text_surface.get_rect(center=button.rect.center)
         
-        # テキストの背景を半透明にして読みやすくする
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 128))
+        # テキストの背景を半透明にして読みやすくする（サイズごとに一度だけ作成する）
+        bg_rect = text_rect.inflate(scaled(20), scaled(10))
+        bg_surface = self.text_backgrounds.get(bg_rect.size)
+        if bg_surface is None:
+            bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+            bg_surface.fill((0, 0, 0, 128))
+            self.text_backgrounds[bg_rect.size] = bg_surface
+            track_surface(bg_surface, CATEGORY_OVERLAYS, owner=self)
         self.screen.blit(bg_surface, bg_rect)
         
         # テキストを描画
@@ -295,9 +359,13 @@ class EnvironmentSelectScreen:
         Args:
             rect: ボタンの矩形
         """
-        # 半透明の黒いオーバーレイ
-        overlay = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
+        # 半透明の黒いオーバーレイ（サイズごとに一度だけ作成する）
+        overlay = self.lock_overlays.get(rect.size)
+        if overlay is None:
+            overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 128))
+            self.lock_overlays[rect.size] = overlay
+            track_surface(overlay, CATEGORY_OVERLAYS, owner=self)
         self.screen.blit(overlay, rect)
         
         # ロックアイコンを描画
@@ -308,8 +376,8 @@ class EnvironmentSelectScreen:
         else:
             # ロックアイコンがない場合は簡易的に描画
             lock_color = (255, 255, 255)
-            lock_width = 40
-            lock_height = 50
+            lock_width = scaled(40)
+            lock_height = scaled(50)
             lock_x = rect.centerx - lock_width // 2
             lock_y = rect.centery - lock_height // 2
             
@@ -317,28 +385,62 @@ class EnvironmentSelectScreen:
             pygame.draw.rect(
                 self.screen, 
                 lock_color, 
-                (lock_x, lock_y + 15, lock_width, lock_height - 15),
-                border_radius=5
+                (lock_x, lock_y + scaled(15), lock_width, lock_height - scaled(15)),
+                border_radius=scaled(5)
             )
             
             # 南京錠の上部（弧）
             pygame.draw.arc(
                 self.screen,
                 lock_color,
-                (lock_x + 5, lock_y - 10, lock_width - 10, 30),
-                3.14, 0, 3
+                (lock_x + scaled(5), lock_y - scaled(10), lock_width - scaled(10), scaled(30)),
+                3.14, 0, scaled(3)
             )
     
-    def get_next_screen(self):
+    def get_widgets(self):
+        """
+        操作できる部品を取得する（InputDispatcher がホバー状態の判定に使用）
+        
+        Returns:
+            list: ボタンのリスト
+        """
+        return [
+            self.jungle_button,
+            self.ocean_button,
+            self.desert_button,
+            self.forest_button,
+            self.back_button,
+            self.difficulty_button
+        ]
+    
+    def is_animating(self):
+        """
+        アニメーション中かどうかを確認する（メインループがアイドル時の間引きに使用）
+        
+        Returns:
+            bool: ボタンがアニメーション中の場合は True
+        """
+        return any(button.is_animating() for button in self.get_widgets())
+    
+    def get_dirty_rects(self):
         """
-        次の画面を取得する
+        前回の描画から変化した領域を取得する（差分描画モードで使用）
         
         Returns:
-            次の画面、または None
+            list: 再描画が必要な矩形のリスト、または画面全体の再描画が必要な場合は None
         """
-        next_screen = self.next_screen
-        self.next_screen = None
-        return next_screen
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects = []
+            return None
+        
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        for button in self.get_widgets():
+            button_rect = button.get_dirty_rect()
+            if button_rect:
+                dirty_rects.append(button_rect)
+        return dirty_rects
     def _get_difficulty_text(self):
         """
         現在の難易度に応じたテキストを取得する
@@ -351,4 +453,10 @@ class EnvironmentSelectScreen:
             "normal": "ふつう",
             "hard": "むずかしい"
         }
-        return difficulty_texts.get(self.game_manager.difficulty, "かんたん")
\ No newline at end of file
+        if self.game_manager.difficulty in difficulty_texts:
+            return difficulty_texts[self.game_manager.difficulty]
+        
+        # 難易度選択画面にない難易度（ジャンボなど）は設定の名前を使う
+        from utils.config_loader import ConfigLoader
+        difficulty_config = ConfigLoader.get_instance().get_difficulty_config(self.game_manager.difficulty)
+        return difficulty_config.get("name", "かんたん")
\ No newline at end of file
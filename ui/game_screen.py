@@ -7,9 +7,14 @@
 
 import pygame
 from ui.button import Button
+from ui.screen_manager import ScreenManager
 from utils.font_manager import FontManager
+from utils.game_clock import GameClock
+from utils.render_target import scaled
 from utils.resource_loader import ResourceLoader
+from utils.surface_tracker import track_surface, CATEGORY_OVERLAYS
 from utils.config_loader import ConfigLoader
+from game.card import Card, CardGrid
 
 class GameScreen:
     """ゲーム画面クラス（神経衰弱ゲーム）"""
@@ -24,13 +29,14 @@ class GameScreen:
         """
         self.screen = screen
         self.game_manager = game_manager
-        self.next_screen = None
+        self.screen_manager = ScreenManager.get_instance()
         
         # 画面サイズを取得
         self.width, self.height = self.screen.get_size()
         
         # フォント
-        self.title_font = FontManager.get_instance().get_font(36)
+        self.font_manager = FontManager.get_instance()
+        self.title_font_size = 36
         self.info_font = FontManager.get_instance().get_font(24)
         
         # リソースローダー
@@ -39,68 +45,82 @@ class GameScreen:
         # 設定ローダー
         self.config_loader = ConfigLoader.get_instance()
         
+        # ゲーム時間（待機時間を実際の経過時間で進める）
+        self.game_clock = GameClock.get_instance()
+        
         # 選択された環境
         self.environment = self.game_manager.current_environment
         
         # 背景画像の読み込み
         self.background_image = self.resource_loader.load_background_image(
             self.environment, 
-            (self.width, self.height)
+            (self.width, self.height),
+            owner=self
         )
         
-        # 戻るボタン
+        # 戻るボタン（レイアウトの数値は基準解像度でのピクセル数）
         self.back_button = Button(
-            50,
-            self.height - 100,
-            120,
-            50,
+            scaled(50),
+            self.height - scaled(100),
+            scaled(120),
+            scaled(50),
             "もどる",
             font_size=32,
             color=(100, 100, 100),
             hover_color=(130, 130, 130)
         )
         
+        # もういっかいボタン（ゲームオーバー時だけ表示する）
+        self.replay_button = Button(
+            self.width // 2 - scaled(120),
+            self.height // 2 + scaled(30),
+            scaled(240),
+            scaled(70),
+            "もういっかい",
+            font_size=36,
+            color=(46, 139, 87),
+            hover_color=(60, 179, 113)
+        )
+        
         # カードの初期化
         self.initialize_cards()
         
+        # 変化した領域は差分描画モードのときだけ記録する（Game が設定する）
+        self.dirty_rect_tracking = False
+        
         # ゲーム状態
-        self.first_card = None
-        self.second_card = None
-        self.wait_time = 0
-        self.is_match = False  # カードが一致したかどうか
-        self.matched_pairs = 0
-        self.total_pairs = len(self.cards) // 2
-        self.game_over = False
+        self._reset_game_state()
+        self.game_over_overlay = None
+        
+        # 「もういっかい」をタッチで押した後、同じタップから作られたマウスのクリックを無視するかどうか
+        self.ignore_touch_click = False
         
         # 環境に応じた背景色（背景画像がない場合のフォールバック）
         from game.environment import Environment
         self.background_color = Environment.get_background_color(self.environment)
+        
+        # 環境名のタイトル（毎フレーム描画するため一度だけ作成する）
+        title_text = f"{Environment.get_name(self.environment)}で あそぶ"
+        self.title_surface = self.font_manager.render_cached(title_text, self.title_font_size, (255, 255, 255))
+        self.title_rect = self.title_surface.get_rect(center=(self.width // 2, scaled(40)))
     
     def initialize_cards(self):
-        """カードを初期化する"""
+        """カードの配置・キャラクターの候補・アトラスを用意してカードを配る"""
         # 難易度設定を取得
         difficulty_config = self.config_loader.get_difficulty_config(self.game_manager.difficulty)
         
-        # 難易度に応じたカードの配置
-        rows = difficulty_config.get("rows", 2)
-        cols = difficulty_config.get("cols", 3)
-        pairs_count = difficulty_config.get("pairs_count", 3)
-        
-        # 難易度に応じてカードのサイズと間隔を調整
-        card_width = difficulty_config.get("card_width", 140)
-        card_height = difficulty_config.get("card_height", 200)
-        margin = difficulty_config.get("margin", 30)
+        self.pairs_count = difficulty_config.get("pairs_count", 3)
         
-        # カードの配置開始位置
-        start_x = (self.width - (cols * card_width + (cols - 1) * margin)) // 2
-        start_y = (self.height - (rows * card_height + (rows - 1) * margin)) // 2
+        # 難易度に応じたカードの配置（サイズの指定がなければ画面に収まるサイズにする）
+        self.card_grid = CardGrid.from_difficulty(difficulty_config, (self.width, self.height))
+        card_size = self.card_grid.card_size
         
-        # 環境と難易度に応じたキャラクターを取得
+        # 環境と難易度に応じたキャラクターを取得（足りない場合は他の環境からも選ぶ）
         from game.character import Character
-        characters = Character.get_characters_by_environment(self.environment, self.game_manager.difficulty)
+        characters = Character.get_stage_characters(self.environment, self.game_manager.difficulty)
         
         # キャラクターが足りない場合は同じキャラクターを複数回使用
-        while len(characters) < pairs_count:
+        while len(characters) < self.pairs_count:
             # 既存のキャラクターを複製して追加
             if len(characters) > 0:
                 characters.append(characters[0])  # 最初のキャラクターを再利用
@@ -108,65 +128,105 @@ class GameScreen:
                 # 万が一キャラクターがない場合はデフォルトを使用
                 characters = ["dolphin", "whale", "turtle"]
         
-        # 使用するキャラクターを選択（重複なし）
-        import random
-        selected_characters = random.sample(characters, pairs_count)
+        # キャラクターの候補（「もういっかい」で配り直すときもここから選ぶ）
+        self.characters = characters
+        self.selected_characters = None
         
-        # カードの位置を作成
-        positions = []
-        if self.game_manager.difficulty == "hard":
-            # むずかしいモードでは最後の行の列数が異なる場合がある
-            last_row_cols = difficulty_config.get("last_row_cols", cols)
-            
-            for i in range(rows):
-                row_cols = last_row_cols if i == rows - 1 and last_row_cols != cols else cols
-                row_start_x = (self.width - (row_cols * card_width + (row_cols - 1) * margin)) // 2
-                for j in range(row_cols):
-                    x = row_start_x + j * (card_width + margin)
-                    y = start_y + i * (card_height + margin)
-                    positions.append((x, y))
-        else:
-            # かんたん・ふつうモードは通常の配置
-            for i in range(rows):
-                for j in range(cols):
-                    x = start_x + j * (card_width + margin)
-                    y = start_y + i * (card_height + margin)
-                    positions.append((x, y))
+        # カード表面と裏面を1枚にまとめたアトラスを読み込む（候補のキャラクターをすべて含む）
+        from game.environment import Environment
+        self.card_atlas = self.resource_loader.load_card_atlas(
+            self.environment,
+            characters,
+            card_size,
+            owner=self
+        )
+        self.card_backs = Environment.get_card_backs(self.environment)
+        
+        # マッチしたカード用の半透明のアトラス（最初にマッチしたときに取得する）
+        self.faded_atlas_surface = None
         
-        # 位置をシャッフル
-        random.shuffle(positions)
+        # カードを描画する blit のリスト（カードの状態が変わったときだけ作り直す）
+        self.card_blits = None
         
         # カードの作成
         self.cards = []
+        self.deal_cards()
+    
+    def deal_cards(self, resample=True):
+        """
+        カードを配る
         
-        # 各キャラクターについて2枚ずつカードを作成
-        for character in selected_characters:
-            for _ in range(2):  # 各キャラクター2枚ずつ
-                if positions:
-                    x, y = positions.pop(0)
-                    
-                    # カード画像の読み込み
-                    card_back_image = self.resource_loader.load_card_image(
-                        character, 
-                        flipped=True, 
-                        scale=(card_width, card_height),
-                        environment=self.environment
-                    )
-                    
-                    card_front_image = self.resource_loader.load_card_image(
-                        character, 
-                        flipped=False, 
-                        scale=(card_width, card_height)
-                    )
-                    
-                    self.cards.append({
-                        "rect": pygame.Rect(x, y, card_width, card_height),
-                        "type": character,
-                        "flipped": False,
-                        "matched": False,
-                        "back_image": card_back_image,
-                        "front_image": card_front_image
-                    })
+        2回目以降は作成済みのカードとアトラスをそのまま使い、キャラクターと位置だけを決め直す。
+        
+        Args:
+            resample (bool): キャラクターを候補から選び直すかどうか（False の場合は同じキャラクターで並べ直す）
+        """
+        import random
+        
+        # 使用するキャラクターを選択（重複なし）
+        if resample or self.selected_characters is None:
+            self.selected_characters = random.sample(self.characters, self.pairs_count)
+        
+        # 配置するセルをシャッフル
+        cells = self.card_grid.get_cells()
+        random.shuffle(cells)
+        
+        # 各キャラクターについて2枚ずつ（セルが足りない分は配らない）
+        card_types = [character for character in self.selected_characters for _ in range(2)]
+        card_types = card_types[:len(cells)]
+        while len(self.cards) < len(card_types):
+            self.cards.append(Card(None, None, 0, 0))
+        
+        # カードを配らないセルに前回のカードが残らないよう、配置を空にしてから並べる
+        self.card_grid.clear()
+        
+        for card, card_type, (row, col) in zip(self.cards, card_types, cells):
+            card.type = card_type
+            card.row = row
+            card.col = col
+            card.rect = self.card_grid.get_cell_rect(row, col)
+            card.flipped = False
+            card.matched = False
+            
+            # アトラス内の領域（裏面は環境に応じてランダムに選択）
+            back_key = ("back", random.choice(self.card_backs))
+            front_key = ("front", card_type)
+            card.back_area, back_offset = self.card_atlas.get_trimmed_area(back_key)
+            card.front_area, front_offset = self.card_atlas.get_trimmed_area(front_key)
+            card.back_pos = (card.rect.x + back_offset[0], card.rect.y + back_offset[1])
+            card.front_pos = (card.rect.x + front_offset[0], card.rect.y + front_offset[1])
+            card.back_image = self.card_atlas.get_subsurface(back_key)
+            card.front_image = self.card_atlas.get_subsurface(front_key)
+            
+            self.card_grid.place(card)
+        
+        self.card_blits = None
+    
+    def redeal(self, resample=True):
+        """
+        同じ画面のままカードを配り直して、もう一度遊べるようにする
+        
+        背景・アトラス・カードの配置は読み込み済みのものを使う。
+        
+        Args:
+            resample (bool): キャラクターを候補から選び直すかどうか
+        """
+        self.deal_cards(resample)
+        self._reset_game_state()
+    
+    def _reset_game_state(self):
+        """ゲームの進行状態を最初の状態に戻す"""
+        self.first_card = None
+        self.second_card = None
+        self.wait_steps = 0  # 待機時間の残り（ゲーム時間の刻みの数）
+        self.is_match = False  # カードが一致したかどうか
+        self.matched_pairs = 0
+        self.total_pairs = len(self.cards) // 2
+        self.game_over = False
+        
+        # 差分描画用の状態（最初は画面全体を描画する）
+        self.full_redraw = True
+        self.dirty_rects = []
     
     def handle_event(self, event):
         """
@@ -175,21 +235,31 @@ class GameScreen:
         Args:
             event: pygameのイベント
         """
-        # ゲームオーバー時は戻るボタンのみ有効
+        # タッチで配り直した直後は、同じタップから作られたクリックで新しいカードをめくらない
+        # （次のタップが始まったら、クリックが作られない環境でも無視をやめる）
+        if self.ignore_touch_click:
+            if event.type == pygame.MOUSEBUTTONDOWN and getattr(event, "touch", False):
+                self.ignore_touch_click = False
+                return
+            if event.type == pygame.FINGERDOWN:
+                self.ignore_touch_click = False
+        
+        # ゲームオーバー時は戻るボタンともういっかいボタンのみ有効
         if self.game_over:
             if self.back_button.handle_event(event):
-                from ui.environment_select import EnvironmentSelectScreen
-                self.next_screen = EnvironmentSelectScreen(self.screen, self.game_manager)
+                self.screen_manager.pop()
+            elif self.replay_button.handle_event(event):
+                self.ignore_touch_click = event.type == pygame.FINGERDOWN
+                self.redeal()
             return
         
         # 待機時間中は入力を無視
-        if self.wait_time > 0:
+        if self.wait_steps > 0:
             return
         
         # 戻るボタンのイベント処理
         if self.back_button.handle_event(event):
-            from ui.environment_select import EnvironmentSelectScreen
-            self.next_screen = EnvironmentSelectScreen(self.screen, self.game_manager)
+            self.screen_manager.pop()
             return  # 戻るボタンをクリックした場合は、カードの処理をスキップ
         
         # カードクリックの処理
@@ -198,72 +268,78 @@ class GameScreen:
             if self.first_card is not None and self.second_card is not None:
                 return
             
-            # クリックされたカードを探す
-            for i, card in enumerate(self.cards):
-                if card["rect"].collidepoint(event.pos) and not card["flipped"] and not card["matched"]:
-                    # すでに選択されているカードは選択できない
-                    if self.first_card == i:
-                        return
-                    
-                    # カードをめくる
-                    card["flipped"] = True
-                    
-                    # 1枚目のカード
-                    if self.first_card is None:
-                        self.first_card = i
-                    # 2枚目のカード
-                    elif self.second_card is None:
-                        self.second_card = i
-                        
-                        # 2枚のカードが一致するか確認
-                        first_card = self.cards[self.first_card]
-                        second_card = self.cards[self.second_card]
-                        
-                        # カードが一致したかどうかを記録
-                        self.is_match = first_card["type"] == second_card["type"]
-                        
-                        # 待機時間を設定
-                        game_config = self.config_loader.get_game_config()
-                        difficulty_config = self.config_loader.get_difficulty_config(self.game_manager.difficulty)
-                        
-                        if self.is_match:
-                            # ペア成立時は一定の待機時間
-                            self.wait_time = game_config.get("match_wait_time", 30)
-                        else:
-                            # ペア不成立時は難易度に応じた待機時間
-                            self.wait_time = difficulty_config.get("wait_time", 30)
-                    break
+            # クリックされたカードを配置から直接求める
+            card = self.card_grid.get_card_at(event.pos)
+            if card is None or not card.is_selectable():
+                return
+            
+            # すでに選択されているカードは選択できない
+            if self.first_card is card:
+                return
+            
+            # カードをめくる
+            card.flipped = True
+            self.card_blits = None
+            self._add_dirty_rect(card.rect)
+            
+            # 1枚目のカード
+            if self.first_card is None:
+                self.first_card = card
+            # 2枚目のカード
+            elif self.second_card is None:
+                self.second_card = card
+                
+                # カードが一致したかどうかを記録
+                self.is_match = self.first_card.type == self.second_card.type
+                
+                # 待機時間を設定
+                game_config = self.config_loader.get_game_config()
+                difficulty_config = self.config_loader.get_difficulty_config(self.game_manager.difficulty)
+                
+                if self.is_match:
+                    # ペア成立時は一定の待機時間
+                    wait_time_ms = game_config.get("match_wait_time_ms", 1000)
+                else:
+                    # ペア不成立時は難易度に応じた待機時間
+                    wait_time_ms = difficulty_config.get("wait_time_ms", 1000)
+                self.wait_steps = self.game_clock.get_steps_for(wait_time_ms)
     
     def update(self):
         """画面の状態を更新する"""
         # ボタンの更新
         self.back_button.update()
+        self.replay_button.update()
         
-        # 待機時間の更新
-        if self.wait_time > 0:
-            self.wait_time -= 1
-            if self.wait_time == 0:
+        # 待機時間の更新（経過した刻みの数だけ進める）
+        if self.wait_steps > 0:
+            self.wait_steps = max(0, self.wait_steps - self.game_clock.steps)
+            if self.wait_steps == 0:
                 # 待機時間が終了したら、記録した一致状態に基づいて処理
                 if self.first_card is not None and self.second_card is not None:
-                    first_card = self.cards[self.first_card]
-                    second_card = self.cards[self.second_card]
+                    first_card = self.first_card
+                    second_card = self.second_card
+                    self._add_dirty_rect(first_card.rect)
+                    self._add_dirty_rect(second_card.rect)
+                    self.card_blits = None
                     
                     # カードが一致した場合
                     if self.is_match:
-                        first_card["matched"] = True
-                        second_card["matched"] = True
+                        first_card.matched = True
+                        second_card.matched = True
                         self.matched_pairs += 1
                         
                         # キャラクターを発見したとマークする
-                        self.game_manager.discover_character(first_card["type"])
+                        self.game_manager.discover_character(first_card.type)
                         
                         # すべてのペアが見つかった場合
                         if self.matched_pairs == self.total_pairs:
                             self.game_over = True
+                            self.full_redraw = True
+                            self.game_manager.record_play(self.environment, self.game_manager.difficulty)
                     else:
                         # 一致しなかった場合、カードを裏返す
-                        first_card["flipped"] = False
-                        second_card["flipped"] = False
+                        first_card.flipped = False
+                        second_card.flipped = False
                     
                     # カードの選択をリセット
                     self.first_card = None
@@ -280,50 +356,117 @@ class GameScreen:
             self.screen.fill(self.background_color)
         
         # 環境名を描画
-        from game.environment import Environment
-        title_text = f"{Environment.get_name(self.environment)}で あそぶ"
-        title_surface = self.title_font.render(title_text, True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.width // 2, 40))
-        self.screen.blit(title_surface, title_rect)
+        self.screen.blit(self.title_surface, self.title_rect)
         
-        # カードを描画
-        for card in self.cards:
-            if card["matched"]:
-                # マッチしたカードは半透明に
-                matched_image = card["front_image"].copy()
-                matched_image.set_alpha(128)
-                self.screen.blit(matched_image, card["rect"])
-            elif card["flipped"]:
-                # めくられたカード（表面）
-                self.screen.blit(card["front_image"], card["rect"])
-            else:
-                # 裏向きのカード
-                self.screen.blit(card["back_image"], card["rect"])
+        # カードを描画（アトラスからまとめて描画する）
+        if self.card_blits is None:
+            self.card_blits = self._build_card_blits()
+        self.screen.blits(self.card_blits, doreturn=False)
         
         # ゲームオーバー時の表示
         if self.game_over:
-            # 半透明のオーバーレイ
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
+            # 半透明のオーバーレイ（最初の表示時に一度だけ作成する）
+            if self.game_over_overlay is None:
+                self.game_over_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                self.game_over_overlay.fill((0, 0, 0, 128))
+                track_surface(self.game_over_overlay, CATEGORY_OVERLAYS, owner=self)
+            self.screen.blit(self.game_over_overlay, (0, 0))
             
             # おめでとうメッセージ
-            congrats_font = FontManager.get_instance().get_font(72)
             congrats_text = "おめでとう！"
-            congrats_surface = congrats_font.render(congrats_text, True, (255, 255, 0))
-            congrats_rect = congrats_surface.get_rect(center=(self.width // 2, self.height // 2 - 50))
+            congrats_surface = self.font_manager.render_cached(congrats_text, 72, (255, 255, 0))
+            congrats_rect = congrats_surface.get_rect(center=(self.width // 2, self.height // 2 - scaled(50)))
             self.screen.blit(congrats_surface, congrats_rect)
+            
+            # もういっかいボタンを描画
+            self.replay_button.draw(self.screen)
         
         # 戻るボタンを描画
         self.back_button.draw(self.screen)
     
-    def get_next_screen(self):
+    def _build_card_blits(self):
         """
-        次の画面を取得する
+        カードを描画する blit のリストを作成する
         
         Returns:
-            次の画面、または None
+            list: (アトラスのサーフェス, 描画先の位置, アトラス内の領域) のリスト
         """
-        next_screen = self.next_screen
-        self.next_screen = None
-        return next_screen
\ No newline at end of file
+        atlas_surface = self.card_atlas.surface
+        card_blits = []
+        for card in self.cards:
+            if card.matched:
+                # マッチしたカードは半透明に
+                if self.faded_atlas_surface is None:
+                    self.faded_atlas_surface = self.resource_loader.get_effect_image(
+                        atlas_surface,
+                        ResourceLoader.EFFECT_FADED
+                    )
+                card_blits.append((self.faded_atlas_surface, card.front_pos, card.front_area))
+            elif card.flipped:
+                # めくられたカード（表面）
+                card_blits.append((atlas_surface, card.front_pos, card.front_area))
+            else:
+                # 裏向きのカード
+                card_blits.append((atlas_surface, card.back_pos, card.back_area))
+        return card_blits
+    
+    def get_widgets(self):
+        """
+        操作できる部品を取得する（InputDispatcher がホバー状態の判定に使用）
+        
+        表示中のボタンだけを返す（もういっかいボタンはゲームオーバー時のみ）。
+        
+        Returns:
+            list: ボタンのリスト
+        """
+        return self._get_visible_buttons()
+    
+    def _get_visible_buttons(self):
+        """
+        表示中のボタンを取得する
+        
+        Returns:
+            list: ボタンのリスト（もういっかいボタンはゲームオーバー時のみ）
+        """
+        if self.game_over:
+            return [self.back_button, self.replay_button]
+        return [self.back_button]
+    
+    def is_animating(self):
+        """
+        アニメーション中かどうかを確認する（メインループがアイドル時の間引きに使用）
+        
+        Returns:
+            bool: カードをめくった後の待機中か、ボタンがアニメーション中の場合は True
+        """
+        return self.wait_steps > 0 or any(button.is_animating() for button in self._get_visible_buttons())
+    
+    def _add_dirty_rect(self, rect):
+        """
+        再描画が必要な領域を記録する（差分描画モードのときだけ）
+        
+        Args:
+            rect (pygame.Rect): 変化した領域
+        """
+        if self.dirty_rect_tracking:
+            self.dirty_rects.append(rect)
+    
+    def get_dirty_rects(self):
+        """
+        前回の描画から変化した領域を取得する（差分描画モードで使用）
+        
+        Returns:
+            list: 再描画が必要な矩形のリスト、または画面全体の再描画が必要な場合は None
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects = []
+            return None
+        
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        for button in self._get_visible_buttons():
+            button_rect = button.get_dirty_rect()
+            if button_rect:
+                dirty_rects.append(button_rect)
+        return dirty_rects
\ No newline at end of file
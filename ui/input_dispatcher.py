@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+入力の振り分けモジュール
+
+イベントキューを1フレームに1回だけ読み出し、ポインターの移動イベントをまとめ、
+タッチ座標を画面座標に変換してから現在の画面に渡す。
+ボタンのホバー状態は画面ごとの空間インデックスで求めるため、ボタンの数に関係なく一定時間で済む。
+"""
+
+import pygame
+
+# ポインターの位置を持つイベント
+POINTER_EVENTS = (
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.FINGERMOTION,
+)
+
+# タッチイベント（座標が 0〜1 に正規化されている）
+FINGER_EVENTS = (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION)
+
+def get_event_pos(event, screen_size=None):
+    """
+    ポインターイベントの画面座標を取得する
+    
+    InputDispatcher を通ったイベントはタッチイベントにも pos が設定されている。
+    
+    Args:
+        event: pygameのイベント
+        screen_size (tuple, optional): 画面サイズ (width, height)。省略時は現在の画面のサイズ
+    
+    Returns:
+        tuple: 画面座標 (x, y)、またはポインターイベントでない場合は None
+    """
+    pos = getattr(event, "pos", None)
+    if pos is not None or event.type not in FINGER_EVENTS:
+        return pos
+    
+    if screen_size is None:
+        screen_size = pygame.display.get_surface().get_size()
+    return (int(event.x * screen_size[0]), int(event.y * screen_size[1]))
+
+
+class WidgetIndex:
+    """ボタンなどの操作できる部品を、画面を格子に区切った空間ハッシュで引く索引クラス"""
+    
+    # 格子の1マスの大きさ（ピクセル）
+    CELL_SIZE = 64
+    
+    def __init__(self, widgets):
+        """
+        索引を作成する
+        
+        Args:
+            widgets (list): rect 属性を持つ部品のリスト（先頭ほど優先される）
+        """
+        self.widgets = list(widgets)
+        
+        # (マスのX, マスのY) → そのマスに重なる部品のリスト
+        self.cells = {}
+        cell_size = self.CELL_SIZE
+        for widget in self.widgets:
+            rect = widget.rect
+            for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(widget)
+    
+    def get_widget_at(self, pos):
+        """
+        座標にある部品を取得する
+        
+        Args:
+            pos (tuple): 座標 (x, y)
+        
+        Returns:
+            object: 座標にある部品、または部品がない場合は None
+        """
+        x, y = pos
+        for widget in self.cells.get((x // self.CELL_SIZE, y // self.CELL_SIZE), ()):
+            if widget.rect.collidepoint(x, y):
+                return widget
+        return None
+
+
+class InputDispatcher:
+    """イベントキューを読み出して現在の画面に入力を振り分けるクラス"""
+    
+    def __init__(self, screen_size):
+        """
+        入力の振り分けを初期化する
+        
+        Args:
+            screen_size (tuple): 画面サイズ (width, height)
+        """
+        self.screen_size = screen_size
+        
+        # 最後に分かったポインターの画面座標
+        self.pointer_pos = None
+        
+        # 現在の画面と、その画面の部品の索引（get_widgets がない画面では None）
+        self.screen = None
+        self.widget_index = None
+        self.hovered_widget = None
+        
+        # アイドル中の待機でイベントキューから取り出したイベント（次の poll でキューより先に処理する）
+        self.waited_events = []
+    
+    def hold_event(self, event):
+        """
+        イベントキューから取り出したイベントを、次の poll で最初に処理するよう預かる
+        
+        pygame.event.wait で受け取ったイベントをキューに戻すと、一緒に届いたイベントより後ろに並んでしまうため、
+        キューには戻さずにここで預かる。
+        
+        Args:
+            event: イベントキューから取り出したイベント
+        """
+        self.waited_events.append(event)
+    
+    def poll(self):
+        """
+        イベントキューを読み出す
+        
+        連続する移動イベントは最後の1つにまとめ、タッチイベントには画面座標の pos を設定する。
+        
+        Returns:
+            list: このフレームで処理するイベントのリスト
+        """
+        self._sync_widgets()
+        events = self.waited_events + pygame.event.get()
+        self.waited_events = []
+        events = self._coalesce_motion(events)
+        
+        for event in events:
+            if event.type in FINGER_EVENTS:
+                event.pos = get_event_pos(event, self.screen_size)
+            if event.type in POINTER_EVENTS:
+                self.pointer_pos = event.pos
+        return events
+    
+    def _coalesce_motion(self, events):
+        """
+        ボタンやタッチの押下・解放をはさまずに連続する移動イベントを最後の1つにまとめる
+        
+        まとめた移動イベントの移動量 (rel, dx, dy) は、まとめたすべてのイベントの合計にする。
+        
+        Args:
+            events (list): イベントキューから読み出したイベントのリスト
+        
+        Returns:
+            list: まとめた後のイベントのリスト
+        """
+        result = []
+        
+        # (イベントの種類, 指のID) → 結果のリスト内の位置
+        pending = {}
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                key = (event.type, None)
+            elif event.type == pygame.FINGERMOTION:
+                key = (event.type, event.finger_id)
+            else:
+                if event.type in POINTER_EVENTS:
+                    pending.clear()
+                result.append(event)
+                continue
+            
+            index = pending.get(key)
+            if index is not None:
+                event = self._merge_motion(result[index], event)
+                result[index] = None
+            pending[key] = len(result)
+            result.append(event)
+        
+        return [event for event in result if event is not None]
+    
+    def _merge_motion(self, previous, event):
+        """
+        2つの移動イベントを、後のイベントの位置と合計の移動量を持つ1つのイベントにまとめる
+        
+        Args:
+            previous: 前の移動イベント
+            event: 後の移動イベント
+        
+        Returns:
+            pygame.event.Event: まとめた移動イベント
+        """
+        attributes = dict(event.dict)
+        if event.type == pygame.MOUSEMOTION:
+            attributes["rel"] = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+        else:
+            attributes["dx"] = previous.dx + event.dx
+            attributes["dy"] = previous.dy + event.dy
+        return pygame.event.Event(event.type, attributes)
+    
+    def set_screen(self, screen):
+        """
+        入力を渡す画面を切り替え、画面の部品の索引を作成する
+        
+        画面が get_widgets を持つ場合、その部品のホバー状態はこのクラスが更新する。
+        get_widgets が返す部品が変わった場合は、次の poll で索引を作り直す。
+        
+        Args:
+            screen: 入力を渡す画面
+        """
+        if screen is self.screen:
+            return
+        self.screen = screen
+        self.hovered_widget = None
+        self.widget_index = None
+        
+        if not hasattr(screen, "get_widgets"):
+            return
+        
+        self.widget_index = WidgetIndex(screen.get_widgets())
+        for widget in self.widget_index.widgets:
+            widget.hover_managed = True
+            widget.is_hovered = False
+        
+        if self.pointer_pos is None:
+            self.pointer_pos = pygame.mouse.get_pos()
+        self._update_hover(self.pointer_pos)
+    
+    def _sync_widgets(self):
+        """
+        画面の部品が変わっていれば索引を作り直す（表示するボタンが状態によって変わる画面のため）
+        
+        索引から外れた部品はホバー状態を解除し、このクラスが管理したままにする
+        （非表示の部品が自分でマウスの位置を調べたり、アニメーションしたりしないようにする）。
+        """
+        if self.widget_index is None:
+            return
+        widgets = self.screen.get_widgets()
+        previous_widgets = self.widget_index.widgets
+        if len(widgets) == len(previous_widgets) and all(a is b for a, b in zip(widgets, previous_widgets)):
+            return
+        
+        self.widget_index = WidgetIndex(widgets)
+        for widget in previous_widgets:
+            widget.is_hovered = False
+        for widget in self.widget_index.widgets:
+            widget.hover_managed = True
+        self.hovered_widget = None
+        if self.pointer_pos is not None:
+            self._update_hover(self.pointer_pos)
+    
+    def dispatch(self, event):
+        """
+        イベントを現在の画面に渡す
+        
+        ポインターイベントの場合は、渡す前にその位置で部品のホバー状態を更新する。
+        
+        Args:
+            event: poll で読み出したイベント
+        """
+        if self.widget_index is not None and event.type in POINTER_EVENTS:
+            self._update_hover(event.pos)
+        self.screen.handle_event(event)
+    
+    def _update_hover(self, pos):
+        """
+        座標にある部品だけをホバー状態にする
+        
+        Args:
+            pos (tuple): ポインターの画面座標 (x, y)
+        """
+        widget = self.widget_index.get_widget_at(pos)
+        if widget is self.hovered_widget:
+            return
+        if self.hovered_widget is not None:
+            self.hovered_widget.is_hovered = False
+        if widget is not None:
+            widget.is_hovered = True
+        self.hovered_widget = widget
@@ -7,15 +7,22 @@
 
 import pygame
 from ui.button import Button
-from ui.environment_select import EnvironmentSelectScreen
-from ui.encyclopedia_ui import EncyclopediaScreen
-from ui.sticker_book_ui import StickerBookScreen
+from ui.screen_manager import ScreenManager
 from utils.font_manager import FontManager
+from utils.game_clock import GameClock
+from utils.render_target import scaled
 from utils.resource_loader import ResourceLoader
+from utils.surface_tracker import track_surface, CATEGORY_BACKGROUNDS
 
 class MainMenu:
     """メインメニュー画面クラス"""
     
+    # 動物のキャラクター画像のサイズ（基準解像度）
+    CHARACTER_SIZE = (80, 80)
+    
+    # 動物が歩き続ける時間（画面の表示か最後の入力から、ミリ秒）。その後は止まって入力を待つ
+    ANIMAL_WALK_MS = 10000
+    
     def __init__(self, screen, game_manager):
         """
         メインメニューを初期化する
@@ -26,22 +33,23 @@ class MainMenu:
         """
         self.screen = screen
         self.game_manager = game_manager
-        self.next_screen = None
+        self.screen_manager = ScreenManager.get_instance()
         
         # 画面サイズを取得
         self.width, self.height = self.screen.get_size()
         
         # タイトルフォント
-        self.title_font = FontManager.get_instance().get_font(64)
+        self.font_manager = FontManager.get_instance()
+        self.title_font_size = 64
         
         # リソースローダー
         self.resource_loader = ResourceLoader.get_instance()
         
-        # ボタンの作成
-        button_width = 350
-        button_height = 60
-        button_margin = 20
-        start_y = self.height // 2 - 50
+        # ボタンの作成（レイアウトの数値は基準解像度でのピクセル数）
+        button_width = scaled(350)
+        button_height = scaled(60)
+        button_margin = scaled(20)
+        start_y = self.height // 2 - scaled(50)
         
         # スタートボタン
         self.start_button = Button(
@@ -82,21 +90,39 @@ class MainMenu:
         # 背景画像の読み込み - 背景色で代用
         self.background = pygame.Surface((self.width, self.height))
         self.background.fill((240, 248, 255))  # 薄い水色
+        track_surface(self.background, CATEGORY_BACKGROUNDS, owner=self)
         
         # タイトルロゴはテキストで代用するためNoneに設定
         self.title_logo = None
         
-        # キャラクター画像の読み込み
-        self.character_image = self.resource_loader.load_character_image(
-            "lion", 
-            "jungle", 
-            (80, 80)
-        )
+        # キャラクター画像の先読み（読み込みが終わるまでは円で代用）
+        self.character_image = None
+        self.character_preload = self.resource_loader.preload_images([
+            (self.resource_loader.get_character_image_path("lion"), scaled(self.CHARACTER_SIZE), True)
+        ])
+        
+        # 環境選択画面のサムネイル画像も先読みしておく（最初のフレームを表示してから行う）
+        self.first_frame_drawn = False
+        self.thumbnail_preload = None
         
         # 動物のキャラクターアニメーション
-        self.animal_pos = [100, self.height - 150]
+        self.animal_pos = [scaled(100), self.height - scaled(150)]
         self.animal_direction = [1, 0]
-        self.animal_speed = 2
+        self.animal_speed = scaled(2)  # 1刻みあたりの移動量
+        
+        # 1つ前の刻みのX座標と、前後の刻みの間で補間した描画位置
+        self.animal_previous_x = self.animal_pos[0]
+        self.animal_draw_pos = list(self.animal_pos)
+        self.game_clock = GameClock.get_instance()
+        
+        # 動物が止まるまでの残りの刻みの数
+        self.animal_walk_steps = self.game_clock.get_steps_for(self.ANIMAL_WALK_MS)
+
+        # 差分描画用の状態（最初は画面全体を描画する）
+        # 変化した領域は差分描画モードのときだけ記録する（Game が dirty_rect_tracking を設定する）
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.dirty_rect_tracking = False
     
     def handle_event(self, event):
         """
@@ -105,18 +131,32 @@ class MainMenu:
         Args:
             event: pygameのイベント
         """
+        # 入力があれば止まっていた動物をまた歩かせる
+        self._wake_animal()
+        
         # スタートボタンのイベント処理
         if self.start_button.handle_event(event):
-            self.next_screen = EnvironmentSelectScreen(self.screen, self.game_manager)
+            from ui.environment_select import EnvironmentSelectScreen
+            self.screen_manager.push(EnvironmentSelectScreen)
         
         # TODO: 図鑑機能とシールブック機能の実装
         # 図鑑ボタンのイベント処理
         # elif self.encyclopedia_button.handle_event(event):
-        #     self.next_screen = EncyclopediaScreen(self.screen, self.game_manager)
+        #     from ui.encyclopedia_ui import EncyclopediaScreen
+        #     self.screen_manager.push(EncyclopediaScreen)
         # 
         # シールブックボタンのイベント処理
         # elif self.sticker_book_button.handle_event(event):
-        #     self.next_screen = StickerBookScreen(self.screen, self.game_manager)
+        #     from ui.sticker_book_ui import StickerBookScreen
+        #     self.screen_manager.push(StickerBookScreen)
+    
+    def on_resume(self):
+        """他の画面から戻ったときに動物をまた歩かせる"""
+        self._wake_animal()
+    
+    def _wake_animal(self):
+        """動物が歩き続ける時間をはじめから数え直す"""
+        self.animal_walk_steps = self.game_clock.get_steps_for(self.ANIMAL_WALK_MS)
     
     def update(self):
         """画面の状態を更新する"""
@@ -125,10 +165,60 @@ class MainMenu:
         self.encyclopedia_button.update()
         self.sticker_book_button.update()
         
+        if self.thumbnail_preload is None and self.first_frame_drawn:
+            from ui.environment_select import EnvironmentSelectScreen
+            self.thumbnail_preload = EnvironmentSelectScreen.preload_thumbnails(self.resource_loader)
+        
+        # 先読みが終わったらキャラクター画像を取得する
+        if self.character_image is None and self.character_preload.done:
+            self.character_image = self.resource_loader.load_character_image(
+                "lion", 
+                "jungle", 
+                scaled(self.CHARACTER_SIZE),
+                owner=self
+            )
+            if self.dirty_rect_tracking:
+                self.dirty_rects.append(self._get_animal_rect())
+        
         # 動物のアニメーション
-        self.animal_pos[0] += self.animal_direction[0] * self.animal_speed
-        if self.animal_pos[0] < 50 or self.animal_pos[0] > self.width - 50:
-            self.animal_direction[0] *= -1
+        if self.dirty_rect_tracking:
+            previous_rect = self._get_animal_rect()
+        walk_steps = min(self.game_clock.steps, self.animal_walk_steps)
+        self.animal_walk_steps -= walk_steps
+        for _ in range(walk_steps):
+            self.animal_previous_x = self.animal_pos[0]
+            self.animal_pos[0] += self.animal_direction[0] * self.animal_speed
+            if self.animal_pos[0] < scaled(50) or self.animal_pos[0] > self.width - scaled(50):
+                self.animal_direction[0] *= -1
+        
+        # 止まったら補間せずにその場に描画する
+        if self.animal_walk_steps == 0:
+            self.animal_previous_x = self.animal_pos[0]
+        
+        # 描画位置は前後の刻みの間で補間する
+        self.animal_draw_pos[0] = round(
+            self.animal_previous_x + (self.animal_pos[0] - self.animal_previous_x) * self.game_clock.alpha
+        )
+        
+        # 移動前と移動後の領域をまとめて再描画する（動いていなければ何もしない）
+        if self.dirty_rect_tracking:
+            animal_rect = self._get_animal_rect()
+            if animal_rect != previous_rect:
+                self.dirty_rects.append(previous_rect.union(animal_rect))
+    
+    def _get_animal_rect(self):
+        """
+        動物のキャラクターを描画する領域を取得する
+        
+        Returns:
+            pygame.Rect: キャラクター画像と代用の円の両方を含む領域
+        """
+        return pygame.Rect(
+            self.animal_draw_pos[0] - scaled(30),
+            self.animal_draw_pos[1] - scaled(30),
+            scaled(110),
+            scaled(110)
+        )
     
     def draw(self):
         """画面を描画する"""
@@ -141,40 +231,69 @@ class MainMenu:
         
         # タイトルロゴを描画
         if self.title_logo:
-            logo_rect = self.title_logo.get_rect(center=(self.width // 2, 130))
+            logo_rect = self.title_logo.get_rect(center=(self.width // 2, scaled(130)))
             self.screen.blit(self.title_logo, logo_rect)
         else:
             # タイトルロゴがない場合はテキストで描画
             title_text = "どうぶつ・きょうりゅう"
-            title_surface = self.title_font.render(title_text, True, (0, 0, 0))
-            title_rect = title_surface.get_rect(center=(self.width // 2, 100))
+            title_surface = self.font_manager.render_cached(title_text, self.title_font_size, (0, 0, 0))
+            title_rect = title_surface.get_rect(center=(self.width // 2, scaled(100)))
             self.screen.blit(title_surface, title_rect)
             
             # サブタイトルを描画
             subtitle_text = "かくれんぼ"
-            subtitle_surface = self.title_font.render(subtitle_text, True, (0, 0, 0))
-            subtitle_rect = subtitle_surface.get_rect(center=(self.width // 2, 160))
+            subtitle_surface = self.font_manager.render_cached(subtitle_text, self.title_font_size, (0, 0, 0))
+            subtitle_rect = subtitle_surface.get_rect(center=(self.width // 2, scaled(160)))
             self.screen.blit(subtitle_surface, subtitle_rect)
         
         # キャラクターを描画
         if self.character_image:
-            self.screen.blit(self.character_image, self.animal_pos)
+            self.screen.blit(self.character_image, self.animal_draw_pos)
         else:
             # キャラクター画像がない場合は円で代用
-            pygame.draw.circle(self.screen, (255, 165, 0), self.animal_pos, 30)
+            pygame.draw.circle(self.screen, (255, 165, 0), self.animal_draw_pos, scaled(30))
         
         # ボタンを描画
         self.start_button.draw(self.screen)
         self.encyclopedia_button.draw(self.screen)
         self.sticker_book_button.draw(self.screen)
+        
+        self.first_frame_drawn = True
     
-    def get_next_screen(self):
+    def get_widgets(self):
         """
-        次の画面を取得する
+        操作できる部品を取得する（InputDispatcher がホバー状態の判定に使用）
         
         Returns:
-            次の画面、または None
+            list: ボタンのリスト
+        """
+        return [self.start_button, self.encyclopedia_button, self.sticker_book_button]
+    
+    def is_animating(self):
         """
-        next_screen = self.next_screen
-        self.next_screen = None
-        return next_screen
+        アニメーション中かどうかを確認する（メインループがアイドル時の間引きに使用）
+        
+        Returns:
+            bool: 動物が歩いているか、ボタンがアニメーション中の場合は True
+        """
+        return self.animal_walk_steps > 0 or any(button.is_animating() for button in self.get_widgets())
+    
+    def get_dirty_rects(self):
+        """
+        前回の描画から変化した領域を取得する（差分描画モードで使用）
+        
+        Returns:
+            list: 再描画が必要な矩形のリスト、または画面全体の再描画が必要な場合は None
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects = []
+            return None
+        
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        for button in self.get_widgets():
+            button_rect = button.get_dirty_rect()
+            if button_rect:
+                dirty_rects.append(button_rect)
+        return dirty_rects
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+画面の管理モジュール
+
+画面をスタックに積んで管理し、戻るときは作成済みの画面をそのまま使う。
+画面の切り替えはフレームの最後にまとめて行い、画面は次のフック（あれば）で通知を受け取る。
+
+- on_enter: スタックに積まれたとき
+- on_exit: スタックから取り除かれたとき
+- on_suspend: 上に別の画面が積まれたとき
+- on_resume: 上の画面が取り除かれて再び一番上になったとき
+
+サーフェスのメモリ計測中は、切り替えでいなくなった画面のサーフェスが残っていないかを
+check_surfaces で確認する（呼び出し側が古い画面への参照を手放してから呼び出す）。
+"""
+
+from collections import OrderedDict
+from utils.resource_loader import ResourceLoader
+from utils.surface_tracker import SurfaceTracker
+
+class ScreenManager:
+    """画面のスタックと作成済みの画面のキャッシュを管理するクラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    # スタックにない画面をキャッシュに残しておく最大数（古いものから解放する）
+    MAX_CACHED_SCREENS = 4
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            ScreenManager: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = ScreenManager()
+        return cls._instance
+    
+    def __init__(self):
+        """画面の管理を初期化する"""
+        # 画面の作成に渡す描画対象の画面とゲームマネージャー（setup で設定する）
+        self.surface = None
+        self.game_manager = None
+        
+        # 画面のスタック（末尾が現在の画面）
+        self.stack = []
+        
+        # 画面クラス → 作成済みの画面（最近使ったものほど末尾）
+        self.cache = OrderedDict()
+        
+        # フレームの最後に行う切り替え (操作, 画面クラス, キャッシュするかどうか)
+        # 1フレームに複数の要求があった場合は最後の要求だけを行う
+        self.pending = None
+        
+        # 切り替え中にスタックとキャッシュから取り除いた画面（メモリ計測で使う）
+        self.removed_screens = []
+        
+        # check_surfaces で確認する (切り替えの前のスナップショット, 切り替えの説明, いなくなった画面のクラス名)
+        self.pending_surface_check = None
+        
+        self.resource_loader = ResourceLoader.get_instance()
+        self.surface_tracker = SurfaceTracker.get_instance()
+    
+    def setup(self, surface, game_manager):
+        """
+        画面の作成に使う引数を設定する
+        
+        Args:
+            surface: 描画対象の画面
+            game_manager: ゲームマネージャー
+        """
+        self.surface = surface
+        self.game_manager = game_manager
+    
+    @property
+    def current_screen(self):
+        """現在の画面（スタックが空の場合は None）"""
+        return self.stack[-1] if self.stack else None
+    
+    def push(self, screen_class, cache=True):
+        """
+        画面をスタックに積む
+        
+        Args:
+            screen_class: 画面クラス（描画対象の画面とゲームマネージャーを引数に取る）
+            cache (bool): 画面を作成済みのものから再利用し、取り除いた後も残しておくかどうか
+        """
+        self.pending = ("push", screen_class, cache)
+    
+    def pop(self):
+        """現在の画面をスタックから取り除き、1つ前の画面に戻る"""
+        self.pending = ("pop", None, False)
+    
+    def replace(self, screen_class, cache=True):
+        """
+        現在の画面を別の画面に置き換える
+        
+        Args:
+            screen_class: 画面クラス
+            cache (bool): 画面を作成済みのものから再利用し、取り除いた後も残しておくかどうか
+        """
+        self.pending = ("replace", screen_class, cache)
+    
+    def apply_pending(self):
+        """
+        要求された画面の切り替えを行う
+        
+        メインループからフレームの最後に呼び出す。
+        
+        Returns:
+            bool: 現在の画面が変わった場合は True
+        """
+        if self.pending is None:
+            return False
+        action, screen_class, cache = self.pending
+        self.pending = None
+        previous_screen = self.current_screen
+        
+        # メモリ計測中は切り替えの前のサーフェスを記録しておく
+        snapshot = self.surface_tracker.take_snapshot() if self.surface_tracker.enabled else None
+        self.removed_screens = []
+        
+        if action == "pop":
+            # 最初の画面は取り除かない
+            if len(self.stack) > 1:
+                self._remove_top()
+                self._call_hook(self.current_screen, "on_resume")
+        else:
+            screen = self._get_screen(screen_class, cache)
+            if screen in self.stack:
+                # すでにスタックにある画面はそこまで戻る
+                while self.current_screen is not screen:
+                    self._remove_top()
+                self._call_hook(screen, "on_resume")
+            else:
+                if action == "replace" and self.stack:
+                    self._remove_top()
+                else:
+                    self._call_hook(self.current_screen, "on_suspend")
+                self.stack.append(screen)
+                self._call_hook(screen, "on_enter")
+        
+        self._trim_cache()
+        
+        if snapshot is not None:
+            self._prepare_surface_check(snapshot, previous_screen)
+        self.removed_screens = []
+        return self.current_screen is not previous_screen
+    
+    def _get_screen(self, screen_class, cache):
+        """
+        画面を取得する（キャッシュにあれば再利用し、なければ作成する）
+        
+        Args:
+            screen_class: 画面クラス
+            cache (bool): キャッシュを使うかどうか
+        
+        Returns:
+            画面
+        """
+        # 作成中に作られたサーフェスは作成する画面のものとして記録する
+        if not cache:
+            self.surface_tracker.set_current_owner(screen_class.__name__)
+            return screen_class(self.surface, self.game_manager)
+        
+        screen = self.cache.get(screen_class)
+        if screen is None:
+            self.surface_tracker.set_current_owner(screen_class.__name__)
+            screen = screen_class(self.surface, self.game_manager)
+            self.cache[screen_class] = screen
+        else:
+            self.cache.move_to_end(screen_class)
+        return screen
+    
+    def _remove_top(self):
+        """現在の画面をスタックから取り除き、キャッシュしない画面の画像を解放する"""
+        screen = self.stack.pop()
+        self._call_hook(screen, "on_exit")
+        if self.cache.get(type(screen)) is not screen:
+            self.resource_loader.release_images(screen)
+            self.removed_screens.append(screen)
+    
+    def _trim_cache(self):
+        """スタックにないキャッシュ済みの画面が上限を超えたら、古いものから解放する"""
+        idle_screens = [
+            screen_class for screen_class, screen in self.cache.items()
+            if screen not in self.stack
+        ]
+        for screen_class in idle_screens[:max(0, len(idle_screens) - self.MAX_CACHED_SCREENS)]:
+            screen = self.cache.pop(screen_class)
+            self.resource_loader.release_images(screen)
+            self.removed_screens.append(screen)
+    
+    def _prepare_surface_check(self, snapshot, previous_screen):
+        """
+        切り替えでいなくなった画面を記録し、check_surfaces での確認を予約する
+        
+        Args:
+            snapshot (dict): 切り替えの前に取得したサーフェスのスナップショット
+            previous_screen: 切り替えの前の画面
+        """
+        current_name = type(self.current_screen).__name__
+        self.surface_tracker.set_current_owner(current_name)
+        
+        # 同じクラスの画面がスタックかキャッシュに残っていれば、いなくなったものとしない
+        live_names = {type(screen).__name__ for screen in self.stack}
+        live_names.update(screen_class.__name__ for screen_class in self.cache)
+        departed_names = {type(screen).__name__ for screen in self.removed_screens} - live_names
+        
+        description = f"{type(previous_screen).__name__} → {current_name}"
+        self.pending_surface_check = (snapshot, description, departed_names)
+    
+    def check_surfaces(self):
+        """
+        直前の切り替えでいなくなった画面のサーフェスが残っていないかを確認する（メモリ計測中のみ）
+        
+        メインループが古い画面への参照を付け替えた後に呼び出す。
+        """
+        if self.pending_surface_check is None:
+            return
+        snapshot, description, departed_names = self.pending_surface_check
+        self.pending_surface_check = None
+        self.surface_tracker.check_transition(snapshot, description, departed_names)
+    
+    def _call_hook(self, screen, hook_name):
+        """
+        画面のフックを呼び出す（画面がフックを持たない場合は何もしない）
+        
+        Args:
+            screen: 画面
+            hook_name (str): フック名
+        """
+        hook = getattr(screen, hook_name, None)
+        if hook is not None:
+            hook()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+アセット事前ベイクモジュール
+
+難易度ごとのカードサイズと画面サイズに合わせてリサイズ済みの画像を書き出し、
+ResourceLoader が実行時のデコードとリサイズを省略できるようにする。
+描画の倍率（render_scale）を下げている場合は、その内部解像度でのサイズも書き出す。
+
+使い方:
+    python -m utils.asset_baker
+"""
+
+import os
+import json
+import pygame
+from game.card import CardGrid
+from utils.config import Config
+from utils.config_loader import ConfigLoader
+from utils.render_target import RenderTarget, AUTO_RENDER_SCALE
+from utils.resource_loader import (
+    ResourceLoader,
+    BAKED_DIR_NAME,
+    BAKED_MANIFEST_NAME,
+    BAKED_MANIFEST_VERSION,
+    scale_image,
+    normalize_asset_path,
+    compute_file_hash,
+    get_file_stamp,
+)
+
+class AssetBaker:
+    """リサイズ済みの画像とマニフェストを書き出すクラス"""
+    
+    def __init__(self, config=None):
+        """
+        アセットベイカーを初期化する
+        
+        Args:
+            config (Config, optional): 画面サイズを読み込む設定
+        """
+        self.config = config or Config()
+        self.config_loader = ConfigLoader.get_instance()
+        self.resource_loader = ResourceLoader.get_instance()
+        
+        # 入出力のパス
+        self.image_path = self.resource_loader.image_path
+        self.baked_path = self.resource_loader.baked_path
+    
+    def get_render_scales(self):
+        """
+        ベイクする描画の倍率を取得する
+        
+        Returns:
+            list: 倍率のリスト（常に 1.0 を含む。"auto" の場合は描画が遅い端末で使う倍率も含む）
+        """
+        render_scale = self.config.get("render_scale", 1.0)
+        if render_scale == AUTO_RENDER_SCALE:
+            render_scale = RenderTarget.AUTO_LOW_SCALE
+        return sorted({1.0, RenderTarget.clamp_scale(render_scale)})
+    
+    def collect_targets(self):
+        """
+        ベイク対象の画像とサイズを集める
+        
+        Returns:
+            dict: 画像パスをキー、(サイズ, アスペクト比を維持するか) の集合を値とする辞書
+        """
+        targets = {}
+        
+        def add_target(path, size, keep_aspect_ratio):
+            targets.setdefault(path, set()).add((tuple(size), keep_aspect_ratio))
+        
+        # 描画の倍率ごとの画面サイズ（内部解像度）と、難易度ごとのカードサイズ
+        logical_width = self.config.get("screen_width", 800)
+        logical_height = self.config.get("screen_height", 600)
+        screen_sizes = set()
+        card_sizes = set()
+        game_config = self.config_loader.get_game_config()
+        for scale in self.get_render_scales():
+            screen_size = (round(logical_width * scale), round(logical_height * scale))
+            screen_sizes.add(screen_size)
+            for difficulty_config in game_config.get("difficulty_levels", {}).values():
+                card_sizes.add(CardGrid.from_difficulty(difficulty_config, screen_size, scale).card_size)
+        
+        # カード表面（すべてのキャラクター）
+        characters = self.config_loader.get_characters()
+        character_ids = [c["id"] for c in characters.get("animals", []) + characters.get("dinosaurs", [])]
+        for character_id in character_ids:
+            path = self.resource_loader.get_character_image_path(character_id)
+            for card_size in card_sizes:
+                add_target(path, card_size, True)
+        
+        # カード裏面と背景（すべての環境）
+        for environment_type, environment in self.config_loader.get_environments().items():
+            for back_type in environment.get("card_backs", []):
+                path = self.resource_loader.get_card_back_image_path(back_type)
+                for card_size in card_sizes:
+                    add_target(path, card_size, True)
+            
+            path = self.resource_loader.get_background_image_path(environment_type)
+            for screen_size in screen_sizes:
+                add_target(path, screen_size, False)
+        
+        return targets
+    
+    def bake(self):
+        """
+        画像をベイクしてマニフェストを書き出す
+        
+        Returns:
+            dict: 書き出したマニフェスト
+        """
+        images = {}
+        
+        for path, variants in sorted(self.collect_targets().items()):
+            full_path = os.path.join(self.image_path, path)
+            source_hash = compute_file_hash(full_path)
+            if source_hash is None:
+                print(f"画像が見つからないためスキップします: {full_path}")
+                continue
+            
+            source_image = pygame.image.load(full_path)
+            stem, _ = os.path.splitext(normalize_asset_path(path))
+            
+            # 実行時はサイズと更新日時で元画像が変わっていないかを確認する
+            # （更新日時が保たれない環境ではハッシュで確認する）
+            source_mtime_ns, source_size = get_file_stamp(full_path)
+            entry = {
+                "source_hash": source_hash,
+                "source_mtime_ns": source_mtime_ns,
+                "source_size": source_size,
+                "variants": []
+            }
+            for size, keep_aspect_ratio in sorted(variants):
+                suffix = "fit" if keep_aspect_ratio else "fill"
+                variant_file = f"{stem}_{size[0]}x{size[1]}_{suffix}.png"
+                
+                baked_file = os.path.join(self.baked_path, *variant_file.split("/"))
+                os.makedirs(os.path.dirname(baked_file), exist_ok=True)
+                pygame.image.save(scale_image(source_image, size, keep_aspect_ratio), baked_file)
+                
+                entry["variants"].append({
+                    "size": list(size),
+                    "keep_aspect_ratio": keep_aspect_ratio,
+                    "file": variant_file
+                })
+            
+            images[normalize_asset_path(path)] = entry
+        
+        manifest = {"version": BAKED_MANIFEST_VERSION, "images": images}
+        os.makedirs(self.baked_path, exist_ok=True)
+        with open(os.path.join(self.baked_path, BAKED_MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        
+        return manifest
+
+
+def main():
+    """ベイク処理を実行する"""
+    manifest = AssetBaker().bake()
+    variant_count = sum(len(entry["variants"]) for entry in manifest["images"].values())
+    print(f"{len(manifest['images'])} 枚の画像から {variant_count} 個のサイズ違いを書き出しました: "
+          f"{os.path.join('assets', BAKED_DIR_NAME)}")
+
+
+if __name__ == "__main__":
+    main()
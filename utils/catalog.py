@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+キャラクターと環境のカタログモジュール
+
+設定ファイルを読み込んだときに一度だけ索引を作り、以降の検索を辞書の参照だけで行う。
+索引は読み取り専用（MappingProxyType とタプル）で、呼び出し元で書き換えられない。
+"""
+
+from types import MappingProxyType
+
+# キャラクターの種類（Character クラスと同期）
+TYPE_ANIMAL = "animal"
+TYPE_DINOSAUR = "dinosaur"
+
+# 索引を作る難易度（これ以外の難易度は "easy" として扱う）
+DIFFICULTIES = ("easy", "normal", "hard")
+
+# 環境の設定がない場合の既定値
+DEFAULT_ENVIRONMENT_NAME = "不明"
+DEFAULT_BACKGROUND_COLOR = (240, 248, 255)
+DEFAULT_CARD_BACKS = ("flower",)
+
+def is_animal_available(animal_difficulty, difficulty):
+    """
+    動物が難易度に登場するかどうかを確認する
+    
+    Args:
+        animal_difficulty (int): 動物の難易度（1〜3）
+        difficulty (str): 難易度 ("easy", "normal", "hard")
+    
+    Returns:
+        bool: 登場する場合は True
+    """
+    if difficulty == "hard":
+        return True
+    if difficulty == "normal":
+        return animal_difficulty <= 2
+    return animal_difficulty == 1
+
+
+def is_dinosaur_available(dinosaur_difficulty, difficulty):
+    """
+    恐竜が難易度に登場するかどうかを確認する
+    
+    Args:
+        dinosaur_difficulty (int): 恐竜の難易度（2〜3）
+        difficulty (str): 難易度 ("easy", "normal", "hard")
+    
+    Returns:
+        bool: 登場する場合は True
+    """
+    if difficulty == "hard":
+        return dinosaur_difficulty in (2, 3)
+    if difficulty == "normal":
+        return dinosaur_difficulty == 2
+    return False
+
+
+class Catalog:
+    """キャラクターと環境の読み取り専用の索引クラス"""
+    
+    def __init__(self, characters_config, environments_config):
+        """
+        設定からカタログを作成する
+        
+        Args:
+            characters_config (dict): characters.json の内容
+            environments_config (dict): environments.json の environments の内容
+        """
+        animals = characters_config.get("animals", [])
+        dinosaurs = characters_config.get("dinosaurs", [])
+        
+        # キャラクターID → キャラクター情報（種類を含む）
+        characters = {}
+        for records, character_type in ((animals, TYPE_ANIMAL), (dinosaurs, TYPE_DINOSAUR)):
+            for record in records:
+                if record["id"] in characters:
+                    continue
+                info = dict(record)
+                info["type"] = character_type
+                characters[record["id"]] = MappingProxyType(info)
+        self.characters = MappingProxyType(characters)
+        
+        # (環境, 難易度) → キャラクターIDのタプル（設定ファイルの順序を保つ）
+        environment_types = dict.fromkeys(environments_config)
+        for record in animals + dinosaurs:
+            environment_types.update(dict.fromkeys(record.get("environments", [])))
+        
+        animal_index = {}
+        dinosaur_index = {}
+        for environment_type in environment_types:
+            for difficulty in DIFFICULTIES:
+                animal_index[(environment_type, difficulty)] = tuple(
+                    animal["id"] for animal in animals
+                    if environment_type in animal.get("environments", [])
+                    and is_animal_available(animal.get("difficulty", 1), difficulty)
+                )
+                dinosaur_index[(environment_type, difficulty)] = tuple(
+                    dinosaur["id"] for dinosaur in dinosaurs
+                    if environment_type in dinosaur.get("environments", [])
+                    and is_dinosaur_available(dinosaur.get("difficulty", 2), difficulty)
+                )
+        self.animal_index = MappingProxyType(animal_index)
+        self.dinosaur_index = MappingProxyType(dinosaur_index)
+        
+        # 環境 → 名前・背景色・カード裏面
+        self.environments = MappingProxyType({
+            environment_type: MappingProxyType({
+                "name": environment.get("name", DEFAULT_ENVIRONMENT_NAME),
+                "background_color": tuple(environment.get("background_color", DEFAULT_BACKGROUND_COLOR)),
+                "card_backs": tuple(environment.get("card_backs", DEFAULT_CARD_BACKS))
+            })
+            for environment_type, environment in environments_config.items()
+        })
+    
+    def get_character(self, character_id):
+        """
+        キャラクター情報を取得する
+        
+        Args:
+            character_id (str): キャラクターID
+        
+        Returns:
+            MappingProxyType: キャラクター情報、または見つからない場合は None
+        """
+        return self.characters.get(character_id)
+    
+    def get_animals(self, environment_type, difficulty):
+        """
+        環境と難易度に対応する動物のIDを取得する
+        
+        Args:
+            environment_type (str): 環境の種類
+            difficulty (str): 難易度 ("easy", "normal", "hard")
+        
+        Returns:
+            tuple: 動物IDのタプル
+        """
+        if difficulty not in DIFFICULTIES:
+            difficulty = "easy"
+        return self.animal_index.get((environment_type, difficulty), ())
+    
+    def get_dinosaurs(self, environment_type, difficulty):
+        """
+        環境と難易度に対応する恐竜のIDを取得する
+        
+        Args:
+            environment_type (str): 環境の種類
+            difficulty (str): 難易度 ("easy", "normal", "hard")
+        
+        Returns:
+            tuple: 恐竜IDのタプル
+        """
+        if difficulty not in DIFFICULTIES:
+            difficulty = "easy"
+        return self.dinosaur_index.get((environment_type, difficulty), ())
+    
+    def get_environment(self, environment_type):
+        """
+        環境の情報を取得する
+        
+        Args:
+            environment_type (str): 環境の種類
+        
+        Returns:
+            MappingProxyType: 名前・背景色・カード裏面、または見つからない場合は None
+        """
+        return self.environments.get(environment_type)
@@ -3,10 +3,13 @@
 
 """
 設定管理モジュール
+
+設定ファイルの保存は SaveManager に予約し、まとめてバックグラウンドで書き込む。
 """
 
 import json
 import os
+from utils.save_manager import SaveManager
 
 class Config:
     """設定を管理するクラス"""
@@ -25,11 +28,24 @@ class Config:
         self.default_config = {
             "screen_width": 800,
             "screen_height": 600,
+            "render_scale": 1.0,
             "fps": 30,
+            "idle_throttling": True,
+            "idle_timeout_ms": 250,
             "sound_volume": 0.7,
             "music_volume": 0.5,
             "fullscreen": False,
-            "difficulty": "easy"
+            "difficulty": "easy",
+            "image_cache_budget_mb": 64,
+            "dirty_rect_rendering": False,
+            "frame_profiler": False,
+            "frame_profile_output": "frame_profile.json",
+            "startup_report": False,
+            "startup_report_output": "startup_report.json",
+            "surface_tracking": False,
+            "surface_tracking_python": False,
+            "surface_report_output": "surface_report.json",
+            "progress_file": "save_data.json"
         }
         
         # 設定がなければデフォルト値を使用
@@ -54,12 +70,12 @@ class Config:
         return {}
     
     def save_config(self):
-        """設定ファイルを保存する"""
-        try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-        except IOError:
-            print(f"設定ファイルの保存に失敗しました: {self.config_file}")
+        """
+        設定ファイルの保存を予約する
+        
+        続けて設定した値はまとめて1回で書き込む（書き込みはフレームを止めないようバックグラウンドで行う）。
+        """
+        SaveManager.get_instance().schedule(self.config_file, self.config)
     
     def get(self, key, default=None):
         """
@@ -7,6 +7,16 @@
 
 import os
 import json
+import struct
+import marshal
+from utils.catalog import Catalog
+
+# 解析済みの設定をバイナリで保存するキャッシュファイルの拡張子（<設定ファイル>.json.cache）
+CONFIG_CACHE_SUFFIX = ".cache"
+
+# キャッシュファイルのヘッダー（識別子, marshal の形式, 元ファイルの更新時刻（ns）, 元ファイルのサイズ）
+CONFIG_CACHE_MAGIC = b"CFGC"
+CONFIG_CACHE_HEADER = struct.Struct("<4sHqq")
 
 class ConfigLoader:
     """設定ファイルを読み込むクラス"""
@@ -31,6 +41,9 @@ class ConfigLoader:
         # 設定のキャッシュ
         self.configs = {}
         
+        # キャラクターと環境のカタログ（最初に必要になったときに一度だけ作成する）
+        self.catalog = None
+        
         # データディレクトリのパス
         self.data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
         
@@ -56,6 +69,12 @@ class ConfigLoader:
         # 設定ファイルのパス
         config_path = os.path.join(self.data_path, f"{config_name}.json")
         
+        # 解析済みのキャッシュファイルがあればそれを使う
+        config_data = self._load_config_cache(config_path)
+        if config_data is not None:
+            self.configs[config_name] = config_data
+            return config_data
+        
         # 設定ファイルを読み込む
         try:
             with open(config_path, "r", encoding="utf-8") as f:
@@ -63,6 +82,7 @@ class ConfigLoader:
             
             # キャッシュに保存
             self.configs[config_name] = config_data
+            self._save_config_cache(config_path, config_data)
             
             return config_data
         except FileNotFoundError:
@@ -72,6 +92,61 @@ class ConfigLoader:
             print(f"設定ファイルの形式が不正です: {config_path}")
             return {}
     
+    def _load_config_cache(self, config_path):
+        """
+        解析済みの設定をキャッシュファイルから読み込む
+        
+        元の設定ファイルの更新時刻とサイズがヘッダーと一致しない場合は使わない。
+        
+        Args:
+            config_path (str): 設定ファイルのパス
+            
+        Returns:
+            dict: 設定データ、またはキャッシュが使えない場合は None
+        """
+        try:
+            stat = os.stat(config_path)
+            with open(config_path + CONFIG_CACHE_SUFFIX, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        if len(data) < CONFIG_CACHE_HEADER.size:
+            return None
+        magic, marshal_version, mtime_ns, size = CONFIG_CACHE_HEADER.unpack_from(data)
+        if (magic != CONFIG_CACHE_MAGIC or marshal_version != marshal.version
+                or mtime_ns != stat.st_mtime_ns or size != stat.st_size):
+            return None
+        
+        try:
+            return marshal.loads(data[CONFIG_CACHE_HEADER.size:])
+        except (EOFError, ValueError, TypeError):
+            return None
+    
+    def _save_config_cache(self, config_path, config_data):
+        """
+        解析済みの設定をキャッシュファイルに保存する
+        
+        書き込めない環境（読み取り専用のディレクトリなど）では何もしない。
+        
+        Args:
+            config_path (str): 設定ファイルのパス
+            config_data (dict): 設定データ
+        """
+        cache_path = config_path + CONFIG_CACHE_SUFFIX
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            stat = os.stat(config_path)
+            header = CONFIG_CACHE_HEADER.pack(CONFIG_CACHE_MAGIC, marshal.version, stat.st_mtime_ns, stat.st_size)
+            with open(temp_path, "wb") as f:
+                f.write(header + marshal.dumps(config_data))
+            os.replace(temp_path, cache_path)
+        except (OSError, ValueError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
     def get_environments(self):
         """
         環境設定を取得する
@@ -91,6 +166,17 @@ class ConfigLoader:
         """
         return self.load_config("characters")
     
+    def get_catalog(self):
+        """
+        キャラクターと環境のカタログを取得する
+        
+        Returns:
+            Catalog: カタログ
+        """
+        if self.catalog is None:
+            self.catalog = Catalog(self.get_characters(), self.get_environments())
+        return self.catalog
+    
     def get_game_config(self):
         """
         ゲーム設定を取得する
@@ -7,6 +7,12 @@
 
 import os
 import pygame
+from utils.render_target import scaled
+from utils.surface_cache import SurfaceCache
+from utils.surface_tracker import track_surface, CATEGORY_TEXT
+
+# 描画済みテキストのキャッシュのメモリ予算
+TEXT_CACHE_BUDGET = 8 * 1024 * 1024
 
 class FontManager:
     """フォントを管理するクラス"""
@@ -31,6 +37,9 @@ class FontManager:
         # フォントのキャッシュ
         self.fonts = {}
         
+        # 描画済みテキストのキャッシュ（メモリ予算を超えると古いものから破棄する）
+        self.text_cache = SurfaceCache(TEXT_CACHE_BUDGET)
+        
         # フォントファイルのパス
         self.font_path = os.path.join("assets", "fonts", "MPLUSRounded1c-Medium.ttf")
         
@@ -44,8 +53,10 @@ class FontManager:
         """
         指定したサイズのフォントを取得する
         
+        サイズは基準解像度でのピクセル数で指定し、内部解像度に合わせた大きさのフォントを作成する。
+        
         Args:
-            size (int): フォントサイズ
+            size (int): フォントサイズ（基準解像度）
             
         Returns:
             pygame.font.Font: フォントオブジェクト
@@ -55,18 +66,52 @@ class FontManager:
             return self.fonts[size]
         
         # フォントを作成
+        pixel_size = scaled(size)
         try:
             if self.font_path:
-                font = pygame.font.Font(self.font_path, size)
+                font = pygame.font.Font(self.font_path, pixel_size)
             else:
-                font = pygame.font.SysFont(None, size)
+                font = pygame.font.SysFont(None, pixel_size)
         except:
             # フォントの読み込みに失敗した場合はデフォルトフォントを使用
             print(f"フォントの読み込みに失敗しました: {self.font_path}")
-            print(f"システムのデフォルトフォントを使用します。サイズ: {size}")
-            font = pygame.font.SysFont(None, size)
+            print(f"システムのデフォルトフォントを使用します。サイズ: {pixel_size}")
+            font = pygame.font.SysFont(None, pixel_size)
         
         # キャッシュに保存
         self.fonts[size] = font
         
         return font
+    
+    def render_cached(self, text, size, color, antialias=True):
+        """
+        テキストを描画したサーフェスを取得する
+        
+        同じテキスト・サイズ・色の組み合わせは一度だけ描画してキャッシュする。
+        返したサーフェスは共有されるため、呼び出し側で変更しないこと。
+        
+        Args:
+            text (str): 描画するテキスト
+            size (int): フォントサイズ（基準解像度）
+            color (tuple): テキストの色 (R, G, B)
+            antialias (bool): アンチエイリアスをかけるかどうか
+            
+        Returns:
+            pygame.Surface: テキストを描画したサーフェス
+        """
+        cache_key = (text, size, tuple(color), antialias)
+        text_surface = self.text_cache.get(cache_key)
+        if text_surface is None:
+            text_surface = self.get_font(size).render(text, antialias, color)
+            self.text_cache.put(cache_key, text_surface)
+            track_surface(text_surface, CATEGORY_TEXT, cached=True)
+        return text_surface
+    
+    def get_text_cache_stats(self):
+        """
+        描画済みテキストのキャッシュの統計情報を取得する
+        
+        Returns:
+            dict: ヒット数・ミス数・破棄数・使用バイト数など
+        """
+        return self.text_cache.get_stats()
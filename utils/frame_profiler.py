@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+フレーム時間計測モジュール
+
+1フレームをイベント処理・更新・描画・画面反映の区間に分けて計測し、
+画面ごとにパーセンタイルとヒストグラムを集計する。
+"""
+
+import json
+import time
+import pygame
+from collections import deque
+
+# 計測する区間
+PHASES = ("events", "update", "draw", "flip")
+
+# 画面ごとに保持するフレーム数
+PROFILE_WINDOW_FRAMES = 600
+
+# ヒストグラムの区切り（ミリ秒）
+HISTOGRAM_BUCKETS_MS = (4, 8, 16, 33, 50, 100)
+
+# HUD の表示内容を更新する間隔（秒）
+HUD_REFRESH_SECONDS = 0.5
+
+def get_percentile(sorted_values, percent):
+    """
+    並べ替え済みの値からパーセンタイルを取得する
+    
+    Args:
+        sorted_values (list): 昇順に並べた値
+        percent (float): パーセンタイル（0〜100）
+    
+    Returns:
+        float: パーセンタイル値（値がなければ 0.0）
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """フレーム時間を区間ごとに計測するクラス"""
+    
+    def __init__(self, enabled=False, output_file=None):
+        """
+        フレームプロファイラを初期化する
+        
+        Args:
+            enabled (bool): 計測するかどうか
+            output_file (str, optional): 終了時に集計結果を書き出す JSON ファイルのパス
+        """
+        self.enabled = enabled
+        self.output_file = output_file
+        
+        # HUD を表示するかどうか
+        self.hud_visible = False
+        self.hud_surface = None
+        self.hud_updated_at = 0.0
+        
+        # 前回 HUD を描画した領域（差分描画モードで前回の表示を消すために使う）
+        self.hud_drawn_rect = None
+        
+        # 画面クラス名 → 直近のフレーム（区間名 → ミリ秒）
+        self.samples = {}
+        
+        # 画面クラス名 → ヒストグラム（区切りごとのフレーム数。最後は最大値超え）
+        self.histograms = {}
+        
+        # 計測中のフレーム
+        self.frame = {}
+        self.frame_started_at = 0.0
+        self.lap_started_at = 0.0
+    
+    def begin_frame(self):
+        """フレームの計測を開始する"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame = {}
+        self.frame_started_at = now
+        self.lap_started_at = now
+    
+    def lap(self, phase):
+        """
+        直前の区切りからの経過時間を区間の時間として記録する
+        
+        Args:
+            phase (str): 区間名（PHASES のいずれか）
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame[phase] = self.frame.get(phase, 0.0) + (now - self.lap_started_at) * 1000
+        self.lap_started_at = now
+    
+    def end_frame(self, screen_name):
+        """
+        フレームの計測を終了して画面ごとに集計する
+        
+        Args:
+            screen_name (str): 計測中に表示していた画面のクラス名
+        """
+        if not self.enabled:
+            return
+        frame = self.frame
+        frame["total"] = (time.perf_counter() - self.frame_started_at) * 1000
+        
+        samples = self.samples.get(screen_name)
+        if samples is None:
+            samples = self.samples[screen_name] = deque(maxlen=PROFILE_WINDOW_FRAMES)
+            self.histograms[screen_name] = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        samples.append(frame)
+        
+        histogram = self.histograms[screen_name]
+        for index, limit in enumerate(HISTOGRAM_BUCKETS_MS):
+            if frame["total"] < limit:
+                histogram[index] += 1
+                break
+        else:
+            histogram[-1] += 1
+    
+    def toggle_hud(self):
+        """HUD の表示を切り替える"""
+        if not self.enabled:
+            return
+        self.hud_visible = not self.hud_visible
+        self.hud_surface = None
+    
+    def get_stats(self):
+        """
+        画面ごとの集計結果を取得する
+        
+        Returns:
+            dict: 画面クラス名をキーとし、区間ごとの p50/p95/p99・平均とヒストグラムを値とする辞書
+        """
+        stats = {}
+        for screen_name, samples in self.samples.items():
+            phases = {}
+            for phase in PHASES + ("total",):
+                values = sorted(frame.get(phase, 0.0) for frame in samples)
+                phases[phase] = {
+                    "p50": round(get_percentile(values, 50), 3),
+                    "p95": round(get_percentile(values, 95), 3),
+                    "p99": round(get_percentile(values, 99), 3),
+                    "mean": round(sum(values) / len(values), 3) if values else 0.0
+                }
+            
+            labels = [f"<{limit}ms" for limit in HISTOGRAM_BUCKETS_MS]
+            labels.append(f">={HISTOGRAM_BUCKETS_MS[-1]}ms")
+            stats[screen_name] = {
+                "frames": len(samples),
+                "phases": phases,
+                "histogram": dict(zip(labels, self.histograms[screen_name]))
+            }
+        return stats
+    
+    def get_hud_rect(self, screen_name):
+        """
+        HUD を再描画する領域を取得する（差分描画モードで使用）
+        
+        表示内容が短くなったときや HUD を非表示にしたときに前回の表示が残らないよう、
+        前回描画した領域と今回描画する領域を合わせて返す。
+        
+        Args:
+            screen_name (str): 表示中の画面のクラス名
+        
+        Returns:
+            pygame.Rect: HUD の領域、または再描画が必要ない場合は None
+        """
+        previous_rect = self.hud_drawn_rect
+        if not self.hud_visible:
+            self.hud_drawn_rect = None
+            return previous_rect
+        
+        self._refresh_hud(screen_name)
+        hud_rect = self.hud_surface.get_rect(topleft=(4, 4))
+        if previous_rect:
+            return hud_rect.union(previous_rect)
+        return hud_rect
+    
+    def draw_hud(self, screen, screen_name):
+        """
+        現在の画面の計測結果を HUD として描画する
+        
+        Args:
+            screen (pygame.Surface): 描画先の画面
+            screen_name (str): 表示中の画面のクラス名
+        """
+        if not self.hud_visible:
+            return
+        
+        self._refresh_hud(screen_name)
+        screen.blit(self.hud_surface, (4, 4))
+        self.hud_drawn_rect = self.hud_surface.get_rect(topleft=(4, 4))
+    
+    def _refresh_hud(self, screen_name):
+        """
+        HUD の表示内容を必要に応じて作り直す
+        
+        Args:
+            screen_name (str): 表示中の画面のクラス名
+        """
+        # 文字の描画は重いため、一定間隔でのみ作り直す
+        now = time.monotonic()
+        if self.hud_surface is None or now - self.hud_updated_at >= HUD_REFRESH_SECONDS:
+            self.hud_surface = self._render_hud(screen_name)
+            self.hud_updated_at = now
+    
+    def _render_hud(self, screen_name):
+        """
+        HUD の表示内容をサーフェスに描画する
+        
+        Args:
+            screen_name (str): 表示中の画面のクラス名
+        
+        Returns:
+            pygame.Surface: HUD のサーフェス
+        """
+        from utils.font_manager import FontManager
+        from utils.surface_tracker import track_surface, CATEGORY_OVERLAYS
+        
+        lines = [f"{screen_name}  p50 / p95 / p99 (ms)"]
+        stats = self.get_stats().get(screen_name)
+        if stats:
+            for phase in PHASES + ("total",):
+                values = stats["phases"][phase]
+                lines.append(f"{phase:<6} {values['p50']:6.2f} {values['p95']:6.2f} {values['p99']:6.2f}")
+        
+        font = FontManager.get_instance().get_font(16)
+        line_height = font.get_linesize()
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 8
+        
+        hud = pygame.Surface((width, line_height * len(rendered) + 8), pygame.SRCALPHA)
+        hud.fill((0, 0, 0, 160))
+        for index, surface in enumerate(rendered):
+            hud.blit(surface, (4, 4 + index * line_height))
+        track_surface(hud, CATEGORY_OVERLAYS, owner=self)
+        return hud
+    
+    def dump(self):
+        """集計結果を JSON ファイルに書き出す"""
+        if not self.enabled or not self.output_file or not self.samples:
+            return
+        try:
+            with open(self.output_file, "w", encoding="utf-8") as f:
+                json.dump(self.get_stats(), f, indent=2, ensure_ascii=False)
+        except IOError:
+            print(f"フレーム計測結果の保存に失敗しました: {self.output_file}")
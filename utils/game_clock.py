@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ゲーム時間の管理モジュール
+
+ゲームの処理を描画のフレームレートと切り離し、実際の経過時間に合わせて固定の刻み幅で進める。
+描画が遅れてフレームが落ちても、その分だけ刻みをまとめて進めるため、ゲームの速さは変わらない。
+"""
+
+import math
+import time
+
+class GameClock:
+    """固定の刻み幅でゲームの処理を進めるための時計クラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    # 1秒あたりの刻みの数（アニメーションの速さはこの刻みごとの値で調整している）
+    STEPS_PER_SECOND = 30
+    
+    # 1刻みの時間（ミリ秒）
+    STEP_MS = 1000 / STEPS_PER_SECOND
+    
+    # 1フレームとして扱う最大の経過時間（ミリ秒）
+    # ウィンドウの移動やタブの切り替えで止まっていた時間を一度に進めないようにする
+    MAX_FRAME_MS = 250
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            GameClock: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = GameClock()
+        return cls._instance
+    
+    def __init__(self):
+        """時計を初期化する"""
+        # 前回の tick の時刻（ミリ秒）
+        self.last_tick_ms = None
+        
+        # 刻みに満たずに持ち越している時間（ミリ秒）
+        self.accumulator_ms = 0.0
+        
+        # 直前のフレームの経過時間（ミリ秒）
+        self.frame_ms = 0.0
+        
+        # 直前のフレームで進める刻みの数
+        self.steps = 0
+        
+        # 描画時の補間係数（前の刻みから次の刻みまでの割合、0〜1）
+        self.alpha = 0.0
+    
+    def tick(self):
+        """
+        前回の tick からの経過時間を測り、このフレームで進める刻みの数を求める
+        
+        メインループから毎フレーム、画面の update の前に呼び出す。
+        """
+        now_ms = time.perf_counter() * 1000
+        if self.last_tick_ms is None:
+            self.frame_ms = 0.0
+        else:
+            self.frame_ms = min(now_ms - self.last_tick_ms, self.MAX_FRAME_MS)
+        self.last_tick_ms = now_ms
+        
+        self.accumulator_ms += self.frame_ms
+        self.steps = int(self.accumulator_ms // self.STEP_MS)
+        self.accumulator_ms -= self.steps * self.STEP_MS
+        self.alpha = self.accumulator_ms / self.STEP_MS
+    
+    def reset(self):
+        """
+        次の tick までの経過時間を数えないようにする
+        
+        アイドル中に入力を待っていた時間をゲーム時間として進めないために使う。
+        """
+        self.last_tick_ms = time.perf_counter() * 1000
+    
+    def get_steps_for(self, duration_ms):
+        """
+        時間を刻みの数に換算する
+        
+        Args:
+            duration_ms (float): 時間（ミリ秒）
+        
+        Returns:
+            int: 刻みの数（端数は切り上げ）
+        """
+        return math.ceil(duration_ms * self.STEPS_PER_SECOND / 1000)
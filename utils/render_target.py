@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+描画解像度の管理モジュール
+
+画面は基準解像度（設定の screen_width × screen_height）のウィンドウに表示しつつ、
+描画は render_scale 倍の内部解像度で行い、表示時の拡大は SDL のハードウェア拡大（pygame.SCALED）に任せる。
+画面のレイアウトや画像のサイズは基準解像度でのピクセル数で書き、scaled で内部解像度に変換する。
+マウスの座標は SDL が内部解像度に変換するため、画面側での変換は不要。
+"""
+
+import os
+import time
+import pygame
+
+# 描画の倍率を自動で決める場合の設定値
+AUTO_RENDER_SCALE = "auto"
+
+def scaled(value):
+    """
+    基準解像度での長さ・サイズを内部解像度に変換する
+    
+    Args:
+        value (int or tuple): 長さ、または (width, height) などのタプル
+    
+    Returns:
+        int or tuple: 内部解像度での長さ、またはタプル
+    """
+    return RenderTarget.get_instance().scale_value(value)
+
+
+class RenderTarget:
+    """内部解像度で描画する画面を作成し、基準解像度との倍率を管理するクラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    # 設定できる倍率の範囲
+    MIN_SCALE = 0.5
+    MAX_SCALE = 1.0
+    
+    # 自動で決める場合に、描画が遅い端末で使う倍率
+    AUTO_LOW_SCALE = 0.75
+    
+    # 自動で決める場合に、画面全体の描画を計測する回数
+    AUTO_PROBE_BLITS = 5
+    
+    # 画面全体の描画1回にこれ以上かかる端末では倍率を下げる（ミリ秒）
+    AUTO_PROBE_BUDGET_MS = 4.0
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            RenderTarget: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = RenderTarget()
+        return cls._instance
+    
+    @classmethod
+    def clamp_scale(cls, render_scale):
+        """
+        設定された倍率を設定できる範囲に収める
+        
+        Args:
+            render_scale (float): 設定された倍率
+        
+        Returns:
+            float: 範囲内の倍率
+        """
+        return min(cls.MAX_SCALE, max(cls.MIN_SCALE, float(render_scale)))
+    
+    def __init__(self):
+        """描画解像度を初期化する（create_display を呼ぶまでは倍率 1.0）"""
+        # 基準解像度（ウィンドウのサイズ）と、内部解像度（描画する画面のサイズ）
+        self.logical_size = (800, 600)
+        self.size = self.logical_size
+        
+        # 基準解像度に対する内部解像度の倍率
+        self.scale = 1.0
+        
+        # 描画する画面
+        self.surface = None
+    
+    def create_display(self, logical_size, render_scale=1.0):
+        """
+        内部解像度の画面を作成する
+        
+        Args:
+            logical_size (tuple): 基準解像度 (width, height)
+            render_scale (float or str): 描画の倍率、または "auto"（画面全体の描画時間を計測して決める）
+        
+        Returns:
+            pygame.Surface: 描画する画面
+        """
+        self.logical_size = tuple(logical_size)
+        
+        if render_scale == AUTO_RENDER_SCALE:
+            self._set_mode(1.0)
+            scale = self.AUTO_LOW_SCALE if self.measure_fill_ms() > self.AUTO_PROBE_BUDGET_MS else 1.0
+        else:
+            scale = self.clamp_scale(render_scale)
+        
+        if self.surface is None or scale != self.scale:
+            self._set_mode(scale)
+        return self.surface
+    
+    def _set_mode(self, scale):
+        """
+        倍率に応じた画面を作成する
+        
+        Args:
+            scale (float): 描画の倍率
+        """
+        self.scale = scale
+        self.size = (round(self.logical_size[0] * scale), round(self.logical_size[1] * scale))
+        
+        if scale == 1.0:
+            self.surface = pygame.display.set_mode(self.size)
+            return
+        
+        # 拡大時のにじみを抑えるため線形補間で拡大する（環境変数で指定されていればそれに従う）
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear")
+        self.surface = pygame.display.set_mode(self.size, pygame.SCALED)
+        
+        # SCALED は整数倍のウィンドウを作るため、ウィンドウを基準解像度に合わせる
+        # （ウィンドウを操作できない環境では作成されたサイズのまま表示する）
+        try:
+            from pygame._sdl2.video import Window
+            Window.from_display_module().size = self.logical_size
+        except (ImportError, pygame.error):
+            pass
+    
+    def measure_fill_ms(self):
+        """
+        画面全体の描画にかかる時間を計測する
+        
+        Returns:
+            float: 画面全体に不透明な画像を1回描画する時間の中央値（ミリ秒）
+        """
+        source = pygame.Surface(self.surface.get_size()).convert()
+        source.fill((240, 248, 255))
+        
+        times = []
+        for _ in range(self.AUTO_PROBE_BLITS):
+            started_at = time.perf_counter()
+            self.surface.blit(source, (0, 0))
+            times.append((time.perf_counter() - started_at) * 1000)
+        return sorted(times)[len(times) // 2]
+    
+    def scale_value(self, value):
+        """
+        基準解像度での長さ・サイズを内部解像度に変換する
+        
+        正の長さは 1 ピクセル未満にならないようにする（線の太さが 0 になると塗りつぶしになるため）。
+        
+        Args:
+            value (int or tuple): 長さ、またはタプル
+        
+        Returns:
+            int or tuple: 内部解像度での長さ、またはタプル
+        """
+        if self.scale == 1.0:
+            return value
+        if isinstance(value, tuple):
+            return tuple(self.scale_value(v) for v in value)
+        result = round(value * self.scale)
+        return max(1, result) if value > 0 else result
@@ -6,7 +6,41 @@
 """
 
 import os
+import json
+import queue
+import hashlib
+import platform
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import pygame
+from utils.surface_cache import SurfaceCache
+from utils.surface_tracker import (
+    SurfaceTracker,
+    track_surface,
+    CATEGORY_BACKGROUNDS,
+    CATEGORY_CARD_FACES,
+    CATEGORY_CARD_BACKS,
+    CATEGORY_CARD_ATLASES,
+    CATEGORY_THUMBNAILS,
+    CATEGORY_OTHER,
+)
+from utils.texture_atlas import TextureAtlas
+
+# 事前ベイク済み画像の保存先（assets/ 以下）とマニフェスト
+BAKED_DIR_NAME = "baked"
+BAKED_MANIFEST_NAME = "manifest.json"
+BAKED_MANIFEST_VERSION = 2
+
+# 画像キャッシュのメモリ予算の既定値
+DEFAULT_IMAGE_CACHE_BUDGET = 64 * 1024 * 1024
+
+# デコード済みの元画像のキャッシュのメモリ予算と保持時間の既定値
+DEFAULT_SOURCE_CACHE_BUDGET = 64 * 1024 * 1024
+DEFAULT_SOURCE_CACHE_IDLE_SECONDS = 30
+
+# 先読みに使うワーカースレッドの最大数
+PRELOAD_MAX_WORKERS = 4
 
 class ResourceLoader:
     """リソースを読み込むクラス"""
@@ -14,6 +48,11 @@ class ResourceLoader:
     # シングルトンインスタンス
     _instance = None
     
+    # 派生画像の種類
+    EFFECT_FADED = "faded"
+    EFFECT_GREYED = "greyed"
+    EFFECT_HIGHLIGHTED = "highlighted"
+    
     @classmethod
     def get_instance(cls):
         """
@@ -28,8 +67,20 @@ class ResourceLoader:
     
     def __init__(self):
         """リソースローダーを初期化する"""
-        # 画像のキャッシュ
-        self.images = {}
+        # 画像のキャッシュ（メモリ予算を超えると古いものから破棄する）
+        self.images = SurfaceCache(DEFAULT_IMAGE_CACHE_BUDGET, on_remove=self._forget_image)
+        
+        # キャッシュしたサーフェスの id → キャッシュキー（派生画像の親を探すために使う）
+        self.image_keys = {}
+        
+        # サーフェスのメモリ計測
+        self.surface_tracker = SurfaceTracker.get_instance()
+        
+        # デコード済みの元画像のキャッシュ（サイズ違いはここからリサイズする）
+        # ワーカースレッドからも使うため、ロックを取ってから操作する
+        self.sources = SurfaceCache(DEFAULT_SOURCE_CACHE_BUDGET, DEFAULT_SOURCE_CACHE_IDLE_SECONDS)
+        self.sources_lock = threading.Lock()
+        self.source_path_locks = {}
         
         # 画像のパス
         self.image_path = os.path.join("assets", "images")
@@ -38,8 +89,30 @@ class ResourceLoader:
         if not os.path.exists(self.image_path):
             print(f"警告: 画像ディレクトリが見つかりません: {self.image_path}")
             os.makedirs(self.image_path, exist_ok=True)
+        
+        # 事前ベイク済み画像のパスとマニフェスト
+        self.baked_path = os.path.join("assets", BAKED_DIR_NAME)
+        self.baked_manifest = self._load_baked_manifest()
+        
+        # 元画像がベイク時から変わっていないかの確認結果（セッション中に一度だけ調べる）
+        self.baked_source_checks = {}
+        
+        # 先読みの状態
+        self.preload_tasks = {}
+        self.preload_futures = {}
+        self.preload_results = queue.Queue()
+        self.preload_jobs = collections.deque()
+        
+        # Emscripten環境ではスレッドが使えないため、メインスレッドで少しずつ読み込む
+        if platform.system() == "Emscripten":
+            self.preload_executor = None
+        else:
+            self.preload_executor = ThreadPoolExecutor(
+                max_workers=min(PRELOAD_MAX_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="preload"
+            )
     
-    def load_image(self, path, scale=None, keep_aspect_ratio=True):
+    def load_image(self, path, scale=None, keep_aspect_ratio=True, owner=None):
         """
         画像を読み込む
         
@@ -47,68 +120,433 @@ class ResourceLoader:
             path (str): 画像ファイルのパス（assets/images/からの相対パス）
             scale (tuple, optional): 画像のスケール (width, height)
             keep_aspect_ratio (bool): アスペクト比を維持するかどうか
+            owner (optional): 画像をピン留めする所有者（画面など）
             
         Returns:
             pygame.Surface: 読み込んだ画像
         """
         # キャッシュキー
-        cache_key = f"{path}_{scale}_{keep_aspect_ratio}"
+        cache_key = self._get_cache_key(path, scale, keep_aspect_ratio)
         
         # キャッシュにあればそれを返す
-        if cache_key in self.images:
-            return self.images[cache_key]
+        image = self.images.get(cache_key)
+        if image is not None:
+            if owner is not None:
+                self.images.pin(cache_key, owner)
+                self.surface_tracker.set_owner(image, owner)
+            return image
         
-        # 画像の完全パス
-        full_path = os.path.join(self.image_path, path)
+        # 先読み中であれば完了を待って結果を使う
+        if cache_key in self.preload_futures:
+            future, _ = self.preload_futures.pop(cache_key)
+            image = self._store_decoded_image(cache_key, future.result(), scale, owner)
+            self._complete_preload(cache_key)
+            return image
         
-        # 画像を読み込む
-        try:
-            image = pygame.image.load(full_path).convert_alpha()
+        image = self._decode_image(path, scale, keep_aspect_ratio)
+        return self._store_decoded_image(cache_key, image, scale, owner)
+    
+    def release_images(self, owner):
+        """
+        所有者がピン留めした画像をすべて解除する
+        
+        Args:
+            owner: ピン留めした所有者（画面など）
+        """
+        self.images.release(owner)
+    
+    def set_cache_budget(self, budget_bytes):
+        """
+        画像キャッシュのメモリ予算を設定する
+        
+        Args:
+            budget_bytes (int): キャッシュに保持する画像の合計バイト数の上限
+        """
+        self.images.set_budget(budget_bytes)
+    
+    def get_cache_stats(self):
+        """
+        画像キャッシュの統計情報を取得する
+        
+        Returns:
+            dict: リサイズ済み画像（images）と元画像（sources）それぞれのヒット数・ミス数・破棄数・使用バイト数など
+        """
+        with self.sources_lock:
+            source_stats = self.sources.get_stats()
+        return {"images": self.images.get_stats(), "sources": source_stats}
+    
+    def _get_cache_key(self, path, scale, keep_aspect_ratio):
+        """
+        画像キャッシュのキーを取得する
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            scale (tuple): 画像のスケール (width, height)
+            keep_aspect_ratio (bool): アスペクト比を維持するかどうか
+            
+        Returns:
+            str: キャッシュキー
+        """
+        return f"{path}_{scale}_{keep_aspect_ratio}"
+    
+    def _decode_image(self, path, scale, keep_aspect_ratio):
+        """
+        画像をデコードしてリサイズする
+        
+        表示フォーマットへの変換は行わないため、ワーカースレッドからも呼び出せる。
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            scale (tuple): 画像のスケール (width, height)
+            keep_aspect_ratio (bool): アスペクト比を維持するかどうか
+            
+        Returns:
+            pygame.Surface: デコードした画像、または失敗した場合は None
+        """
+        # 事前ベイク済みの画像があればそれを使う
+        if scale:
+            baked_image = self._load_baked_image(path, scale, keep_aspect_ratio)
+            if baked_image:
+                return baked_image
+        
+        # 同じ元画像のデコードとリサイズは同時に行わない
+        with self._get_source_path_lock(path):
+            image = self._get_source_image(path)
+            if image is None:
+                return None
             
             # スケールが指定されていれば変更
             if scale:
-                if keep_aspect_ratio:
-                    # アスペクト比を維持してリサイズ
-                    original_width, original_height = image.get_size()
-                    target_width, target_height = scale
-                    
-                    # 縦横比を計算
-                    width_ratio = target_width / original_width
-                    height_ratio = target_height / original_height
-                    
-                    # 小さい方の比率を使用してアスペクト比を維持
-                    ratio = min(width_ratio, height_ratio)
-                    
-                    new_width = int(original_width * ratio)
-                    new_height = int(original_height * ratio)
-                    
-                    # リサイズした画像を作成
-                    resized_image = pygame.transform.scale(image, (new_width, new_height))
-                    
-                    # 指定サイズの透明な画像を作成
-                    final_image = pygame.Surface(scale, pygame.SRCALPHA)
-                    
-                    # 中央に配置
-                    x_offset = (target_width - new_width) // 2
-                    y_offset = (target_height - new_height) // 2
-                    
-                    final_image.blit(resized_image, (x_offset, y_offset))
-                    image = final_image
-                else:
-                    # アスペクト比を無視してリサイズ
-                    image = pygame.transform.scale(image, scale)
-            
-            # キャッシュに保存
-            self.images[cache_key] = image
+                image = scale_image(image, scale, keep_aspect_ratio)
+        return image
+    
+    def _get_source_path_lock(self, path):
+        """
+        元画像ごとのロックを取得する
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            
+        Returns:
+            threading.Lock: 元画像のロック
+        """
+        with self.sources_lock:
+            return self.source_path_locks.setdefault(path, threading.Lock())
+    
+    def _get_source_image(self, path):
+        """
+        デコード済みの元画像を取得する
+        
+        キャッシュになければディスクから読み込んでデコードする。
+        呼び出し側で元画像ごとのロックを取っておく。
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
             
+        Returns:
+            pygame.Surface: デコードした元画像、または失敗した場合は None
+        """
+        with self.sources_lock:
+            image = self.sources.get(path)
+        if image is not None:
             return image
-        except pygame.error as e:
+        
+        # 画像の完全パス
+        full_path = os.path.join(self.image_path, path)
+        
+        # 画像を読み込む
+        try:
+            image = pygame.image.load(full_path)
+        except (pygame.error, FileNotFoundError) as e:
             print(f"画像の読み込みに失敗しました: {full_path}")
             print(f"エラー: {e}")
+            return None
+        
+        with self.sources_lock:
+            self.sources.put(path, image)
+        return image
+    
+    def _store_decoded_image(self, cache_key, image, scale, owner=None):
+        """
+        デコードした画像を表示フォーマットに変換してキャッシュに保存する
+        
+        Args:
+            cache_key (str): キャッシュキー
+            image (pygame.Surface): デコードした画像、または None
+            scale (tuple): 画像のスケール (width, height)
+            owner (optional): 画像をピン留めする所有者（画面など）
             
+        Returns:
+            pygame.Surface: 変換した画像、または失敗した場合はプレースホルダー画像
+        """
+        if image is None:
             # 代わりにプレースホルダー画像を返す
-            placeholder = self._create_placeholder_image(scale)
-            return placeholder
+            return self._create_placeholder_image(scale)
+        
+        image = convert_for_display(image)
+        self.image_keys[id(image)] = cache_key
+        self.images.put(cache_key, image, owner)
+        track_surface(image, get_image_category(cache_key, scale), owner, cached=True)
+        return image
+    
+    def _forget_image(self, cache_key, image):
+        """
+        キャッシュから取り除かれた画像の逆引きを削除する
+        
+        Args:
+            cache_key (str): キャッシュキー
+            image: 取り除かれた画像（またはテクスチャアトラス）
+        """
+        surface = image.surface if isinstance(image, TextureAtlas) else image
+        self.image_keys.pop(id(surface), None)
+    
+    def get_effect_image(self, image, effect):
+        """
+        読み込み済みの画像から派生画像（半透明・グレー・強調）を取得する
+        
+        派生画像は一度だけ作成して親の画像と一緒にキャッシュし、親と一緒に破棄される。
+        サブサーフェス（アトラス内の領域など）の場合は親全体の派生画像から同じ領域を切り出す。
+        
+        Args:
+            image (pygame.Surface): ResourceLoader で読み込んだ画像
+            effect (str): 派生画像の種類（EFFECT_FADED など）
+            
+        Returns:
+            pygame.Surface: 派生画像
+        """
+        parent = image.get_parent()
+        if parent is not None:
+            parent_key = self.image_keys.get(id(parent))
+            parent_effect = self.get_effect_image(parent, effect)
+            if parent_key is None:
+                return parent_effect.subsurface(pygame.Rect(image.get_offset(), image.get_size()))
+            
+            name = (effect, image.get_offset(), image.get_size())
+            derived = self.images.get_derived(parent_key, name)
+            if derived is None:
+                derived = parent_effect.subsurface(pygame.Rect(image.get_offset(), image.get_size()))
+                self.images.put_derived(parent_key, name, derived, size=0)
+            return derived
+        
+        cache_key = self.image_keys.get(id(image))
+        if cache_key is None:
+            # キャッシュ管理外の画像はその場で作成する
+            return apply_effect(image, effect)
+        
+        derived = self.images.get_derived(cache_key, effect)
+        if derived is None:
+            derived = apply_effect(image, effect)
+            self.images.put_derived(cache_key, effect, derived)
+            track_surface(derived, self.surface_tracker.get_category(image) or CATEGORY_OTHER, cached=True)
+        return derived
+    
+    def preload_images(self, requests):
+        """
+        画像をワーカースレッドで先読みする
+        
+        デコードとリサイズはワーカースレッドで行い、表示フォーマットへの変換は
+        メインスレッドの process_preloaded で行う。
+        
+        Args:
+            requests (list): (path, scale, keep_aspect_ratio) のリスト
+            
+        Returns:
+            PreloadTask: 先読みの進捗
+        """
+        task = PreloadTask(len(requests))
+        
+        for path, scale, keep_aspect_ratio in requests:
+            cache_key = self._get_cache_key(path, scale, keep_aspect_ratio)
+            
+            # 読み込み済みであれば完了扱い
+            if cache_key in self.images:
+                task.completed += 1
+                continue
+            
+            # すでに先読み中であれば完了通知だけ追加する
+            if cache_key in self.preload_tasks:
+                self.preload_tasks[cache_key].append(task)
+                continue
+            self.preload_tasks[cache_key] = [task]
+            
+            if self.preload_executor:
+                future = self.preload_executor.submit(self._decode_image, path, scale, keep_aspect_ratio)
+                self.preload_futures[cache_key] = (future, scale)
+                future.add_done_callback(lambda _, key=cache_key: self.preload_results.put(key))
+            else:
+                # スレッドが使えない環境では 1 フレームに 1 枚ずつ読み込む
+                self.preload_jobs.append((cache_key, path, scale, keep_aspect_ratio))
+        
+        return task
+    
+    def preload(self, environment, difficulty):
+        """
+        ステージで使う画像（背景・カード表面・カード裏面）を先読みする
+        
+        Args:
+            environment (str): 環境（"jungle", "ocean"など）
+            difficulty (str): 難易度 ("easy", "normal", "hard")
+            
+        Returns:
+            PreloadTask: 先読みの進捗
+        """
+        from game.card import CardGrid
+        from game.character import Character
+        from game.environment import Environment
+        from utils.config_loader import ConfigLoader
+        
+        difficulty_config = ConfigLoader.get_instance().get_difficulty_config(difficulty)
+        screen_size = pygame.display.get_surface().get_size()
+        card_size = CardGrid.from_difficulty(difficulty_config, screen_size).card_size
+        
+        requests = [(self.get_background_image_path(environment), screen_size, False)]
+        for back_type in Environment.get_card_backs(environment):
+            requests.append((self.get_card_back_image_path(back_type), card_size, True))
+        for character in dict.fromkeys(Character.get_stage_characters(environment, difficulty)):
+            requests.append((self.get_character_image_path(character), card_size, True))
+        
+        return self.preload_images(requests)
+    
+    def process_preloaded(self):
+        """
+        先読みが完了した画像を表示フォーマットに変換してキャッシュに保存する
+        
+        メインループから毎フレーム呼び出す。
+        """
+        # しばらく使われていない元画像を破棄する
+        with self.sources_lock:
+            self.sources.expire()
+        
+        if self.preload_jobs:
+            cache_key, path, scale, keep_aspect_ratio = self.preload_jobs.popleft()
+            if cache_key not in self.images:
+                self._store_decoded_image(cache_key, self._decode_image(path, scale, keep_aspect_ratio), scale)
+            self._complete_preload(cache_key)
+        
+        while True:
+            try:
+                cache_key = self.preload_results.get_nowait()
+            except queue.Empty:
+                break
+            
+            # load_image で先に受け取られている場合は変換済み
+            if cache_key in self.preload_futures:
+                future, scale = self.preload_futures.pop(cache_key)
+                self._store_decoded_image(cache_key, future.result(), scale)
+            self._complete_preload(cache_key)
+    
+    def has_pending_preloads(self):
+        """
+        先読み中の画像があるかどうかを確認する
+        
+        Returns:
+            bool: process_preloaded で受け取る画像が残っている場合は True
+        """
+        return bool(self.preload_futures or self.preload_jobs)
+    
+    def _complete_preload(self, cache_key):
+        """
+        先読みの完了を進捗に反映する
+        
+        Args:
+            cache_key (str): キャッシュキー
+        """
+        for task in self.preload_tasks.pop(cache_key, []):
+            task.completed += 1
+    
+    def shutdown(self):
+        """ワーカースレッドを停止する"""
+        if self.preload_executor:
+            self.preload_executor.shutdown(wait=False, cancel_futures=True)
+            self.preload_executor = None
+    
+    def _load_baked_manifest(self):
+        """
+        事前ベイク済み画像のマニフェストを読み込む
+        
+        Returns:
+            dict: 元画像のパスをキーとするマニフェストのエントリー
+        """
+        manifest_path = os.path.join(self.baked_path, BAKED_MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return {}
+        
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            print(f"ベイク済み画像のマニフェストの読み込みに失敗しました: {manifest_path}")
+            return {}
+        
+        if manifest.get("version") != BAKED_MANIFEST_VERSION:
+            return {}
+        return manifest.get("images", {})
+    
+    def _load_baked_image(self, path, scale, keep_aspect_ratio):
+        """
+        事前ベイク済みの画像を読み込む
+        
+        元画像がベイク時から変わっている場合は None を返し、実行時のリサイズにフォールバックさせる。
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            scale (tuple): 画像のスケール (width, height)
+            keep_aspect_ratio (bool): アスペクト比を維持するかどうか
+            
+        Returns:
+            pygame.Surface: ベイク済みの画像、または None
+        """
+        entry = self.baked_manifest.get(normalize_asset_path(path))
+        if not entry:
+            return None
+        
+        variant_file = None
+        for variant in entry.get("variants", []):
+            if tuple(variant["size"]) == tuple(scale) and variant["keep_aspect_ratio"] == keep_aspect_ratio:
+                variant_file = variant["file"]
+                break
+        if variant_file is None:
+            return None
+        
+        # 元画像が変更されていればベイク済みの画像は使わない
+        if path not in self.baked_source_checks:
+            self.baked_source_checks[path] = self._is_baked_source_unchanged(path, entry)
+        if not self.baked_source_checks[path]:
+            return None
+        
+        baked_file = os.path.join(self.baked_path, *variant_file.split("/"))
+        try:
+            image = pygame.image.load(baked_file)
+        except (pygame.error, FileNotFoundError):
+            return None
+        
+        if image.get_size() != tuple(scale):
+            return None
+        return image
+    
+    def _is_baked_source_unchanged(self, path, entry):
+        """
+        元画像がベイク時から変わっていないかを確認する
+        
+        サイズと更新日時が一致すれば元画像は読まない。
+        アーカイブへの詰め直し（Web版のバンドルなど）で更新日時だけが変わっている場合は、
+        マニフェストに記録したハッシュと比べる。
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            entry (dict): マニフェストのエントリー
+            
+        Returns:
+            bool: 変わっていない場合は True
+        """
+        full_path = os.path.join(self.image_path, path)
+        source_stamp = get_file_stamp(full_path)
+        if source_stamp is None or source_stamp[1] != entry.get("source_size"):
+            return False
+        if source_stamp[0] == entry.get("source_mtime_ns"):
+            return True
+        source_hash = entry.get("source_hash")
+        return source_hash is not None and compute_file_hash(full_path) == source_hash
     
     def _create_placeholder_image(self, scale=(100, 100)):
         """
@@ -136,9 +574,10 @@ class ResourceLoader:
         pygame.draw.line(image, (100, 100, 100), (0, 0), (width, height), 2)
         pygame.draw.line(image, (100, 100, 100), (0, height), (width, 0), 2)
         
+        track_surface(image, CATEGORY_OTHER)
         return image
     
-    def load_character_image(self, character_type, environment, scale=None):
+    def load_character_image(self, character_type, environment, scale=None, owner=None):
         """
         キャラクター画像を読み込む
         
@@ -146,23 +585,17 @@ class ResourceLoader:
             character_type (str): キャラクターの種類（"lion", "monkey"など）
             environment (str): 環境（"jungle", "ocean"など）
             scale (tuple, optional): 画像のスケール (width, height)
+            owner (optional): 画像をピン留めする所有者（画面など）
             
         Returns:
             pygame.Surface: キャラクター画像
         """
-        # Characterクラスを使用して動物か恐竜かを判定
-        from game.character import Character
-        character_info = Character.get_character_info(character_type)
-        
-        if character_info and character_info.get("type") == Character.TYPE_ANIMAL:
-            path = os.path.join("characters", "animals", f"{character_type}.png")
-        else:
-            path = os.path.join("characters", "dinosaurs", f"{character_type}.png")
+        path = self.get_character_image_path(character_type)
         
         # キャラクター画像はアスペクト比を維持して読み込む
-        return self.load_image(path, scale, keep_aspect_ratio=True)
+        return self.load_image(path, scale, keep_aspect_ratio=True, owner=owner)
     
-    def load_card_image(self, card_type, flipped=False, scale=None, environment=None):
+    def load_card_image(self, card_type, flipped=False, scale=None, environment=None, owner=None):
         """
         カード画像を読み込む
         
@@ -171,6 +604,7 @@ class ResourceLoader:
             flipped (bool): 裏返しかどうか
             scale (tuple, optional): 画像のスケール (width, height)
             environment (str, optional): 環境（"jungle", "ocean"など）
+            owner (optional): 画像をピン留めする所有者（画面など）
             
         Returns:
             pygame.Surface: カード画像
@@ -189,31 +623,374 @@ class ResourceLoader:
                              "mushroom", "rock", "sand", "seaweed", "tree1", "tree2"]
             
             back_type = random.choice(card_backs)
-            path = os.path.join("card_backs", f"{back_type}.png")
+            path = self.get_card_back_image_path(back_type)
         else:
-            # 表面の画像 - Characterクラスを使用して動物か恐竜かを判定
-            from game.character import Character
-            character_info = Character.get_character_info(card_type)
-            
-            if character_info and character_info.get("type") == Character.TYPE_ANIMAL:
-                path = os.path.join("characters", "animals", f"{card_type}.png")
-            else:
-                path = os.path.join("characters", "dinosaurs", f"{card_type}.png")
+            # 表面の画像
+            path = self.get_character_image_path(card_type)
         
         # カード画像はアスペクト比を維持して読み込む
-        return self.load_image(path, scale, keep_aspect_ratio=True)
+        return self.load_image(path, scale, keep_aspect_ratio=True, owner=owner)
     
-    def load_background_image(self, environment, scale=None):
+    def load_card_atlas(self, environment, characters, scale, owner=None):
+        """
+        環境のカード表面とカード裏面を1枚にまとめたテクスチャアトラスを読み込む
+        
+        表面のキーは ("front", キャラクターID)、裏面のキーは ("back", 裏面の種類) になる。
+        アトラスに写した表面と裏面は、1枚ずつの画像としてはキャッシュに残さない。
+        
+        Args:
+            environment (str): 環境（"jungle", "ocean"など）
+            characters (list): カード表面に使うキャラクターIDのリスト
+            scale (tuple): カードのサイズ (width, height)
+            owner (optional): アトラスをピン留めする所有者（画面など）
+            
+        Returns:
+            TextureAtlas: テクスチャアトラス
+        """
+        from game.environment import Environment
+        
+        characters = sorted(set(characters))
+        card_backs = Environment.get_card_backs(environment)
+        
+        # キャッシュにあればそれを返す
+        cache_key = f"atlas_{environment}_{','.join(characters)}_{scale}"
+        atlas = self.images.get(cache_key)
+        if atlas is None:
+            atlas = TextureAtlas(scale, len(characters) + len(card_backs))
+            for character in characters:
+                path = self.get_character_image_path(character)
+                atlas.add(("front", character), self._load_atlas_image(path, scale))
+            for back_type in card_backs:
+                path = self.get_card_back_image_path(back_type)
+                atlas.add(("back", back_type), self._load_atlas_image(path, scale))
+            self.image_keys[id(atlas.surface)] = cache_key
+            self.images.put(cache_key, atlas, owner, size=atlas.get_bytes())
+            track_surface(atlas.surface, CATEGORY_CARD_ATLASES, owner, cached=True)
+        elif owner is not None:
+            self.images.pin(cache_key, owner)
+            self.surface_tracker.set_owner(atlas.surface, owner)
+        
+        return atlas
+    
+    def _load_atlas_image(self, path, scale):
+        """
+        アトラスに写す画像を読み込む
+        
+        先読み済みの画像はキャッシュから取り除き、先読み中の画像は結果を受け取ってキャッシュには保存しない。
+        アトラスに写した後は参照が残らないため、同じ画像をアトラスと個別の画像の両方で持たずに済む。
+        
+        Args:
+            path (str): 画像ファイルのパス（assets/images/からの相対パス）
+            scale (tuple): カードのサイズ (width, height)
+            
+        Returns:
+            pygame.Surface: 表示フォーマットの画像、または失敗した場合はプレースホルダー画像
+        """
+        cache_key = self._get_cache_key(path, scale, True)
+        
+        # 先読み済みであればキャッシュから取り除いて使う（他の画面がピン留めしていれば残す）
+        image = self.images.get(cache_key)
+        if image is not None:
+            self.images.discard(cache_key)
+            return image
+        
+        if cache_key in self.preload_futures:
+            future, _ = self.preload_futures.pop(cache_key)
+            image = future.result()
+            self._complete_preload(cache_key)
+        else:
+            if cache_key in self.preload_tasks:
+                # スレッドが使えない環境で順番待ちの先読みは取り消す
+                self.preload_jobs = collections.deque(job for job in self.preload_jobs if job[0] != cache_key)
+                self._complete_preload(cache_key)
+            image = self._decode_image(path, scale, True)
+        
+        if image is None:
+            return self._create_placeholder_image(scale)
+        return convert_for_display(image)
+    
+    def load_background_image(self, environment, scale=None, owner=None):
         """
         背景画像を読み込む
         
         Args:
             environment (str): 環境（"jungle", "ocean"など）
             scale (tuple, optional): 画像のスケール (width, height)
+            owner (optional): 画像をピン留めする所有者（画面など）
             
         Returns:
             pygame.Surface: 背景画像
         """
-        path = os.path.join("backgrounds", f"{environment}.png")
+        path = self.get_background_image_path(environment)
         # 背景画像はアスペクト比を維持せずに画面サイズに合わせる
-        return self.load_image(path, scale, keep_aspect_ratio=False)
\ No newline at end of file
+        return self.load_image(path, scale, keep_aspect_ratio=False, owner=owner)
+    
+    def get_character_image_path(self, character_type):
+        """
+        キャラクター画像のパスを取得する
+        
+        Args:
+            character_type (str): キャラクターの種類（"lion", "monkey"など）
+            
+        Returns:
+            str: 画像ファイルのパス（assets/images/からの相対パス）
+        """
+        # Characterクラスを使用して動物か恐竜かを判定
+        from game.character import Character
+        character_info = Character.get_character_info(character_type)
+        
+        if character_info and character_info.get("type") == Character.TYPE_ANIMAL:
+            return os.path.join("characters", "animals", f"{character_type}.png")
+        return os.path.join("characters", "dinosaurs", f"{character_type}.png")
+    
+    def get_card_back_image_path(self, back_type):
+        """
+        カード裏面画像のパスを取得する
+        
+        Args:
+            back_type (str): カード裏面の種類（"flower", "bubble"など）
+            
+        Returns:
+            str: 画像ファイルのパス（assets/images/からの相対パス）
+        """
+        return os.path.join("card_backs", f"{back_type}.png")
+    
+    def get_background_image_path(self, environment):
+        """
+        背景画像のパスを取得する
+        
+        Args:
+            environment (str): 環境（"jungle", "ocean"など）
+            
+        Returns:
+            str: 画像ファイルのパス（assets/images/からの相対パス）
+        """
+        return os.path.join("backgrounds", f"{environment}.png")
+
+
+class PreloadTask:
+    """画像の先読みの進捗を表すクラス"""
+    
+    def __init__(self, total):
+        """
+        先読みの進捗を初期化する
+        
+        Args:
+            total (int): 先読みする画像の数
+        """
+        self.total = total
+        self.completed = 0
+    
+    @property
+    def progress(self):
+        """
+        進捗の割合を取得する
+        
+        Returns:
+            float: 0.0〜1.0 の進捗
+        """
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+    
+    @property
+    def done(self):
+        """
+        すべての画像の先読みが完了したかどうかを取得する
+        
+        Returns:
+            bool: 完了したかどうか
+        """
+        return self.completed >= self.total
+
+
+def scale_image(image, scale, keep_aspect_ratio=True):
+    """
+    画像を指定サイズにリサイズする
+    
+    実行時の読み込みと事前ベイクで同じ結果になるように、リサイズ処理はこの関数に集約する。
+    
+    Args:
+        image (pygame.Surface): 元の画像
+        scale (tuple): 画像のスケール (width, height)
+        keep_aspect_ratio (bool): アスペクト比を維持するかどうか
+        
+    Returns:
+        pygame.Surface: リサイズした画像
+    """
+    if not keep_aspect_ratio:
+        # アスペクト比を無視してリサイズ
+        return pygame.transform.scale(image, scale)
+    
+    # アスペクト比を維持してリサイズ
+    original_width, original_height = image.get_size()
+    target_width, target_height = scale
+    
+    # 縦横比を計算
+    width_ratio = target_width / original_width
+    height_ratio = target_height / original_height
+    
+    # 小さい方の比率を使用してアスペクト比を維持
+    ratio = min(width_ratio, height_ratio)
+    
+    new_width = int(original_width * ratio)
+    new_height = int(original_height * ratio)
+    
+    # リサイズした画像を作成
+    resized_image = pygame.transform.scale(image, (new_width, new_height))
+    
+    # 指定サイズの透明な画像を作成
+    final_image = pygame.Surface(scale, pygame.SRCALPHA)
+    
+    # 中央に配置
+    x_offset = (target_width - new_width) // 2
+    y_offset = (target_height - new_height) // 2
+    
+    final_image.blit(resized_image, (x_offset, y_offset))
+    return final_image
+
+
+def has_transparency(image):
+    """
+    画像に透明または半透明のピクセルがあるかどうかを確認する
+    
+    Args:
+        image (pygame.Surface): 画像
+        
+    Returns:
+        bool: アルファ値が 255 未満のピクセルがあるか、カラーキーが設定されている場合は True
+    """
+    if image.get_colorkey() is not None:
+        return True
+    if not image.get_flags() & pygame.SRCALPHA:
+        return False
+    
+    # アルファ値が 255 のピクセルだけを数える
+    width, height = image.get_size()
+    return pygame.mask.from_surface(image, 254).count() < width * height
+
+
+def convert_for_display(image):
+    """
+    画像を表示フォーマットに変換する
+    
+    不透明な画像はアルファ値を持たない形式に変換し、ピクセルごとの合成をせずに描画できるようにする。
+    透明な部分がある画像は RLE で圧縮し、透明なピクセルを描画時に読み飛ばせるようにする。
+    （アトラスのように一部の領域だけを描画する画像は RLE だとかえって遅くなるため、ここでは扱わない）
+    
+    Args:
+        image (pygame.Surface): デコードした画像
+        
+    Returns:
+        pygame.Surface: 変換した画像
+    """
+    if not has_transparency(image):
+        return image.convert()
+    
+    image = image.convert_alpha()
+    image.set_alpha(255, pygame.RLEACCEL)
+    return image
+
+
+def get_image_category(path, scale):
+    """
+    画像の種類（メモリ計測の集計に使う）を求める
+    
+    背景画像は画面より小さいサイズで読み込んだ場合はサムネイルとする。
+    
+    Args:
+        path (str): 画像ファイルのパス（assets/images/からの相対パス）、またはパスで始まるキャッシュキー
+        scale (tuple): 画像のスケール (width, height)
+    
+    Returns:
+        str: 画像の種類（CATEGORY_BACKGROUNDS など）
+    """
+    if path.startswith("backgrounds"):
+        display = pygame.display.get_surface()
+        if scale and display is not None and scale[0] < display.get_width():
+            return CATEGORY_THUMBNAILS
+        return CATEGORY_BACKGROUNDS
+    if path.startswith("characters"):
+        return CATEGORY_CARD_FACES
+    if path.startswith("card_backs"):
+        return CATEGORY_CARD_BACKS
+    return CATEGORY_OTHER
+
+
+def apply_effect(image, effect):
+    """
+    画像に効果をかけた新しい画像を作成する
+    
+    Args:
+        image (pygame.Surface): 元の画像
+        effect (str): 効果の種類（ResourceLoader.EFFECT_FADED など）
+        
+    Returns:
+        pygame.Surface: 効果をかけた画像
+    """
+    if effect == ResourceLoader.EFFECT_FADED:
+        # アルファ値を半分にする
+        faded_image = image.convert_alpha()
+        faded_image.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+        return faded_image
+    
+    if effect == ResourceLoader.EFFECT_GREYED:
+        return pygame.transform.grayscale(image)
+    
+    if effect == ResourceLoader.EFFECT_HIGHLIGHTED:
+        # 少し明るくする
+        highlighted_image = image.copy()
+        highlighted_image.fill((60, 60, 60), special_flags=pygame.BLEND_RGB_ADD)
+        return highlighted_image
+    
+    raise ValueError(f"不明な効果です: {effect}")
+
+
+def normalize_asset_path(path):
+    """
+    マニフェストのキーとして使うために画像パスの区切り文字を揃える
+    
+    Args:
+        path (str): 画像ファイルのパス（assets/images/からの相対パス）
+        
+    Returns:
+        str: "/" 区切りのパス
+    """
+    return path.replace(os.sep, "/")
+
+
+def compute_file_hash(file_path):
+    """
+    ファイルの内容からハッシュを計算する
+    
+    Args:
+        file_path (str): ファイルのパス
+        
+    Returns:
+        str: SHA-1 ハッシュ（16進数）、または読み込めない場合は None
+    """
+    sha1 = hashlib.sha1()
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                sha1.update(chunk)
+    except IOError:
+        return None
+    return sha1.hexdigest()
+
+
+def get_file_stamp(file_path):
+    """
+    ファイルの更新日時とサイズを取得する（ベイク済み画像が古くなっていないかの確認に使う）
+    
+    Args:
+        file_path (str): ファイルのパス
+        
+    Returns:
+        tuple: (更新日時（ナノ秒）, バイト数)、またはファイルがない場合は None
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+保存処理の管理モジュール
+
+設定やゲームの進み具合の書き込みをファイルごとに最新の内容だけにまとめ、
+最後の書き込みから一定時間たつか、画面の切り替えなどで flush されたときにワーカースレッドで保存する。
+保存は一時ファイルに書き込んでから置き換えるため、途中でアプリが終了しても壊れたファイルは残らない。
+
+Emscripten環境ではスレッドが使えないため、メインループから呼び出す poll と flush で保存する。
+"""
+
+import os
+import json
+import time
+import platform
+import threading
+
+def write_file_atomic(path, text):
+    """
+    一時ファイルに書き込んでから置き換えることで、ファイルを原子的に書き込む
+    
+    Args:
+        path (str): 書き込むファイルのパス
+        text (str): 書き込む内容
+    
+    Returns:
+        bool: 書き込めた場合は True
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            # 置き換えた後に中身が失われないよう、ディスクへの書き込みを待つ
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        return True
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+
+
+class SaveManager:
+    """書き込みをまとめてバックグラウンドでファイルに保存するクラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    # 最後の書き込みから保存するまでの時間（秒）
+    DEBOUNCE_SECONDS = 1.0
+    
+    # 終了時に保存の完了を待つ最大時間（秒）
+    SHUTDOWN_TIMEOUT_SECONDS = 5.0
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            SaveManager: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = SaveManager()
+        return cls._instance
+    
+    def __init__(self):
+        """保存処理を初期化する（ワーカースレッドは最初の書き込みで開始する）"""
+        # ファイルのパス → 保存する内容（JSON の文字列）。同じファイルへの書き込みは最新の内容だけを残す
+        self.pending = {}
+        self.last_scheduled_at = 0.0
+        
+        # 保存をすぐに行うよう要求されているかどうか、ワーカースレッドが書き込み中かどうか
+        self.flush_requested = False
+        self.writing = False
+        self.stopping = False
+        
+        self.condition = threading.Condition()
+        self.thread = None
+        
+        # Emscripten環境ではメインスレッドで保存する
+        self.use_thread = platform.system() != "Emscripten"
+    
+    def schedule(self, path, data):
+        """
+        ファイルの保存を予約する
+        
+        内容はこの時点で JSON の文字列にするため、呼び出し後に data を変更しても保存する内容は変わらない。
+        
+        Args:
+            path (str): 保存するファイルのパス
+            data: 保存する内容（JSON に変換できる値）
+        """
+        text = json.dumps(data, indent=4, ensure_ascii=False)
+        with self.condition:
+            self.pending[path] = text
+            self.last_scheduled_at = time.monotonic()
+            if self.use_thread:
+                self._start_thread()
+                self.condition.notify_all()
+    
+    def flush(self, wait=False):
+        """
+        予約された保存を待ち時間なしで行う
+        
+        画面の切り替えなど、少しの遅れが目立たないときに呼び出す。
+        
+        Args:
+            wait (bool): 保存が終わるまで待つかどうか（終了時に使う）
+        """
+        if not self.use_thread:
+            self._write_pending()
+            return
+        
+        with self.condition:
+            if not self.pending:
+                return
+            self.flush_requested = True
+            self.condition.notify_all()
+            if wait:
+                deadline = time.monotonic() + self.SHUTDOWN_TIMEOUT_SECONDS
+                while (self.pending or self.writing) and time.monotonic() < deadline:
+                    self.condition.wait(deadline - time.monotonic())
+    
+    def poll(self):
+        """
+        最後の書き込みから DEBOUNCE_SECONDS たっていれば保存する（Emscripten環境用）
+        
+        メインループから毎フレーム呼び出す。ワーカースレッドを使う環境では何もしない。
+        """
+        if self.use_thread or not self.pending:
+            return
+        if time.monotonic() - self.last_scheduled_at >= self.DEBOUNCE_SECONDS:
+            self._write_pending()
+    
+    def has_pending(self):
+        """
+        保存していない書き込みがあるかどうかを確認する
+        
+        Returns:
+            bool: 予約されている保存か書き込み中の保存がある場合は True
+        """
+        with self.condition:
+            return bool(self.pending) or self.writing
+    
+    def shutdown(self):
+        """予約された保存をすべて行い、ワーカースレッドを停止する"""
+        self.flush(wait=True)
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(self.SHUTDOWN_TIMEOUT_SECONDS)
+            self.thread = None
+    
+    def _start_thread(self):
+        """ワーカースレッドを開始する（呼び出し側で condition のロックを取っておく）"""
+        if self.thread is not None or self.stopping:
+            return
+        self.thread = threading.Thread(target=self._run, name="save", daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        """ワーカースレッドの処理（書き込みが落ち着くか flush されるまで待ってから保存する）"""
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                
+                # 書き込みが続いている間は待って、まとめて保存する
+                while not self.flush_requested and not self.stopping:
+                    remaining = self.last_scheduled_at + self.DEBOUNCE_SECONDS - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                
+                writes = self.pending
+                self.pending = {}
+                self.flush_requested = False
+                self.writing = True
+            
+            self._write_files(writes)
+            
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+    
+    def _write_pending(self):
+        """予約された保存をメインスレッドで行う"""
+        writes = self.pending
+        self.pending = {}
+        self._write_files(writes)
+    
+    def _write_files(self, writes):
+        """
+        ファイルを書き込む
+        
+        Args:
+            writes (dict): ファイルのパス → 保存する内容
+        """
+        for path, text in writes.items():
+            if not write_file_atomic(path, text):
+                print(f"ファイルの保存に失敗しました: {path}")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+起動時間の計測モジュール
+
+起動処理を段階ごとに計測し、起動中に読み込んだモジュールの読み込み時間も記録する。
+起動時間を計測するため、このモジュールは標準ライブラリ以外を読み込まない。
+"""
+
+import sys
+import json
+import time
+import builtins
+
+class StartupReport:
+    """起動時間を段階とモジュールごとに計測するクラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            StartupReport: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = StartupReport()
+        return cls._instance
+    
+    def __init__(self):
+        """起動時間の計測を初期化する"""
+        self.started_at = time.perf_counter()
+        self.phase_started_at = self.started_at
+        
+        # (段階名, ミリ秒) のリスト
+        self.phases = []
+        
+        # モジュール名 → (読み込み時間, 読み込み中に読み込んだ他のモジュールを除いた時間)（ミリ秒）
+        self.imports = {}
+        
+        # 読み込み中のモジュールの (子モジュールの合計時間) のスタック
+        self.import_stack = []
+        self.original_import = None
+        self.finished = False
+    
+    def start_import_tracking(self):
+        """モジュールの読み込み時間の計測を開始する"""
+        if self.original_import is not None:
+            return
+        self.original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+    
+    def stop_import_tracking(self):
+        """モジュールの読み込み時間の計測を終了する"""
+        if self.original_import is None:
+            return
+        builtins.__import__ = self.original_import
+        self.original_import = None
+    
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        初めて読み込まれるモジュールの読み込み時間を計測する __import__
+        
+        Args:
+            name (str): モジュール名
+            globals (dict, optional): 呼び出し元のグローバル変数
+            locals (dict, optional): 呼び出し元のローカル変数
+            fromlist (tuple): from ... import で読み込む名前
+            level (int): 相対インポートの階層
+        
+        Returns:
+            module: 読み込んだモジュール
+        """
+        original_import = self.original_import
+        if level != 0 or name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)
+        
+        self.import_stack.append(0.0)
+        started_at = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - started_at) * 1000
+            children = self.import_stack.pop()
+            if self.import_stack:
+                self.import_stack[-1] += elapsed
+            if name not in self.imports:
+                self.imports[name] = (elapsed, elapsed - children)
+    
+    def mark(self, phase):
+        """
+        直前の区切りからの経過時間を段階の時間として記録する
+        
+        Args:
+            phase (str): 段階名
+        """
+        if self.finished:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.phase_started_at) * 1000))
+        self.phase_started_at = now
+    
+    def finish(self, phase):
+        """
+        最後の段階を記録して計測を終了する
+        
+        Args:
+            phase (str): 最後の段階名
+        """
+        if self.finished:
+            return
+        self.mark(phase)
+        self.stop_import_tracking()
+        self.finished = True
+    
+    def get_report(self, top_imports=15):
+        """
+        計測結果を取得する
+        
+        Args:
+            top_imports (int): 読み込み時間が長い順に含めるモジュールの数
+        
+        Returns:
+            dict: 合計時間・段階ごとの時間・モジュールごとの読み込み時間
+        """
+        total_ms = sum(elapsed for _, elapsed in self.phases)
+        imports = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            "total_ms": round(total_ms, 3),
+            "phases": [{"name": name, "ms": round(elapsed, 3)} for name, elapsed in self.phases],
+            "imports": [
+                {"module": name, "ms": round(elapsed, 3), "self_ms": round(self_elapsed, 3)}
+                for name, (elapsed, self_elapsed) in imports[:top_imports]
+            ]
+        }
+    
+    def print_report(self):
+        """計測結果を表示する"""
+        report = self.get_report()
+        print(f"起動時間: {report['total_ms']:.1f} ms")
+        for phase in report["phases"]:
+            print(f"  {phase['name']:<24} {phase['ms']:8.1f} ms")
+        print("モジュールの読み込み時間（合計 / 単体）:")
+        for module in report["imports"]:
+            print(f"  {module['module']:<24} {module['ms']:8.1f} ms {module['self_ms']:8.1f} ms")
+    
+    def save_report(self, output_file):
+        """
+        計測結果を JSON ファイルに書き出す
+        
+        Args:
+            output_file (str): 書き出すファイルのパス
+        """
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(self.get_report(), f, indent=2, ensure_ascii=False)
+        except IOError:
+            print(f"起動時間の計測結果の保存に失敗しました: {output_file}")
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+サーフェスキャッシュモジュール
+"""
+
+import time
+from collections import OrderedDict
+
+def get_surface_bytes(surface):
+    """
+    サーフェスが使用するピクセルデータのバイト数を取得する
+    
+    Args:
+        surface (pygame.Surface): 対象のサーフェス
+    
+    Returns:
+        int: バイト数
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """メモリ予算付きで最近使われていないサーフェスから破棄するキャッシュクラス"""
+    
+    def __init__(self, budget_bytes, max_idle_seconds=None, on_remove=None):
+        """
+        キャッシュを初期化する
+        
+        Args:
+            budget_bytes (int): キャッシュに保持するサーフェスの合計バイト数の上限
+            max_idle_seconds (float, optional): この秒数使われなかったサーフェスを expire で破棄する
+            on_remove (callable, optional): サーフェスを取り除いたときに (キー, サーフェス) で呼び出す関数
+        """
+        self.budget_bytes = budget_bytes
+        self.max_idle_seconds = max_idle_seconds
+        self.on_remove = on_remove
+        
+        # キー → (サーフェス, バイト数, 最終使用時刻)（先頭ほど長く使われていない）
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        
+        # 派生サーフェス（キー → {名前: サーフェス}）。親と一緒に破棄する
+        self.derived = {}
+        
+        # ピン留め（キー → 所有者の集合、所有者 → キーの集合）
+        self.pins = {}
+        self.owner_pins = {}
+        
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __contains__(self, key):
+        """
+        キーがキャッシュにあるかどうかを確認する（統計と使用順には影響しない）
+        
+        Args:
+            key: キャッシュキー
+        
+        Returns:
+            bool: キャッシュにあるかどうか
+        """
+        return key in self.entries
+    
+    def __len__(self):
+        """
+        キャッシュされているサーフェスの数を取得する
+        
+        Returns:
+            int: サーフェスの数
+        """
+        return len(self.entries)
+    
+    def get(self, key):
+        """
+        サーフェスを取得する
+        
+        Args:
+            key: キャッシュキー
+        
+        Returns:
+            pygame.Surface: キャッシュされたサーフェス、または None
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.entries[key] = (entry[0], entry[1], time.monotonic())
+        self.entries.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key, surface, owner=None, size=None):
+        """
+        サーフェスをキャッシュに保存する
+        
+        Args:
+            key: キャッシュキー
+            surface: 保存するサーフェス（またはサーフェスをまとめたオブジェクト）
+            owner (optional): 保存と同時にピン留めする所有者
+            size (int, optional): バイト数（サーフェス以外を保存する場合に指定する）
+        """
+        if key in self.entries:
+            self._remove(key)
+        
+        if size is None:
+            size = get_surface_bytes(surface)
+        self.entries[key] = (surface, size, time.monotonic())
+        self.total_bytes += size
+        
+        if owner is not None:
+            self.pin(key, owner)
+        
+        self._evict()
+    
+    def get_derived(self, key, name):
+        """
+        派生サーフェスを取得する
+        
+        Args:
+            key: 親のキャッシュキー
+            name: 派生サーフェスの名前
+            
+        Returns:
+            pygame.Surface: 派生サーフェス、または None
+        """
+        derived = self.derived.get(key)
+        if derived is None:
+            return None
+        return derived.get(name)
+    
+    def put_derived(self, key, name, surface, size=None):
+        """
+        派生サーフェスを保存する
+        
+        派生サーフェスのバイト数は親に加算され、親と一緒に破棄される。
+        
+        Args:
+            key: 親のキャッシュキー
+            name: 派生サーフェスの名前
+            surface (pygame.Surface): 保存する派生サーフェス
+            size (int, optional): バイト数（サブサーフェスなどメモリを共有する場合は 0 を指定する）
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return
+        
+        if size is None:
+            size = get_surface_bytes(surface)
+        self.derived.setdefault(key, {})[name] = surface
+        self.entries[key] = (entry[0], entry[1] + size, entry[2])
+        self.total_bytes += size
+        
+        self._evict()
+    
+    def pin(self, key, owner):
+        """
+        サーフェスをピン留めして破棄されないようにする
+        
+        Args:
+            key: キャッシュキー
+            owner: ピン留めする所有者（画面など）
+        """
+        if key not in self.entries:
+            return
+        self.pins.setdefault(key, set()).add(owner)
+        self.owner_pins.setdefault(owner, set()).add(key)
+    
+    def release(self, owner):
+        """
+        所有者のピン留めをすべて解除する
+        
+        Args:
+            owner: ピン留めした所有者（画面など）
+        """
+        for key in self.owner_pins.pop(owner, set()):
+            owners = self.pins.get(key)
+            if owners:
+                owners.discard(owner)
+                if not owners:
+                    del self.pins[key]
+        
+        # ピン留めが外れたことで予算を超えていれば破棄する
+        self._evict()
+    
+    def discard(self, key):
+        """
+        ピン留めされていないサーフェスをキャッシュから取り除く（破棄数には数えない）
+        
+        Args:
+            key: キャッシュキー
+        
+        Returns:
+            bool: 取り除いた場合は True
+        """
+        if key not in self.entries or key in self.pins:
+            return False
+        self._remove(key)
+        return True
+    
+    def set_budget(self, budget_bytes):
+        """
+        メモリ予算を変更する
+        
+        Args:
+            budget_bytes (int): キャッシュに保持するサーフェスの合計バイト数の上限
+        """
+        self.budget_bytes = budget_bytes
+        self._evict()
+    
+    def expire(self):
+        """一定時間使われていないピン留めされていないサーフェスを破棄する"""
+        if self.max_idle_seconds is None:
+            return
+        
+        deadline = time.monotonic() - self.max_idle_seconds
+        for key, (_, _, last_used) in list(self.entries.items()):
+            # 使用順に並んでいるため、期限内のものが見つかれば以降も期限内
+            if last_used > deadline:
+                break
+            if key in self.pins:
+                continue
+            self._remove(key)
+            self.evictions += 1
+    
+    def clear(self):
+        """キャッシュを空にする（ピン留めも解除する）"""
+        if self.on_remove:
+            for key, (surface, _, _) in self.entries.items():
+                self.on_remove(key, surface)
+        self.entries.clear()
+        self.derived.clear()
+        self.total_bytes = 0
+        self.pins.clear()
+        self.owner_pins.clear()
+    
+    def get_stats(self):
+        """
+        統計情報を取得する
+        
+        Returns:
+            dict: ヒット数・ミス数・破棄数・使用バイト数など
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "pinned": len(self.pins),
+            "bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes
+        }
+    
+    def _remove(self, key):
+        """
+        サーフェスをキャッシュから取り除く
+        
+        Args:
+            key: キャッシュキー
+        """
+        surface, size, _ = self.entries.pop(key)
+        self.derived.pop(key, None)
+        self.total_bytes -= size
+        
+        if self.on_remove:
+            self.on_remove(key, surface)
+    
+    def _evict(self):
+        """予算を超えている間、ピン留めされていない古いサーフェスから破棄する"""
+        if self.total_bytes <= self.budget_bytes:
+            return
+        
+        for key in list(self.entries):
+            if self.total_bytes <= self.budget_bytes:
+                break
+            if key in self.pins:
+                continue
+            self._remove(key)
+            self.evictions += 1
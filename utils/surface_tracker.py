@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+サーフェスのメモリ使用量の計測モジュール
+
+ResourceLoader・FontManager・画面が作成したサーフェスを弱参照で記録し、
+種類ごと・所有する画面ごとの使用中のバイト数と最大のバイト数を集計する。
+画面の切り替えの前後でスナップショットを比べ、いなくなった画面のサーフェスが残っていれば報告する。
+Python 側のメモリ確保は tracemalloc で計測する。
+
+計測は設定 surface_tracking が有効な場合だけ行い、無効な場合の記録の呼び出しは何もしない。
+"""
+
+import gc
+import json
+import threading
+import tracemalloc
+import weakref
+from utils.surface_cache import get_surface_bytes
+
+# サーフェスの種類
+CATEGORY_BACKGROUNDS = "backgrounds"
+CATEGORY_CARD_FACES = "card_faces"
+CATEGORY_CARD_BACKS = "card_backs"
+CATEGORY_CARD_ATLASES = "card_atlases"
+CATEGORY_THUMBNAILS = "thumbnails"
+CATEGORY_TEXT = "text"
+CATEGORY_BUTTONS = "buttons"
+CATEGORY_OVERLAYS = "overlays"
+CATEGORY_OTHER = "other"
+
+# 画面の切り替えごとに表示する Python 側のメモリ確保の増加の件数
+TRACEMALLOC_TOP_STATS = 5
+
+def track_surface(surface, category, owner=None, cached=False):
+    """
+    サーフェスを記録する（計測が無効な場合は何もしない）
+    
+    Args:
+        surface (pygame.Surface): 記録するサーフェス
+        category (str): サーフェスの種類（CATEGORY_BACKGROUNDS など）
+        owner (optional): 所有者（画面など）。省略時は現在の画面
+        cached (bool): キャッシュが保持していて、画面がいなくなっても残ることがあるかどうか
+    """
+    tracker = SurfaceTracker.get_instance()
+    if tracker.enabled:
+        tracker.track(surface, category, owner, cached)
+
+
+class SurfaceTracker:
+    """サーフェスのメモリ使用量を種類ごと・所有者ごとに集計するクラス"""
+    
+    # シングルトンインスタンス
+    _instance = None
+    
+    @classmethod
+    def get_instance(cls):
+        """
+        シングルトンインスタンスを取得する
+        
+        Returns:
+            SurfaceTracker: シングルトンインスタンス
+        """
+        if cls._instance is None:
+            cls._instance = SurfaceTracker()
+        return cls._instance
+    
+    def __init__(self):
+        """計測を初期化する（start を呼ぶまでは記録しない）"""
+        self.enabled = False
+        
+        # サーフェスの id → (弱参照, 種類, 所有者名, バイト数, キャッシュが保持しているか)
+        # サーフェスが解放されると弱参照のコールバックで取り除く
+        self.entries = {}
+        self.lock = threading.RLock()
+        
+        # 所有者を指定せずに記録したサーフェスの所有者名（ScreenManager が現在の画面を設定する）
+        # 最初の画面を作るまでに作成したものはメインループ（Game）のものとする
+        self.current_owner = "Game"
+        
+        # 使用中と最大のバイト数（全体・種類ごと・所有者ごと）
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self.category_bytes = {}
+        self.category_peak_bytes = {}
+        self.owner_bytes = {}
+        self.owner_peak_bytes = {}
+        
+        # 画面の切り替えごとの報告
+        self.transitions = []
+    
+    def start(self, trace_python=False):
+        """
+        記録を開始する
+        
+        Args:
+            trace_python (bool): tracemalloc で Python 側のメモリ確保も計測するかどうか
+        """
+        self.enabled = True
+        if trace_python and not tracemalloc.is_tracing():
+            tracemalloc.start()
+    
+    def set_current_owner(self, owner_name):
+        """
+        所有者を指定せずに記録したサーフェスの所有者名を設定する
+        
+        Args:
+            owner_name (str): 所有者名（画面クラス名）
+        """
+        self.current_owner = owner_name
+    
+    def track(self, surface, category, owner=None, cached=False):
+        """
+        サーフェスを記録する
+        
+        すでに記録しているサーフェスの場合、所有者を指定していれば所有者だけを付け替える。
+        
+        Args:
+            surface (pygame.Surface): 記録するサーフェス
+            category (str): サーフェスの種類
+            owner (optional): 所有者（画面など）。省略時は現在の画面
+            cached (bool): キャッシュが保持しているかどうか
+        """
+        owner_name = type(owner).__name__ if owner is not None else self.current_owner
+        key = id(surface)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0]() is surface:
+                if owner is not None and entry[2] != owner_name:
+                    self._remove_entry(key)
+                    self._add_entry(key, entry[0], entry[1], owner_name, entry[3], entry[4])
+                return
+            
+            ref = weakref.ref(surface, lambda ref, key=key: self._forget(key, ref))
+            self._add_entry(key, ref, category, owner_name, get_surface_bytes(surface), cached)
+    
+    def set_owner(self, surface, owner):
+        """
+        記録しているサーフェスの所有者を付け替える（キャッシュ済みの画像を別の画面が使う場合など）
+        
+        Args:
+            surface (pygame.Surface): 記録しているサーフェス
+            owner: 新しい所有者
+        """
+        if self.enabled and id(surface) in self.entries:
+            self.track(surface, CATEGORY_OTHER, owner)
+    
+    def get_category(self, surface):
+        """
+        記録しているサーフェスの種類を取得する
+        
+        Args:
+            surface (pygame.Surface): サーフェス
+        
+        Returns:
+            str: 種類、または記録していない場合は None
+        """
+        entry = self.entries.get(id(surface))
+        if entry is None or entry[0]() is not surface:
+            return None
+        return entry[1]
+    
+    def _add_entry(self, key, ref, category, owner_name, size, cached):
+        """記録を追加して使用中と最大のバイト数を更新する"""
+        self.entries[key] = (ref, category, owner_name, size, cached)
+        self.live_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+        self._add_bytes(self.category_bytes, self.category_peak_bytes, category, size)
+        self._add_bytes(self.owner_bytes, self.owner_peak_bytes, owner_name, size)
+    
+    def _remove_entry(self, key):
+        """記録を取り除いて使用中のバイト数を減らす"""
+        _, category, owner_name, size, _ = self.entries.pop(key)
+        self.live_bytes -= size
+        self._add_bytes(self.category_bytes, None, category, -size)
+        self._add_bytes(self.owner_bytes, None, owner_name, -size)
+    
+    def _add_bytes(self, live, peak, name, size):
+        """集計の使用中のバイト数を増減し、最大のバイト数を更新する"""
+        live[name] = live.get(name, 0) + size
+        if peak is not None:
+            peak[name] = max(peak.get(name, 0), live[name])
+    
+    def _forget(self, key, ref):
+        """
+        解放されたサーフェスの記録を取り除く（弱参照のコールバック）
+        
+        Args:
+            key (int): サーフェスの id
+            ref (weakref.ref): 解放されたサーフェスの弱参照
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            # 同じ id で別のサーフェスを記録し直している場合は取り除かない
+            if entry is not None and entry[0] is ref:
+                self._remove_entry(key)
+    
+    def take_snapshot(self):
+        """
+        現在記録しているサーフェスのスナップショットを取得する
+        
+        Returns:
+            dict: サーフェスの一覧（entries）と tracemalloc のスナップショット（python）
+        """
+        with self.lock:
+            entries = dict(self.entries)
+        python_snapshot = self._take_python_snapshot() if tracemalloc.is_tracing() else None
+        return {"entries": entries, "python": python_snapshot}
+    
+    def _take_python_snapshot(self):
+        """
+        tracemalloc のスナップショットを取得する（tracemalloc 自身の確保は除く）
+        
+        Returns:
+            tracemalloc.Snapshot: スナップショット
+        """
+        return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+    
+    def check_transition(self, snapshot, description, departed_owners):
+        """
+        画面の切り替えの前のスナップショットと比べ、いなくなった画面のサーフェスが残っていれば報告する
+        
+        キャッシュが保持しているサーフェスは予算に応じて後で破棄されるため、残っているものとは分けて数える。
+        
+        Args:
+            snapshot (dict): 切り替えの前に take_snapshot で取得したスナップショット
+            description (str): 切り替えの説明（"MainMenu → EnvironmentSelectScreen" など）
+            departed_owners (set): 切り替えでいなくなった画面のクラス名
+        
+        Returns:
+            dict: 切り替えの報告
+        """
+        # 循環参照で残っているだけのサーフェスは解放してから比べる
+        gc.collect()
+        
+        survivors = []
+        cached_bytes = 0
+        with self.lock:
+            for key, (ref, category, owner_name, size, cached) in snapshot["entries"].items():
+                if owner_name not in departed_owners or ref() is None:
+                    continue
+                current = self.entries.get(key)
+                if current is None or current[0] is not ref or current[2] != owner_name:
+                    continue
+                if cached:
+                    cached_bytes += size
+                else:
+                    survivors.append({"category": category, "owner": owner_name, "bytes": size})
+        
+        report = {
+            "transition": description,
+            "live_bytes": self.live_bytes,
+            "surviving_bytes": sum(survivor["bytes"] for survivor in survivors),
+            "surviving": survivors,
+            "cached_bytes": cached_bytes
+        }
+        if snapshot["python"] is not None and tracemalloc.is_tracing():
+            stats = self._take_python_snapshot().compare_to(snapshot["python"], "lineno")
+            report["python_top"] = [str(stat) for stat in stats[:TRACEMALLOC_TOP_STATS]]
+        
+        self.transitions.append(report)
+        if survivors:
+            print(f"画面の切り替え後もサーフェスが残っています（{description}）: "
+                  f"{len(survivors)} 個 {report['surviving_bytes'] / 1024:.1f} KB")
+        return report
+    
+    def get_report(self):
+        """
+        集計結果を取得する
+        
+        Returns:
+            dict: 使用中と最大のバイト数（全体・種類ごと・所有者ごと）と画面の切り替えごとの報告
+        """
+        with self.lock:
+            report = {
+                "live_bytes": self.live_bytes,
+                "peak_bytes": self.peak_bytes,
+                "surfaces": len(self.entries),
+                "categories": {
+                    name: {"live_bytes": self.category_bytes[name], "peak_bytes": self.category_peak_bytes[name]}
+                    for name in sorted(self.category_bytes)
+                },
+                "owners": {
+                    str(name): {"live_bytes": self.owner_bytes[name], "peak_bytes": self.owner_peak_bytes[name]}
+                    for name in sorted(self.owner_bytes, key=str)
+                },
+                "transitions": list(self.transitions)
+            }
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            report["python"] = {"live_bytes": current, "peak_bytes": peak}
+        return report
+    
+    def print_report(self):
+        """集計結果を表示する"""
+        report = self.get_report()
+        print(f"サーフェスのメモリ: 使用中 {report['live_bytes'] / 1024:.1f} KB / "
+              f"最大 {report['peak_bytes'] / 1024:.1f} KB（{report['surfaces']} 個）")
+        for title, key in (("種類ごと", "categories"), ("所有者ごと", "owners")):
+            print(f"{title}（使用中 / 最大）:")
+            for name, values in report[key].items():
+                print(f"  {name:<28} {values['live_bytes'] / 1024:10.1f} KB {values['peak_bytes'] / 1024:10.1f} KB")
+        if "python" in report:
+            print(f"Python のメモリ: 使用中 {report['python']['live_bytes'] / 1024:.1f} KB / "
+                  f"最大 {report['python']['peak_bytes'] / 1024:.1f} KB")
+    
+    def save_report(self, output_file):
+        """
+        集計結果を JSON ファイルに書き出す
+        
+        Args:
+            output_file (str): 書き出すファイルのパス
+        """
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(self.get_report(), f, indent=2, ensure_ascii=False)
+        except IOError:
+            print(f"サーフェスのメモリの計測結果の保存に失敗しました: {output_file}")
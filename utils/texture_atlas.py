@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+テクスチャアトラスモジュール
+"""
+
+import pygame
+from utils.surface_cache import get_surface_bytes
+
+class TextureAtlas:
+    """同じサイズの画像を1枚のサーフェスにまとめるクラス"""
+    
+    # アトラスの最大幅（ピクセル）
+    MAX_WIDTH = 2048
+    
+    def __init__(self, cell_size, count):
+        """
+        テクスチャアトラスを初期化する
+        
+        Args:
+            cell_size (tuple): 1つの画像のサイズ (width, height)
+            count (int): まとめる画像の数
+        """
+        self.cell_size = cell_size
+        cell_width, cell_height = cell_size
+        
+        # 格子状に並べる
+        self.cols = max(1, min(count, self.MAX_WIDTH // cell_width))
+        self.rows = max(1, -(-count // self.cols))
+        
+        self.surface = pygame.Surface(
+            (self.cols * cell_width, self.rows * cell_height),
+            pygame.SRCALPHA
+        ).convert_alpha()
+        
+        # キー → アトラス内の領域
+        self.regions = {}
+        
+        # キー → (透明な余白を除いたアトラス内の領域, 領域の左上からのずれ)
+        self.trimmed_regions = {}
+    
+    def add(self, key, image):
+        """
+        画像をアトラスに追加する
+        
+        Args:
+            key: 画像のキー
+            image (pygame.Surface): 追加する画像（cell_size と同じサイズ）
+        
+        Returns:
+            pygame.Rect: アトラス内の領域
+        """
+        if key in self.regions:
+            return self.regions[key]
+        
+        index = len(self.regions)
+        if index >= self.cols * self.rows:
+            raise ValueError(f"アトラスに空きがありません: {key}")
+        
+        cell_width, cell_height = self.cell_size
+        area = pygame.Rect(
+            (index % self.cols) * cell_width,
+            (index // self.cols) * cell_height,
+            cell_width,
+            cell_height
+        )
+        self.surface.blit(image, area, special_flags=pygame.BLEND_RGBA_MAX)
+        self.regions[key] = area
+        
+        # 縦横比を保って縮小した画像の上下左右にできる透明な余白は描画しない
+        bounds = image.get_bounding_rect()
+        self.trimmed_regions[key] = (bounds.move(area.topleft), bounds.topleft)
+        return area
+    
+    def get_area(self, key):
+        """
+        アトラス内の領域を取得する
+        
+        Args:
+            key: 画像のキー
+        
+        Returns:
+            pygame.Rect: アトラス内の領域、または None
+        """
+        return self.regions.get(key)
+    
+    def get_trimmed_area(self, key):
+        """
+        透明な余白を除いたアトラス内の領域を取得する
+        
+        描画先は、画像を置く位置を offset だけずらした位置になる。
+        
+        Args:
+            key: 画像のキー
+        
+        Returns:
+            tuple: (アトラス内の領域, 画像の左上からのずれ (x, y))
+        """
+        return self.trimmed_regions[key]
+    
+    def get_subsurface(self, key):
+        """
+        アトラス内の領域を参照するサブサーフェスを取得する
+        
+        Args:
+            key: 画像のキー
+        
+        Returns:
+            pygame.Surface: サブサーフェス
+        """
+        return self.surface.subsurface(self.regions[key])
+    
+    def get_bytes(self):
+        """
+        アトラスが使用するピクセルデータのバイト数を取得する
+        
+        Returns:
+            int: バイト数
+        """
+        return get_surface_bytes(self.surface)